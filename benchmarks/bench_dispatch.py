@@ -0,0 +1,56 @@
+"""
+Micro-benchmark for IPCMain dispatch overhead
+
+Measures the per-call cost of the Python side of an IPC message with a
+trivial handler, so the numbers are dominated by framework overhead.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--quick] [--json]
+"""
+
+from common import StubWindow, main, ns_per_call, result
+
+from positron.ipc.main import IPCEvent, IPCMain
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Run the dispatch benchmarks.
+
+    Returns:
+        Mapping of benchmark name -> result (nanoseconds per call)
+    """
+    number, repeat = (20_000, 3) if quick else (200_000, 5)
+
+    ipc = IPCMain()
+    window = StubWindow()
+    api = ipc.get_js_api(window)
+
+    ipc.handle("bench:handle", lambda event, value: value)
+    ipc.on("bench:on", lambda event, value: None)
+    ipc.handle("bench:wild:*", lambda event, value: value)
+
+    cases = {
+        "event_create": lambda: IPCEvent(window),
+        "dispatch_handle": lambda: ipc._dispatch("bench:handle", window, 1),
+        "dispatch_on": lambda: ipc._dispatch("bench:on", window, 1),
+        "dispatch_wildcard": lambda: ipc._dispatch("bench:wild:a:b", window, 1),
+        "js_api_send": lambda: api.ipc_send("bench:on", [1]),
+        "js_api_invoke": lambda: api.ipc_invoke("bench:handle", [1]),
+    }
+
+    results = {
+        name: result(ns_per_call(func, number, repeat), "ns/call")
+        for name, func in cases.items()
+    }
+
+    # Same dispatch with metrics collection on, to keep its overhead visible
+    ipc.enable_metrics()
+    results["dispatch_handle_metrics"] = result(
+        ns_per_call(cases["dispatch_handle"], number, repeat), "ns/call"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    main(run, "IPCMain dispatch overhead")
@@ -0,0 +1,53 @@
+"""
+Benchmark for many-window fan-out
+
+Compares ipc_main.broadcast() (encode once) with a send_to_window() loop
+(encode per window) for increasing numbers of stub windows.
+
+Usage:
+    python benchmarks/bench_fanout.py [--quick] [--json]
+"""
+
+from common import StubWindow, main, ns_per_call, result
+
+from positron.ipc.main import IPCMain
+
+WINDOW_COUNTS = (1, 4, 12, 32)
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Run the fan-out benchmarks.
+
+    Returns:
+        Mapping of benchmark name -> result (microseconds per message)
+    """
+    number, repeat = (500, 3) if quick else (5_000, 5)
+    status = {
+        "online": True,
+        "users": [{"id": i, "name": f"User {i}"} for i in range(50)],
+    }
+
+    results = {}
+    for count in WINDOW_COUNTS:
+        ipc = IPCMain()
+        ipc.configure_outbound(interval=0)
+        windows = [StubWindow() for _ in range(count)]
+        for window in windows:
+            ipc.register_window(window)
+
+        def loop():
+            for window in windows:
+                ipc.send_to_window(window, "bench:status", status)
+
+        cases = {
+            f"broadcast_{count}_windows": lambda: ipc.broadcast("bench:status", status),
+            f"send_loop_{count}_windows": loop,
+        }
+        for name, func in cases.items():
+            results[name] = result(ns_per_call(func, number, repeat) / 1000, "us/msg")
+    return results
+
+
+if __name__ == "__main__":
+    main(run, "Many-window fan-out")
@@ -0,0 +1,86 @@
+"""
+Import time benchmark
+Measures what `import positron` and its first uses cost a fresh interpreter,
+from `python -X importtime`, and counts the modules each one loads.
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from common import main, result
+
+# Heavy modules loaded only where they are used: webview with the first
+# window, http.server when something is served, asyncio by the App's loop
+DEFERRED = ("webview", "asyncio", "http.server", "multiprocessing")
+
+# Statements timed in a fresh interpreter after `import positron`, with the
+# DEFERRED modules each one may load
+TARGETS = {
+    "import_positron": ("", ()),
+    "import_ipc_main": ("positron.ipc_main", ()),
+    "import_app": ("positron.App", ("asyncio",)),
+}
+
+MARKER = "-- positron --"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure(statement: str) -> tuple:
+    """
+    Import positron (and run statement) in a fresh interpreter.
+
+    Args:
+        statement: Expression evaluated after the import (may be empty)
+
+    Returns:
+        (milliseconds, modules loaded, names of DEFERRED modules loaded)
+    """
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        f"sys.stderr.write({MARKER!r} + '\\n')\n"
+        "import positron\n"
+        f"{statement}\n"
+        "loaded = set(sys.modules) - before\n"
+        "print(len(loaded))\n"
+        f"print(*[name for name in {DEFERRED!r} if name in loaded])\n"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Sum the top-level imports after the marker (nested ones are included)
+    microseconds = 0
+    lines = process.stderr.splitlines()
+    for line in lines[lines.index(MARKER) + 1 :]:
+        parts = line.split("|")
+        if len(parts) == 3 and not parts[2][1:].startswith(" "):
+            microseconds += int(parts[1])
+
+    modules, deferred = process.stdout.split("\n")[:2]
+    return microseconds / 1000, int(modules), deferred.split()
+
+
+def run(quick: bool = False) -> dict:
+    repeat = 3 if quick else 9
+    results = {}
+    for name, (statement, allowed) in TARGETS.items():
+        samples = [measure(statement) for _ in range(repeat)]
+        heavy = samples[-1][2]
+        unexpected = sorted(set(heavy) - set(allowed))
+        if unexpected:
+            raise AssertionError(f"{name} loads {', '.join(unexpected)}")
+        results[name] = result(statistics.median(s[0] for s in samples), "ms")
+        results[f"{name}_modules"] = result(samples[-1][1], "modules")
+        results[f"{name}_heavy"] = result(len(heavy), "modules")
+    return results
+
+
+if __name__ == "__main__":
+    main(run, "Time to import positron in a fresh interpreter")
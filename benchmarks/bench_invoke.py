@@ -0,0 +1,72 @@
+"""
+Benchmark for invoke round trips
+
+Calls the ipc_invoke / ipc_invoke_batch bridge methods the renderer uses,
+so each number covers dispatch, the handler and encoding the result.
+
+Usage:
+    python benchmarks/bench_invoke.py [--quick] [--json]
+"""
+
+from common import StubWindow, main, ns_per_call, result
+
+from positron.ipc.executors import HandlerPools
+from positron.ipc.main import IPCMain
+from positron.main.event_loop import EventLoopThread
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Run the invoke benchmarks.
+
+    Returns:
+        Mapping of benchmark name -> result (microseconds per round trip)
+    """
+    number, repeat = (2_000, 3) if quick else (20_000, 5)
+
+    ipc = IPCMain()
+    loop_thread = EventLoopThread(name="bench-loop")
+    ipc.set_event_loop(loop_thread.start())
+    pools = HandlerPools()
+    ipc.set_pools(pools)
+    api = ipc.get_js_api(StubWindow())
+
+    async def echo_async(event, value):
+        return value
+
+    row = {"id": 1, "name": "Ada Lovelace", "email": "ada@example.com", "tags": ["a"]}
+
+    ipc.handle("bench:sync", lambda event, value: value)
+    ipc.handle("bench:async", echo_async)
+    ipc.handle("bench:thread", lambda event, value: value, executor="thread")
+    ipc.handle("bench:rows", lambda event, count: [row] * count)
+    ipc.handle("bench:cached", lambda event, value: value, cache=True)
+    rows = [row] * 100
+    ipc.handle("bench:reference", lambda event: rows, cache=True, renderer_cache=True)
+    etag = ipc.serializer.loads(api.ipc_invoke("bench:reference", []))["etag"]
+
+    batch = [["bench:sync", [i]] for i in range(10)]
+    cases = {
+        "invoke_sync": lambda: api.ipc_invoke("bench:sync", [1]),
+        "invoke_async": lambda: api.ipc_invoke("bench:async", [1]),
+        "invoke_thread_pool": lambda: api.ipc_invoke("bench:thread", [1]),
+        "invoke_cached": lambda: api.ipc_invoke("bench:cached", [1]),
+        "invoke_100_rows": lambda: api.ipc_invoke("bench:rows", [100]),
+        "revalidate_100_rows": lambda: api.ipc_invoke(
+            "bench:reference", [], None, etag
+        ),
+        "invoke_batch_10": lambda: api.ipc_invoke_batch(batch),
+    }
+
+    try:
+        return {
+            name: result(ns_per_call(func, number, repeat) / 1000, "us/call")
+            for name, func in cases.items()
+        }
+    finally:
+        loop_thread.stop()
+        pools.shutdown()
+
+
+if __name__ == "__main__":
+    main(run, "Invoke round-trip time")
@@ -0,0 +1,67 @@
+"""
+Benchmark for one-way message throughput
+
+Measures renderer -> main send() calls, and main -> renderer messages through
+the per-window outbound queue, both immediate and coalesced.
+
+Usage:
+    python benchmarks/bench_send.py [--quick] [--json]
+"""
+
+import time
+
+from common import StubWindow, main, per_second, result
+
+from positron.ipc.main import IPCMain
+
+
+def _send_to_window(ipc: IPCMain, count: int, interval: float) -> dict:
+    """Internal: Throughput of send_to_window() and messages per evaluated script"""
+    ipc.configure_outbound(interval=interval, max_batch=64)
+    window = StubWindow()
+    payload = {"progress": 0.5, "label": "Importing"}
+
+    start = time.perf_counter()
+    for _ in range(count):
+        ipc.send_to_window(window, "bench:progress", payload)
+    ipc.flush(window)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rate": count / elapsed,
+        "messages_per_script": count / max(window.scripts, 1),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Run the send benchmarks.
+
+    Returns:
+        Mapping of benchmark name -> result (messages per second)
+    """
+    number, repeat = (20_000, 3) if quick else (200_000, 5)
+    count = 20_000 if quick else 200_000
+
+    ipc = IPCMain()
+    api = ipc.get_js_api(StubWindow())
+    ipc.on("bench:log", lambda event, message: None)
+
+    results = {
+        "renderer_send": result(
+            per_second(lambda: api.ipc_send("bench:log", ["hello"]), number, repeat),
+            "msg/s",
+        )
+    }
+
+    for name, interval in (("immediate", 0), ("coalesced", 0.016)):
+        measured = _send_to_window(ipc, count, interval)
+        results[f"send_to_window_{name}"] = result(measured["rate"], "msg/s")
+        results[f"send_to_window_{name}_batching"] = result(
+            measured["messages_per_script"], "msg/script"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main(run, "One-way message throughput")
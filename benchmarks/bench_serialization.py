@@ -0,0 +1,64 @@
+"""
+Benchmark for payload serialization cost by size
+
+Encodes row-shaped payloads of increasing size with every available
+Serializer backend (orjson when installed, and the stdlib json module).
+
+Usage:
+    python benchmarks/bench_serialization.py [--quick] [--json]
+"""
+
+import timeit
+
+from common import main, result
+
+from positron.ipc.serializer import Serializer
+
+# Approximate encoded size -> number of rows
+SIZES = {"1kb": 12, "64kb": 750, "1mb": 12_000}
+
+
+def _rows(count: int) -> list:
+    """Internal: Build a list of typical table rows"""
+    return [
+        {
+            "id": i,
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "score": i * 0.5,
+            "active": i % 2 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Run the serialization benchmarks.
+
+    Returns:
+        Mapping of benchmark name -> result (microseconds per encode, MB/s)
+    """
+    budget = 0.05 if quick else 0.5  # Seconds per case
+    backends = [Serializer(use_orjson=False)]
+    if Serializer().use_orjson:
+        backends.insert(0, Serializer())
+
+    results = {}
+    for label, count in SIZES.items():
+        payload = _rows(count)
+        for serializer in backends:
+            encoded = len(serializer.dumps(payload))
+            timer = timeit.Timer(lambda: serializer.dumps(payload))
+            number, _ = timer.autorange()
+            number = max(1, int(number * budget / 0.2))
+            seconds = min(timer.repeat(number=number, repeat=3)) / number
+
+            name = f"{serializer.name}_{label}"
+            results[name] = result(seconds * 1e6, "us/encode")
+            results[f"{name}_throughput"] = result(encoded / seconds / 1e6, "MB/s")
+    return results
+
+
+if __name__ == "__main__":
+    main(run, "Serialization cost by payload size")
@@ -0,0 +1,64 @@
+"""
+Shared helpers for the IPC benchmarks
+Everything runs against a stub window, so no display or webview is needed
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class StubWindow:
+    """Headless stand-in for a pywebview window that records evaluated scripts"""
+
+    def __init__(self):
+        self.scripts = 0
+        self.chars = 0
+
+    def evaluate_js(self, script):
+        self.scripts += 1
+        self.chars += len(script)
+        return None
+
+    # OutboundQueue prefers run_js when the window has it
+    run_js = evaluate_js
+
+
+def result(value: float, unit: str) -> dict:
+    """Build one benchmark result entry"""
+    return {"value": round(value, 3), "unit": unit}
+
+
+def ns_per_call(func, number: int, repeat: int) -> float:
+    """Best time per call of func over `repeat` runs, in nanoseconds"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def per_second(func, number: int, repeat: int) -> float:
+    """Best throughput of func over `repeat` runs, in calls per second"""
+    return 1e9 / ns_per_call(func, number, repeat)
+
+
+def main(run, description: str):
+    """
+    Command line entry point shared by the benchmark modules.
+
+    Args:
+        run: Function(quick: bool) -> {name: result}
+        description: Help text
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = run(quick=args.quick)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, entry in results.items():
+            print(f"{name:<36} {entry['value']:>14,.1f} {entry['unit']}")
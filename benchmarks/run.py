@@ -0,0 +1,123 @@
+"""
+Run the IPC benchmark suite
+
+Runs every benchmarks/bench_*.py module against stub windows (no display
+needed) and writes machine-readable results that can be compared across
+releases.
+
+Usage:
+    python benchmarks/run.py [--quick] [--only NAME ...] [--output results.json]
+    python benchmarks/run.py --compare baseline.json [--output current.json]
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import sys
+from pathlib import Path
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+# Result units where a larger value is an improvement
+HIGHER_IS_BETTER = ("/s", "msg/script")
+
+
+def discover() -> list:
+    """List the benchmark module names (bench_*.py)"""
+    return sorted(path.stem for path in BENCH_DIR.glob("bench_*.py"))
+
+
+def metadata(quick: bool) -> dict:
+    """Describe the environment the results were measured in"""
+    import positron
+    from positron.ipc.serializer import Serializer
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "positron": positron.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "serializer": Serializer().name,
+        "quick": quick,
+    }
+
+
+def run_suite(names: list, quick: bool) -> dict:
+    """
+    Run benchmark modules.
+
+    Args:
+        names: Module names to run
+        quick: Use fewer iterations
+
+    Returns:
+        {"meta": {...}, "results": {module: {name: {"value", "unit"}}}}
+    """
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        module = importlib.import_module(name)
+        results[name] = module.run(quick=quick)
+    return {"meta": metadata(quick), "results": results}
+
+
+def compare(baseline: dict, current: dict):
+    """
+    Print the change of every result against a baseline run.
+    Throughputs (HIGHER_IS_BETTER units) improve upwards; other units are costs.
+    """
+    print(f"{'benchmark':<52} {'baseline':>12} {'current':>12} {'change':>9}")
+    for module, entries in current["results"].items():
+        for name, entry in entries.items():
+            old = baseline.get("results", {}).get(module, {}).get(name)
+            label = f"{module}.{name}"
+            if old is None or not old["value"]:
+                print(f"{label:<52} {'-':>12} {entry['value']:>12,.1f} {'new':>9}")
+                continue
+
+            change = (entry["value"] - old["value"]) / old["value"] * 100
+            better = (
+                change > 0 if entry["unit"].endswith(HIGHER_IS_BETTER) else change < 0
+            )
+            marker = "" if abs(change) < 5 else (" +" if better else " !")
+            print(
+                f"{label:<52} {old['value']:>12,.1f} {entry['value']:>12,.1f} "
+                f"{change:>+8.1f}%{marker}"
+            )
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Run the IPC benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations")
+    parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="Benchmark modules to run"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Baseline JSON results to compare with")
+    args = parser.parse_args()
+
+    names = discover()
+    if args.only:
+        names = [name for name in names if name in args.only or name[6:] in args.only]
+
+    report = run_suite(names, args.quick)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        compare(baseline, report)
+    elif not args.output:
+        print(text)
+
+
+if __name__ == "__main__":
+    cli()
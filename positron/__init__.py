@@ -3,13 +3,28 @@ Positron - Electron-like framework for Python
 Build cross-platform desktop apps with React and Python
 """
 
-from .common.utilities import __author__, __title__, __version__
+from typing import TYPE_CHECKING
 
-# Use webview-based implementations
-# Use webview-based implementations
-from .ipc.main import ipc_main
-from .main.app import App
-from .main.browser_window import BrowserWindow
+from .common.lazy import lazy_exports
+
+# Starts the startup timeline's clock (app.get_startup_timeline())
+from .main import timeline as _timeline  # noqa: F401
+
+# Public names are imported on first access; `import positron` does not load
+# pywebview or the IPC machinery until they are used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "App": ".main.app",
+        "BrowserWindow": ".main.browser_window",
+        "ipc_main": ".ipc.main",
+    },
+)
+
+if TYPE_CHECKING:
+    from .ipc.main import ipc_main
+    from .main.app import App
+    from .main.browser_window import BrowserWindow
 
 __all__ = ["App", "BrowserWindow", "ipc_main"]
 __version__ = "0.1.9"
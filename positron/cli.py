@@ -0,0 +1,64 @@
+"""
+Positron command line interface
+
+Usage:
+    positron pack dist -o app.pak
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .renderer.archive import brotli, pack
+
+
+def _pack(args) -> int:
+    """Internal: positron pack"""
+    try:
+        stats = pack(args.source, args.output, compress=not args.no_compress)
+    except (FileNotFoundError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"Packed {stats['files']} files ({stats['variants']} variants, "
+        f"{stats['bytes'] / 1e6:.1f} MB) into {args.output}"
+    )
+    if not args.no_compress and brotli is None:
+        print("Install 'brotli' to also store brotli-compressed variants")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the positron command.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog="positron", description="Positron tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = commands.add_parser(
+        "pack", help="Pack a built frontend into one archive for load_app()"
+    )
+    pack_parser.add_argument("source", help="Directory of built assets (e.g. dist)")
+    pack_parser.add_argument(
+        "-o", "--output", default="app.pak", help="Archive to write (default: app.pak)"
+    )
+    pack_parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Do not add compressed variants of text assets",
+    )
+    pack_parser.set_defaults(run=_pack)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
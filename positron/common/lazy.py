@@ -0,0 +1,38 @@
+"""
+Lazy package exports
+Public names of a package are imported on first access (PEP 562), so
+`import positron` stays cheap for tools that only need part of it
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Build a package's module-level __getattr__ and __dir__.
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"App": ".main.app"})
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> module (relative to the package) defining it
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,150 @@
+"""
+Loopback HTTP server owned by the App
+Serves content to renderers over 127.0.0.1 without going through evaluate_js
+"""
+
+import secrets
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# handler(request, path, query) -> None; path is relative to the route prefix
+RouteHandler = Callable[[BaseHTTPRequestHandler, str, dict], None]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Internal: Routes requests to handlers registered on the LoopbackServer"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "Positron"
+
+    def do_GET(self):
+        self.server.loopback._handle(self)
+
+    def do_HEAD(self):
+        self.server.loopback._handle(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LoopbackServer:
+    """
+    Minimal threaded HTTP server bound to 127.0.0.1 on a free port.
+    Routes are matched by path prefix; routes can require the per-session
+    token (passed as the ``token`` query parameter) so other local processes
+    cannot read them. The server starts lazily on first use.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            host: Interface to bind (default: loopback only)
+            port: Port to bind (default: 0, any free port)
+        """
+        self.host = host
+        self.port = port
+        self.token = secrets.token_urlsafe(32)
+        self._routes: List[Tuple[str, RouteHandler, bool]] = []
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add_route(self, prefix: str, handler: RouteHandler, require_token: bool = True):
+        """
+        Register a handler for all paths starting with prefix.
+
+        Args:
+            prefix: Path prefix (e.g. "/__positron/blob/")
+            handler: Function(request, path, query) writing the response
+            require_token: Reject requests without the session token
+        """
+        with self._lock:
+            self._routes = [r for r in self._routes if r[0] != prefix]
+            self._routes.append((prefix, handler, require_token))
+            # Longest prefix wins
+            self._routes.sort(key=lambda r: len(r[0]), reverse=True)
+
+    def start(self) -> str:
+        """
+        Start serving (no-op if already running).
+
+        Returns:
+            Base URL of the server
+        """
+        with self._lock:
+            if self._httpd is None:
+                self._httpd = ThreadingHTTPServer(
+                    (self.host, self.port), _RequestHandler
+                )
+                self._httpd.daemon_threads = True
+                self._httpd.loopback = self
+                self.port = self._httpd.server_address[1]
+                self._thread = threading.Thread(
+                    target=self._httpd.serve_forever,
+                    name="positron-loopback",
+                    daemon=True,
+                )
+                self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop serving"""
+        with self._lock:
+            httpd, self._httpd = self._httpd, None
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def is_running(self) -> bool:
+        """Check if the server is running"""
+        return self._httpd is not None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (http://127.0.0.1:<port>)"""
+        return f"http://{self.host}:{self.port}"
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        """Internal: Dispatch a request to the matching route"""
+        parts = urlsplit(request.path)
+        query = parse_qs(parts.query)
+
+        for prefix, handler, require_token in self._routes:
+            if not parts.path.startswith(prefix):
+                continue
+            if require_token and not secrets.compare_digest(
+                query.get("token", [""])[0], self.token
+            ):
+                send_error(request, 403, "Forbidden")
+                return
+            try:
+                handler(request, parts.path[len(prefix) :], query)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            except Exception as e:
+                print(f"Error serving {parts.path}: {e}", file=sys.stderr)
+            return
+
+        send_error(request, 404, "Not Found")
+
+
+def send_error(request: BaseHTTPRequestHandler, status: int, message: str):
+    """
+    Send a small plain-text error response.
+
+    Args:
+        request: Request being answered
+        status: HTTP status code
+        message: Response body
+    """
+    body = message.encode("utf-8")
+    request.send_response(status)
+    request.send_header("Content-Type", "text/plain; charset=utf-8")
+    request.send_header("Content-Length", str(len(body)))
+    request.send_header("Access-Control-Allow-Origin", "*")
+    request.end_headers()
+    if request.command != "HEAD":
+        request.wfile.write(body)
@@ -1,2 +1,4 @@
+from .limits import IPCQueueFullError
 from .main import ipc_main
 from .renderer import ipc_renderer
+from .routing import IPCRouter
@@ -0,0 +1,185 @@
+"""
+Binary payload transport for IPC
+Hands bytes-like results to the renderer as ArrayBuffers fetched from the
+App's loopback server instead of JSON/base64 strings
+"""
+
+import base64
+import secrets
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from ..common.loopback import LoopbackServer
+
+BLOB_PREFIX = "/__positron/blob/"
+MARKER_KEY = "$positron"
+
+# Types that never expose the buffer protocol; checked before trying memoryview()
+_PLAIN_TYPES = (str, int, float, bool, dict, list, tuple, type(None))
+
+
+def as_buffer(value) -> Optional[memoryview]:
+    """
+    Get a flat byte view of a bytes-like value without copying it.
+
+    Args:
+        value: bytes, bytearray, memoryview or any buffer-protocol object
+            (e.g. NumPy arrays)
+
+    Returns:
+        1-D unsigned byte memoryview, or None if value is not bytes-like
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return None
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+    if view.ndim == 0:
+        # Scalars (e.g. NumPy integers) are values, not payloads
+        return None
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+class BinaryStore:
+    """
+    Holds binary payloads until the renderer fetches them.
+    Each payload is served from the loopback server under an unguessable id
+    and the per-session token, and released after its allowed number of
+    fetches (one per receiving window), when its TTL expires, or when the
+    windows it was sent to close or navigate away (see release()).
+    """
+
+    def __init__(self, server: Optional["LoopbackServer"] = None, ttl: float = 60.0):
+        """
+        Args:
+            server: Loopback server to serve payloads from (base64 fallback if None)
+            ttl: Seconds an unfetched payload is kept before being released
+        """
+        self.ttl = ttl
+        self._server: Optional["LoopbackServer"] = None
+        # id -> [view, expires, uses left, ids of the windows yet to fetch it]
+        self._blobs: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        if server is not None:
+            self.attach(server)
+
+    def attach(
+        self,
+        server: Union["LoopbackServer", Callable[[], "LoopbackServer"], None],
+    ):
+        """
+        Serve payloads from a loopback server.
+
+        Args:
+            server: Loopback server, or a function returning one (called when
+                the first payload is stored); None reverts to the base64
+                fallback
+        """
+        self._server = server
+        if server is not None and not callable(server):
+            server.add_route(BLOB_PREFIX, self._serve)
+
+    def put(self, view: memoryview, uses: int = 1, owners: Iterable = ()) -> dict:
+        """
+        Store a payload and build the marker the renderer resolves.
+
+        Args:
+            view: Byte view returned by as_buffer()
+            uses: Number of fetches allowed (one per receiving window)
+            owners: Keys of the receiving windows, for release() (optional)
+
+        Returns:
+            Marker dict: {"$positron": "binary", "url": ..., "size": ...}, or
+            {"$positron": "binary", "base64": ...} without a server
+        """
+        server = self._server
+        if server is None:
+            return {
+                MARKER_KEY: "binary",
+                "base64": base64.b64encode(view).decode("ascii"),
+            }
+
+        if callable(server):
+            server = self._resolve(server)
+        base_url = server.start()
+        blob_id = secrets.token_urlsafe(16)
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            self._blobs[blob_id] = [view, now + self.ttl, uses, set(owners)]
+
+        return {
+            MARKER_KEY: "binary",
+            "url": f"{base_url}{BLOB_PREFIX}{blob_id}?token={server.token}",
+            "size": view.nbytes,
+        }
+
+    def _resolve(self, factory: Callable[[], "LoopbackServer"]) -> "LoopbackServer":
+        """Internal: Create the server attached as a function, once"""
+        with self._lock:
+            if self._server is factory:
+                self._server = factory()
+                self._server.add_route(BLOB_PREFIX, self._serve)
+            return self._server
+
+    def release(self, owner):
+        """
+        Release the payloads a window will no longer fetch (it closed or
+        loaded another page), and any whose TTL expired.
+
+        Args:
+            owner: Window key passed to put()
+        """
+        with self._lock:
+            self._purge(time.monotonic())
+            for key, entry in list(self._blobs.items()):
+                if owner in entry[3]:
+                    entry[3].discard(owner)
+                    entry[2] -= 1
+                    if entry[2] <= 0:
+                        del self._blobs[key]
+
+    def clear(self):
+        """Release all stored payloads"""
+        with self._lock:
+            self._blobs.clear()
+
+    def _purge(self, now: float):
+        """Internal: Drop payloads whose TTL expired (lock held)"""
+        expired = [key for key, entry in self._blobs.items() if entry[1] < now]
+        for key in expired:
+            del self._blobs[key]
+
+    def _serve(self, request, path: str, query: dict):
+        """Internal: Loopback route writing a stored payload"""
+        from ..common.loopback import send_error
+
+        if request.command == "HEAD":
+            send_error(request, 405, "Method Not Allowed")
+            return
+
+        with self._lock:
+            self._purge(time.monotonic())
+            entry = self._blobs.get(path)
+            if entry is not None:
+                entry[2] -= 1
+                if entry[2] <= 0:
+                    del self._blobs[path]
+        if entry is None:
+            send_error(request, 404, "Not Found")
+            return
+
+        view = entry[0]
+        request.send_response(200)
+        request.send_header("Content-Type", "application/octet-stream")
+        request.send_header("Content-Length", str(view.nbytes))
+        request.send_header("Cache-Control", "no-store")
+        request.send_header("Access-Control-Allow-Origin", "*")
+        request.end_headers()
+        # Written straight from the original buffer, no intermediate copy
+        request.wfile.write(view)
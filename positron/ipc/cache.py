@@ -0,0 +1,285 @@
+"""
+Result caching for IPC handlers
+Size-bounded LRU cache with optional TTL, used by handle(..., cache=...), and
+the validators behind the renderer-side cache (handle(..., renderer_cache=...))
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Optional, Tuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+DEFAULT_MAXSIZE = 128
+
+# Channel on which invalidations are pushed to renderer caches
+CACHE_CHANNEL = "positron:cache"
+
+# Invoke reply telling the renderer its cached copy is still current
+NOT_MODIFIED = '{"$positron":"not-modified"}'
+
+
+def make_key(*args) -> Any:
+    """
+    Default cache key: the handler arguments, with lists and dicts (as
+    received from JavaScript) converted to hashable equivalents.
+    """
+    return _freeze(args)
+
+
+def _freeze(value):
+    """Internal: Convert JSON containers to hashable values"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(
+            sorted(((key, _freeze(item)) for key, item in value.items()), key=repr)
+        )
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+class ResultCache:
+    """
+    LRU cache of handler results.
+
+    Results are keyed by channel and arguments. Entries expire after `ttl`
+    seconds (if set), and the least recently used entry is evicted once
+    `maxsize` entries are stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        key: Optional[Callable] = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of entries (None for unbounded)
+            ttl: Seconds an entry stays valid (None for no expiry)
+            key: Function(*args) -> hashable key (default: the arguments)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.key = key or make_key
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, channel: str, args) -> Tuple[bool, Any, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            channel: Concrete channel name
+            args: Handler arguments
+
+        Returns:
+            (hit, value, token) - pass token to store() on a miss
+        """
+        key = (channel, self.key(*args))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value, None
+                del self._entries[key]
+            self.misses += 1
+            return False, None, (key, self._generation)
+
+    def store(self, token, value):
+        """
+        Store a result computed after a miss.
+        Dropped if the cache was invalidated while the handler was running.
+
+        Args:
+            token: Token returned by lookup()
+            value: Handler result
+        """
+        key, generation = token
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, channel: Optional[str] = None, args=None):
+        """
+        Drop cached results.
+
+        Args:
+            channel: Only drop results for this concrete channel (optional)
+            args: Only drop the result for these arguments (optional)
+        """
+        with self._lock:
+            self._generation += 1
+            if channel is None:
+                self._entries.clear()
+            elif args is not None:
+                self._entries.pop((channel, self.key(*args)), None)
+            else:
+                for key in [key for key in self._entries if key[0] == channel]:
+                    del self._entries[key]
+
+    def info(self) -> CacheInfo:
+        """Get hit/miss counters and the current size"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+def make_cache(spec) -> Optional[ResultCache]:
+    """
+    Build a cache from a ``cache=`` option passed to handle().
+
+    Args:
+        spec: None/False (no cache), True (defaults), an int (maxsize),
+            a dict of ResultCache arguments, or a ResultCache instance
+
+    Returns:
+        ResultCache or None
+    """
+    if spec is None or spec is False:
+        return None
+    if spec is True:
+        return ResultCache()
+    if isinstance(spec, ResultCache):
+        return spec
+    if isinstance(spec, int):
+        return ResultCache(maxsize=spec)
+    if isinstance(spec, dict):
+        return ResultCache(**spec)
+    raise ValueError(
+        f"Invalid cache: {spec!r} "
+        "(expected True, a maxsize, a dict of options or a ResultCache)"
+    )
+
+
+def content_etag(text: str) -> str:
+    """
+    Validator for an encoded result: a hash of its JSON text.
+
+    Args:
+        text: Encoded result
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+class RendererCache:
+    """
+    Main process side of the renderer invoke cache.
+
+    Renderers keep results of channels registered with renderer_cache= and
+    reuse them until they are invalidated or `max_age` seconds pass. They then
+    send the etag of their copy, and an unchanged result is answered with
+    NOT_MODIFIED instead of the payload.
+
+    The etag of the last result sent for each call is remembered with the
+    result object, so a result served again from the handler's ResultCache is
+    validated without being encoded again.
+    """
+
+    def __init__(self, max_age: Optional[float] = None, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Args:
+            max_age: Seconds a renderer may reuse a result without asking
+                (None: until invalidated)
+            maxsize: Number of remembered etags
+        """
+        self.max_age = max_age
+        self.maxsize = maxsize
+        self._etags: "OrderedDict[Any, Tuple[Any, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def known_etag(self, key, value) -> Optional[str]:
+        """
+        Get the etag of a result if this exact object was sent before.
+
+        Args:
+            key: (channel, arguments key)
+            value: Handler result
+
+        Returns:
+            The etag, or None if the result has to be encoded
+        """
+        with self._lock:
+            entry = self._etags.get(key)
+            if entry is not None and entry[0] is value:
+                self._etags.move_to_end(key)
+                return entry[1]
+            return None
+
+    def remember(self, key, value, etag: str):
+        """
+        Remember the etag of a result that was just encoded.
+
+        Args:
+            key: (channel, arguments key)
+            value: Handler result
+            etag: Its etag
+        """
+        with self._lock:
+            self._etags[key] = (value, etag)
+            self._etags.move_to_end(key)
+            while len(self._etags) > self.maxsize:
+                self._etags.popitem(last=False)
+
+    def invalidate(self, channel: Optional[str] = None, key=None):
+        """
+        Forget remembered etags.
+
+        Args:
+            channel: Only forget etags for this concrete channel (optional)
+            key: Only forget the etag for this arguments key (optional)
+        """
+        with self._lock:
+            if channel is None:
+                self._etags.clear()
+            elif key is not None:
+                self._etags.pop((channel, key), None)
+            else:
+                for entry in [entry for entry in self._etags if entry[0] == channel]:
+                    del self._etags[entry]
+
+
+def make_renderer_cache(spec) -> Optional[RendererCache]:
+    """
+    Build the renderer cache options from a ``renderer_cache=`` option.
+
+    Args:
+        spec: None/False (not cached), True (until invalidated), a number
+            (max_age in seconds), a dict of RendererCache arguments, or a
+            RendererCache instance
+
+    Returns:
+        RendererCache or None
+    """
+    if spec is None or spec is False:
+        return None
+    if spec is True:
+        return RendererCache()
+    if isinstance(spec, RendererCache):
+        return spec
+    if isinstance(spec, (int, float)):
+        return RendererCache(max_age=spec)
+    if isinstance(spec, dict):
+        return RendererCache(**spec)
+    raise ValueError(
+        f"Invalid renderer_cache: {spec!r} "
+        "(expected True, a max_age, a dict of options or a RendererCache)"
+    )
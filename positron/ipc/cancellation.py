@@ -0,0 +1,69 @@
+"""
+Cancellation of IPC calls
+The renderer aborts an invoke() through an AbortSignal; the handler observes
+it through the CancellationToken on its IPCEvent
+"""
+
+import sys
+import threading
+from concurrent.futures import CancelledError
+from typing import Callable, List
+
+
+class CancellationToken:
+    """
+    Signals that the renderer abandoned a call.
+
+    Sync handlers poll it (or call raise_if_cancelled()) between units of
+    work; async handlers are cancelled directly with asyncio.CancelledError.
+    """
+
+    __slots__ = ("_cancelled", "_callbacks", "_lock")
+
+    def __init__(self):
+        self._cancelled = False
+        self._callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the call was cancelled"""
+        return self._cancelled
+
+    def cancel(self):
+        """Cancel the call and run the registered callbacks (once)"""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in cancellation callback: {e}", file=sys.stderr)
+
+    def add_callback(self, callback: Callable):
+        """
+        Run a callback when the call is cancelled.
+        Runs immediately if it already was.
+
+        Args:
+            callback: Function taking no arguments
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        """
+        Raise if the call was cancelled.
+
+        Raises:
+            concurrent.futures.CancelledError: If the call was cancelled
+        """
+        if self._cancelled:
+            raise CancelledError("IPC call was cancelled by the renderer")
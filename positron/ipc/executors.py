@@ -0,0 +1,317 @@
+"""
+Executor selection for IPC handlers
+Lets CPU-bound handlers run on thread or process pools instead of the bridge thread
+"""
+
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+INLINE = "inline"
+THREAD = "thread"
+PROCESS = "process"
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BACKGROUND = "background"
+
+# Scheduling order of the thread pool, most urgent first
+PRIORITIES = (INTERACTIVE, NORMAL, BACKGROUND)
+
+# Seconds a queued call waits before it is treated as one level more urgent
+DEFAULT_AGING = 0.5
+
+ExecutorSpec = Union[str, Executor, None]
+
+
+def validate_executor(executor: ExecutorSpec) -> ExecutorSpec:
+    """
+    Validate an ``executor=`` option passed to handle()/on().
+
+    Args:
+        executor: "inline", "thread", "process", an Executor instance or None
+
+    Returns:
+        The executor spec, with None normalized to "inline"
+    """
+    if executor is None:
+        return INLINE
+    if isinstance(executor, Executor) or executor in (INLINE, THREAD, PROCESS):
+        return executor
+    raise ValueError(
+        f"Invalid executor: {executor!r} "
+        "(expected 'inline', 'thread', 'process' or a concurrent.futures.Executor)"
+    )
+
+
+def validate_priority(priority: str) -> str:
+    """
+    Validate a ``priority=`` option passed to handle()/on().
+
+    Args:
+        priority: "interactive", "normal" or "background"
+
+    Returns:
+        The priority
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(
+            f"Invalid priority: {priority!r} "
+            "(expected 'interactive', 'normal' or 'background')"
+        )
+    return priority
+
+
+def run_handler(handler, event, args):
+    """
+    Call a handler inside a pool worker.
+    Async handlers get their own event loop in the worker.
+    """
+    result = handler(event, *args)
+    if inspect.iscoroutine(result):
+        import asyncio
+
+        return asyncio.run(result)
+    return result
+
+
+def is_process_pool(executor) -> bool:
+    """
+    Check if an executor is a ProcessPoolExecutor, without importing
+    multiprocessing when no process pool was ever created.
+    """
+    process = sys.modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+
+def run_handler_in_process(handler, args):
+    """
+    Call a handler inside a process pool worker.
+    Windows cannot cross process boundaries, so the handler receives an
+    IPCEvent without a window (replies are dropped).
+    """
+    from .main import IPCEvent
+
+    return run_handler(handler, IPCEvent(), args)
+
+
+class _WorkItem:
+    """Internal: A call queued on the PriorityThreadPool"""
+
+    __slots__ = ("future", "fn", "args", "kwargs", "queued_at")
+
+    def __init__(self, future: Future, fn: Callable, args, kwargs):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.queued_at = time.monotonic()
+
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+class PriorityThreadPool(Executor):
+    """
+    Thread pool that runs queued calls by priority.
+
+    Each priority has its own FIFO queue. A free worker takes the oldest call
+    of the most urgent non-empty queue, so interactive work never waits behind
+    queued background work. To prevent starvation, a queued call counts as one
+    level more urgent for every `aging` seconds it has waited.
+    """
+
+    def __init__(self, max_workers: int, aging: float = DEFAULT_AGING):
+        """
+        Args:
+            max_workers: Maximum number of worker threads
+            aging: Seconds of waiting that promote a call by one level
+        """
+        self.max_workers = max_workers
+        self.aging = aging
+        self._queues = {priority: deque() for priority in PRIORITIES}
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+        self._cond = threading.Condition()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Schedule a call with normal priority"""
+        return self.submit_priority(NORMAL, fn, *args, **kwargs)
+
+    def submit_priority(self, priority: str, fn, /, *args, **kwargs) -> Future:
+        """
+        Schedule a call with a priority.
+
+        Args:
+            priority: "interactive", "normal" or "background"
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queues[priority].append(_WorkItem(future, fn, args, kwargs))
+            if self._idle > 0:
+                self._cond.notify()
+            elif len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"positron-ipc_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _next(self) -> Optional[_WorkItem]:
+        """Internal: Pop the most urgent call, accounting for aging (lock held)"""
+        now = time.monotonic()
+        best_queue, best_rank = None, None
+        for level, priority in enumerate(PRIORITIES):
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            rank = level - int((now - queue[0].queued_at) / self.aging)
+            if best_rank is None or rank < best_rank:
+                best_queue, best_rank = queue, rank
+        return best_queue.popleft() if best_queue is not None else None
+
+    def _work(self):
+        """Internal: Worker thread loop"""
+        while True:
+            with self._cond:
+                item = self._next()
+                while item is None:
+                    if self._shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    item = self._next()
+            item.run()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop the workers once the queues are empty.
+
+        Args:
+            wait: Wait for the workers to exit
+            cancel_futures: Cancel calls that have not started
+        """
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    while queue:
+                        queue.popleft().future.cancel()
+            self._cond.notify_all()
+            threads = list(self._threads)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+class HandlerPools:
+    """
+    Thread and process pools used by handlers registered with executor="thread"
+    or executor="process". Pools are created lazily on first use and sized to
+    the number of CPU cores. Managed by App: shut down in App.quit().
+    The thread pool schedules calls by their handler's priority.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, aging: float = DEFAULT_AGING):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.aging = aging
+        self._thread_pool: Optional[PriorityThreadPool] = None
+        self._process_pool: Optional["ProcessPoolExecutor"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def thread_pool(self) -> PriorityThreadPool:
+        """Shared thread pool (created on first access)"""
+        if self._thread_pool is None:
+            with self._lock:
+                if self._thread_pool is None:
+                    self._thread_pool = PriorityThreadPool(self.max_workers, self.aging)
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> "ProcessPoolExecutor":
+        """Shared process pool (created on first access)"""
+        if self._process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with self._lock:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers
+                    )
+        return self._process_pool
+
+    def submit(
+        self,
+        executor: ExecutorSpec,
+        handler,
+        event,
+        args,
+        priority: str = NORMAL,
+    ):
+        """
+        Submit a handler call to the pool selected by an executor spec.
+
+        Args:
+            executor: "thread", "process" or an Executor instance
+            handler: Handler function(event, *args)
+            event: IPCEvent for the call (not sent to process pools)
+            args: Handler arguments
+            priority: Scheduling priority on the shared thread pool
+
+        Returns:
+            concurrent.futures.Future for the handler result
+        """
+        if executor == PROCESS:
+            return self.process_pool.submit(run_handler_in_process, handler, args)
+        if is_process_pool(executor):
+            return executor.submit(run_handler_in_process, handler, args)
+        pool = self.thread_pool if executor == THREAD else executor
+        if isinstance(pool, PriorityThreadPool):
+            return pool.submit_priority(priority, run_handler, handler, event, args)
+        return pool.submit(run_handler, handler, event, args)
+
+    def shutdown(self, wait: bool = False):
+        """
+        Shut down any pools that were created.
+
+        Args:
+            wait: Wait for running handlers to finish
+        """
+        with self._lock:
+            pools = [self._thread_pool, self._process_pool]
+            self._thread_pool = None
+            self._process_pool = None
+
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,176 @@
+"""
+Per-channel concurrency limits for IPC handlers
+Caps how many calls of a channel run at once and how many may wait,
+so a flooded channel cannot starve the others sharing the bridge
+"""
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .cancellation import CancellationToken
+
+REJECT = "reject"
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+OVERFLOW_POLICIES = (REJECT, DROP_OLDEST, BLOCK)
+
+
+class IPCQueueFullError(Exception):
+    """
+    Raised when a call cannot be queued because the channel's queue is full.
+    invoke() callers receive it as a rejected promise with this error name.
+    """
+
+
+class _Waiter:
+    """Internal: A call waiting for a free slot"""
+
+    __slots__ = ("granted", "dropped")
+
+    def __init__(self):
+        self.granted = False
+        self.dropped = False
+
+
+class ChannelLimiter:
+    """
+    Limits concurrent calls of one registered channel (or pattern).
+
+    Calls beyond max_concurrency wait in FIFO order on the bridge thread that
+    received them, until a slot frees up or the renderer aborts the call. When max_queue calls are already waiting, the overflow
+    policy decides what happens to a new call:
+        - "reject": the new call fails with IPCQueueFullError
+        - "drop_oldest": the longest-waiting call fails instead
+        - "block": the new call waits until the queue has room
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        max_concurrency: int,
+        max_queue: Optional[int] = None,
+        overflow: str = REJECT,
+    ):
+        """
+        Args:
+            channel: Channel name or pattern (for error messages)
+            max_concurrency: Maximum number of calls running at once
+            max_queue: Maximum number of waiting calls (None for unbounded)
+            overflow: "reject", "drop_oldest" or "block"
+        """
+        self.channel = channel
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self._active = 0
+        self._waiters = deque()
+        self._cond = threading.Condition()
+
+    @property
+    def active(self) -> int:
+        """Number of calls currently running"""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot"""
+        return len(self._waiters)
+
+    def acquire(self, cancellation: Optional["CancellationToken"] = None):
+        """
+        Take a slot, waiting if the channel is at its limit.
+
+        Args:
+            cancellation: Token of the call; waiting stops when it is cancelled
+
+        Raises:
+            IPCQueueFullError: If the call was rejected or dropped from the queue
+            concurrent.futures.CancelledError: If the call was cancelled while
+                waiting
+        """
+        if cancellation is not None:
+            cancellation.add_callback(self._wake)
+
+        with self._cond:
+            if self._active < self.max_concurrency and not self._waiters:
+                self._active += 1
+                return
+
+            if self.max_queue is not None:
+                while len(self._waiters) >= self.max_queue:
+                    if self.overflow == BLOCK:
+                        if cancellation is not None:
+                            cancellation.raise_if_cancelled()
+                        if self._active < self.max_concurrency and not self._waiters:
+                            self._active += 1
+                            return
+                        self._cond.wait()
+                    elif self.overflow == DROP_OLDEST and self._waiters:
+                        self._waiters.popleft().dropped = True
+                        self._cond.notify_all()
+                    else:
+                        raise self._full()
+
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+            while not waiter.granted:
+                if waiter.dropped:
+                    raise self._full()
+                if cancellation is not None and cancellation.cancelled:
+                    self._waiters.remove(waiter)
+                    self._cond.notify_all()  # Room for a blocked caller
+                    cancellation.raise_if_cancelled()
+                self._cond.wait()
+
+    def release(self):
+        """Free a slot, handing it to the longest-waiting call if any"""
+        with self._cond:
+            if self._waiters:
+                # The slot passes straight to the waiter; active is unchanged
+                self._waiters.popleft().granted = True
+            else:
+                self._active -= 1
+            self._cond.notify_all()
+
+    def _wake(self):
+        """Internal: Wake waiting calls so a cancelled one can leave"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _full(self) -> IPCQueueFullError:
+        """Internal: Build the error for a rejected or dropped call"""
+        return IPCQueueFullError(
+            f"Queue full for channel '{self.channel}' "
+            f"({self.max_concurrency} running, {len(self._waiters)} queued)"
+        )
+
+
+def make_limiter(
+    channel: str,
+    max_concurrency: Optional[int],
+    max_queue: Optional[int],
+    overflow: str,
+) -> Optional[ChannelLimiter]:
+    """
+    Build a limiter from the options passed to handle()/on().
+
+    Returns:
+        ChannelLimiter, or None if no limit was requested
+    """
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Invalid overflow: {overflow!r} "
+            "(expected 'reject', 'drop_oldest' or 'block')"
+        )
+    if max_concurrency is None:
+        if max_queue is not None:
+            raise ValueError("max_queue requires max_concurrency")
+        return None
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if max_queue is not None and max_queue < 0:
+        raise ValueError("max_queue must not be negative")
+    return ChannelLimiter(channel, max_concurrency, max_queue, overflow)
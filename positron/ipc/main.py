@@ -4,8 +4,96 @@ Handles communication from renderer (JavaScript) to main (Python)
 Uses pywebview's JS API to expose Python functions
 """
 
+import inspect
 import sys
-from typing import Any, Callable, Dict, Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, InvalidStateError
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from .binary import BinaryStore, as_buffer
+from .cache import (
+    CACHE_CHANNEL,
+    NOT_MODIFIED,
+    CacheInfo,
+    RendererCache,
+    ResultCache,
+    content_etag,
+    make_cache,
+    make_key,
+    make_renderer_cache,
+)
+from .cancellation import CancellationToken
+from .executors import (
+    INLINE,
+    NORMAL,
+    PROCESS,
+    ExecutorSpec,
+    HandlerPools,
+    is_process_pool,
+    validate_executor,
+    validate_priority,
+)
+from .limits import REJECT, ChannelLimiter, make_limiter
+from .metrics import STATS_CHANNEL, IPCMetrics
+from .outbound import DEFAULT_FLUSH_INTERVAL, DEFAULT_MAX_BATCH, OutboundQueue
+from .routing import IPCRouter, RouteTable, is_pattern
+from .serializer import Serializer
+from .streaming import (
+    DEFAULT_CREDIT,
+    STREAM_CHANNEL,
+    IPCStream,
+    collect,
+    hold_until_closed,
+    is_stream_source,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Cancels for call ids that are not running (the oldest are dropped first),
+# remembered in case the invoke they abort is still crossing the bridge
+EARLY_CANCELS = 256
+
+# Channels Positron registers itself (state snapshots, stats, the startup
+# handshake); remove_all_listeners() without a channel leaves them in place
+INTERNAL_PREFIX = "positron:"
+
+# Methods of the object returned by IPCMain.get_js_api(), exposed to JavaScript
+JS_API_METHODS = (
+    "ipc_send",
+    "ipc_invoke",
+    "ipc_invoke_batch",
+    "ipc_cancel",
+    "ipc_stream_open",
+    "ipc_stream_credit",
+    "ipc_stream_cancel",
+    "ipc_subscribe",
+)
+
+
+class Sender:
+    """
+    The renderer that sent an IPC message (event.sender).
+    send() delivers a message back to the originating window.
+    """
+
+    __slots__ = ("_event",)
+
+    def __init__(self, event: "IPCEvent"):
+        self._event = event
+
+    def send(self, channel: str, *args):
+        """
+        Send a message to the renderer that sent the event.
+
+        Args:
+            channel: Channel name
+            *args: Arguments to send
+        """
+        self._event._send_to_renderer(channel, *args)
 
 
 class IPCEvent:
@@ -14,14 +102,37 @@ class IPCEvent:
     Allows sending replies back to the renderer.
     """
 
-    def __init__(self, window=None):
+    __slots__ = ("window", "_ipc", "_sender", "_cancellation")
+
+    def __init__(
+        self,
+        window=None,
+        ipc: Optional["IPCMain"] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ):
         self.window = window
-        # Create a sender object with send method
-        self.sender = type(
-            "Sender",
-            (),
-            {"send": lambda channel, *args: self._send_to_renderer(channel, *args)},
-        )()
+        self._ipc = ipc
+        self._sender = None  # Created on first access
+        self._cancellation = cancellation  # Set for cancellable invokes
+
+    @property
+    def sender(self) -> Sender:
+        """Sender object with a send(channel, *args) method"""
+        if self._sender is None:
+            self._sender = Sender(self)
+        return self._sender
+
+    @property
+    def cancellation(self) -> CancellationToken:
+        """Token cancelled when the renderer aborts the invoke"""
+        if self._cancellation is None:
+            self._cancellation = CancellationToken()
+        return self._cancellation
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the renderer aborted the invoke"""
+        return self._cancellation is not None and self._cancellation.cancelled
 
     def _send_to_renderer(self, channel: str, *args):
         """
@@ -32,15 +143,7 @@ class IPCEvent:
             *args: Arguments to send
         """
         if self.window:
-            # Call JavaScript function to trigger callbacks
-            import json
-
-            js_args = json.dumps(args[0] if len(args) == 1 else args)
-            js_code = f"window.positron.ipcRenderer._receive('{channel}', {js_args})"
-            try:
-                self.window.evaluate_js(js_code)
-            except Exception as e:
-                print(f"Error sending to channel '{channel}': {e}", file=sys.stderr)
+            (self._ipc or ipc_main).send_to_window(self.window, channel, *args)
 
     def reply(self, channel: str, *args):
         """
@@ -53,6 +156,36 @@ class IPCEvent:
         self._send_to_renderer(channel, *args)
 
 
+class _Route:
+    """
+    Internal: Everything registered for one channel, resolved with a single
+    dict lookup per dispatch.
+    """
+
+    __slots__ = (
+        "pattern",
+        "handler",
+        "executor",
+        "once",
+        "cache",
+        "inflight",
+        "limiter",
+        "priority",
+        "renderer_cache",
+    )
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern  # Channel name or wildcard pattern
+        self.handler: Optional[Callable] = None
+        self.executor: ExecutorSpec = None  # None means inline
+        self.once: Optional[Callable] = None  # Pending once() handler
+        self.cache: Optional[ResultCache] = None
+        self.inflight: Optional[Dict[Any, Future]] = None  # Set for single-flight
+        self.limiter: Optional[ChannelLimiter] = None
+        self.priority = NORMAL
+        self.renderer_cache: Optional[RendererCache] = None
+
+
 class IPCMain:
     """
     Main process IPC handler for pywebview.
@@ -60,15 +193,268 @@ class IPCMain:
     """
 
     def __init__(self):
-        self._handlers: Dict[str, Callable] = {}
-        self._once_handlers: Dict[str, Callable] = {}
+        self._routes = RouteTable()  # channel/pattern -> _Route
+        self._routes_lock = threading.Lock()
+        self._inflight_lock = threading.Lock()
+        self._pools = HandlerPools()  # Replaced by App with its managed pools
         self._current_window = None  # Set by BrowserWindow when exposing API
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None  # Set by App.run()
+        self._outbound = weakref.WeakKeyDictionary()  # window -> OutboundQueue
+        self._outbound_lock = threading.Lock()
+        self._flush_interval = DEFAULT_FLUSH_INTERVAL
+        self._flush_max_batch = DEFAULT_MAX_BATCH
+        self._binary = BinaryStore()
+        self.serializer = Serializer()
+        self._streams: Dict[tuple, IPCStream] = {}  # (window id, stream id)
+        self._streams_lock = threading.Lock()
+        self._windows: List[Any] = []  # Live windows, registered by App
+        self._windows_lock = threading.Lock()
+        self._subscriptions = weakref.WeakKeyDictionary()  # window -> channels
+        # window -> (page, seq, reported channels, channels added by Python)
+        self._subscription_reports = weakref.WeakKeyDictionary()
+        self._subscriptions_lock = threading.Lock()
+        self._calls: Dict[tuple, CancellationToken] = {}  # (window id, call id)
+        self._early_cancels: "OrderedDict[tuple, None]" = OrderedDict()
+        self._calls_lock = threading.Lock()
+        self._metrics: Optional[IPCMetrics] = None  # Set by enable_metrics()
+        self._renderer_cached = False  # Any route registered with renderer_cache=
 
     def set_current_window(self, window):
         """Set the current window for API exposure"""
         self._current_window = window
 
-    def on(self, channel: str, handler: Optional[Callable] = None):
+    def set_event_loop(self, loop: Optional["asyncio.AbstractEventLoop"]):
+        """Set the event loop async handlers are scheduled on (managed by App)"""
+        self._loop = loop
+
+    def set_pools(self, pools: HandlerPools):
+        """Set the pools used by thread/process executors (managed by App)"""
+        self._pools = pools
+
+    def set_serializer(self, serializer):
+        """
+        Replace the codec used for IPC payloads.
+
+        Args:
+            serializer: Object with a dumps(obj) -> str method (e.g. Serializer)
+        """
+        self.serializer = serializer
+
+    def set_loopback_server(self, server):
+        """
+        Set the loopback server binary payloads are fetched from (managed by App).
+        Without one, binary payloads fall back to base64 strings.
+
+        Args:
+            server: LoopbackServer, or a function returning one (called when
+                the first binary payload is sent)
+        """
+        self._binary.attach(server)
+
+    def _encode_binary(self, value, windows=()):
+        """
+        Internal: Replace a bytes-like value with a binary transport marker.
+        Handlers may return bytes, bytearray, memoryview or any buffer-protocol
+        object; the renderer receives an ArrayBuffer.
+
+        Args:
+            value: Value to send
+            windows: Windows receiving it (one fetch allowed per window)
+        """
+        view = as_buffer(value)
+        if view is None:
+            return value
+        owners = [id(self._native_window(window)) for window in windows]
+        return self._binary.put(view, max(len(owners), 1), owners)
+
+    def register_window(self, window):
+        """Internal: Track a window as a broadcast target (called by App)"""
+        with self._windows_lock:
+            if window not in self._windows:
+                self._windows.append(window)
+
+    def unregister_window(self, window):
+        """Internal: Forget a closed window and release its IPC state (called by App)"""
+        with self._windows_lock:
+            if window in self._windows:
+                self._windows.remove(window)
+
+        self.window_navigated(window)
+
+        native = self._native_window(window)
+        with self._calls_lock:
+            keys = [key for key in self._calls if key[0] == id(native)]
+            calls = [self._calls.pop(key) for key in keys]
+            for key in [key for key in self._early_cancels if key[0] == id(native)]:
+                del self._early_cancels[key]
+        for cancellation in calls:
+            cancellation.cancel()
+
+        with self._outbound_lock:
+            self._outbound.pop(native, None)
+        with self._subscriptions_lock:
+            self._subscriptions.pop(native, None)
+            self._subscription_reports.pop(native, None)
+
+    def _set_subscriptions(self, window, channels: Iterable[str], version=None):
+        """
+        Internal: Record the channels a renderer has listeners for.
+
+        Args:
+            window: Reporting window
+            channels: Every channel with a listener
+            version: [page, seq] stamp of the report; reports run on separate
+                bridge threads, so one older than the last applied is ignored
+        """
+        native = self._native_window(window)
+        page, seq = version if version else (None, None)
+        with self._subscriptions_lock:
+            added = frozenset()
+            last = self._subscription_reports.get(native)
+            if last is not None and page is not None and last[0] is not None:
+                if (page, seq) <= (last[0], last[1]):
+                    return  # Stale report
+                if page == last[0]:
+                    added = last[3]
+            reported = frozenset(channels)
+            self._subscription_reports[native] = (page, seq, reported, added)
+            self._subscriptions[native] = reported | added
+
+    def _add_subscription(self, window, channel: str, page=None):
+        """
+        Internal: Subscribe a renderer to a channel before it reports it.
+        Kept until the renderer's page changes, whatever it reports meanwhile.
+
+        Args:
+            window: Renderer window
+            channel: Channel to add
+            page: Page id of the renderer asking (from its requests)
+        """
+        native = self._native_window(window)
+        with self._subscriptions_lock:
+            last = self._subscription_reports.get(native)
+            if last is None or (
+                page is not None and last[0] is not None and page > last[0]
+            ):
+                # The page has not reported its own listeners yet
+                last = (page, 0, frozenset(), frozenset())
+            elif page is not None and last[0] is not None and page < last[0]:
+                return  # Request from a previous page
+            reported, added = last[2], last[3] | {channel}
+            self._subscription_reports[native] = (last[0], last[1], reported, added)
+            self._subscriptions[native] = reported | added
+
+    def configure_outbound(
+        self,
+        interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """
+        Configure how main -> renderer messages are coalesced.
+        Pending messages for a window are delivered in a single script
+        evaluation every `interval` seconds, or as soon as `max_batch`
+        messages are queued.
+
+        Args:
+            interval: Flush cadence in seconds (0 delivers every message immediately)
+            max_batch: Maximum number of messages per flush
+        """
+        with self._outbound_lock:
+            self._flush_interval = interval
+            self._flush_max_batch = max_batch
+            for queue in self._outbound.values():
+                queue.interval = interval
+                queue.max_batch = max_batch
+
+    def enable_metrics(self, enabled: bool = True, expose: bool = False):
+        """
+        Start (or stop) collecting per-channel metrics.
+        Collection is off by default and costs a single attribute check per
+        call while disabled.
+
+        Args:
+            enabled: Collect metrics (False stops and discards them)
+            expose: Also handle the "positron:stats" channel, so the renderer
+                can invoke('positron:stats') for an in-app dashboard
+        """
+        if not enabled:
+            self._metrics = None
+            route = self._routes.get(STATS_CHANNEL)
+            if route is not None and route.handler == self._handle_stats:
+                self.remove_listener(STATS_CHANNEL)
+            return
+
+        if self._metrics is None:
+            self._metrics = IPCMetrics()
+        if expose:
+            self.handle(STATS_CHANNEL, self._handle_stats)
+
+    def _handle_stats(self, event, channel: Optional[str] = None):
+        """Internal: Handler for the "positron:stats" channel"""
+        return self.stats(channel)
+
+    def stats(self, channel: Optional[str] = None) -> Optional[dict]:
+        """
+        Get the metrics collected since enable_metrics() (or reset_stats()).
+
+        For every channel: calls, errors, messages sent, latency and queue
+        wait (milliseconds) and encoded payload sizes in and out, each with
+        count/mean/min/p50/p95/p99/max.
+
+        Args:
+            channel: Only this channel (optional)
+
+        Returns:
+            {"since": timestamp, "channels": {channel: {...}}}, or None if
+            metrics are disabled
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return None
+        return metrics.snapshot(channel)
+
+    def reset_stats(self):
+        """Discard the collected metrics (if enabled)"""
+        if self._metrics is not None:
+            self._metrics = IPCMetrics()
+
+    def _register(
+        self,
+        channel: str,
+        handler: Callable,
+        executor: ExecutorSpec,
+        cache: Optional[ResultCache] = None,
+        single_flight: bool = False,
+        limiter: Optional[ChannelLimiter] = None,
+        priority: str = NORMAL,
+        renderer_cache: Optional[RendererCache] = None,
+    ):
+        """Internal: Register a handler and its options for a channel"""
+        executor = validate_executor(executor)
+        priority = validate_priority(priority)
+        with self._routes_lock:
+            route = self._routes.get(channel) or _Route(channel)
+            route.handler = handler
+            route.executor = None if executor == INLINE else executor
+            route.cache = cache
+            route.inflight = {} if single_flight else None
+            route.limiter = limiter
+            route.priority = priority
+            route.renderer_cache = renderer_cache
+            if renderer_cache is not None:
+                self._renderer_cached = True
+            self._routes.set(channel, route)
+
+    def on(
+        self,
+        channel: str,
+        handler: Optional[Callable] = None,
+        executor: ExecutorSpec = INLINE,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        overflow: str = REJECT,
+        priority: str = NORMAL,
+    ):
         """
         Register a handler for a channel.
         Handler receives (event, *args) where event contains sender information.
@@ -81,19 +467,36 @@ class IPCMain:
         Or called directly:
             ipc_main.on('channel', handler_function)
 
+        Handlers may also be ``async def`` coroutines; they run on the
+        App's event loop without blocking the bridge thread.
+
+        Channels may be wildcard patterns: "*" matches one ":"-separated
+        segment, or all remaining segments when it comes last ("log:*").
+
         Args:
-            channel: Channel name to listen on
+            channel: Channel name or pattern to listen on
             handler: Callback function(event, *args) (optional if used as decorator)
+            executor: Where the handler runs: "inline" (bridge thread, default),
+                "thread", "process" or a concurrent.futures.Executor
+            max_concurrency: Maximum number of calls running at once (optional)
+            max_queue: Maximum number of calls waiting for a slot (optional)
+            overflow: What happens when the queue is full: "reject" (default),
+                "drop_oldest" or "block"
+            priority: Scheduling priority on the thread pool: "interactive",
+                "normal" (default) or "background"
         """
+        limiter = make_limiter(channel, max_concurrency, max_queue, overflow)
 
         def decorator(func):
-            self._handlers[channel] = func
+            self._register(channel, func, executor, limiter=limiter, priority=priority)
             return func
 
         if handler is None:
             return decorator
         else:
-            self._handlers[channel] = handler
+            self._register(
+                channel, handler, executor, limiter=limiter, priority=priority
+            )
 
     def once(self, channel: str, handler: Callable):
         """
@@ -103,7 +506,10 @@ class IPCMain:
             channel: Channel name to listen on
             handler: Callback function(event, *args)
         """
-        self._once_handlers[channel] = handler
+        with self._routes_lock:
+            route = self._routes.get(channel) or _Route(channel)
+            route.once = handler
+            self._routes.set(channel, route)
 
     def remove_listener(self, channel: str):
         """
@@ -112,14 +518,13 @@ class IPCMain:
         Args:
             channel: Channel name
         """
-        if channel in self._handlers:
-            del self._handlers[channel]
-        if channel in self._once_handlers:
-            del self._once_handlers[channel]
+        with self._routes_lock:
+            self._routes.remove(channel)
 
     def remove_all_listeners(self, channel: Optional[str] = None):
         """
         Remove all listeners for a channel, or all listeners if no channel specified.
+        Positron's own "positron:" channels are kept unless named explicitly.
 
         Args:
             channel: Channel name (optional)
@@ -127,10 +532,24 @@ class IPCMain:
         if channel:
             self.remove_listener(channel)
         else:
-            self._handlers.clear()
-            self._once_handlers.clear()
+            with self._routes_lock:
+                for key, _ in self._routes.items():
+                    if not key.startswith(INTERNAL_PREFIX):
+                        self._routes.remove(key)
 
-    def handle(self, channel: str, handler: Optional[Callable] = None):
+    def handle(
+        self,
+        channel: str,
+        handler: Optional[Callable] = None,
+        executor: ExecutorSpec = INLINE,
+        cache=None,
+        single_flight: bool = False,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        overflow: str = REJECT,
+        priority: str = NORMAL,
+        renderer_cache=None,
+    ):
         """
         Register a handler that returns a value (for invoke/handle pattern).
         Similar to Electron's ipcMain.handle()
@@ -143,21 +562,192 @@ class IPCMain:
         Or called directly:
             ipc_main.handle('get-data', handler_function)
 
+        Handlers may also be ``async def`` coroutines; the invoke result
+        resolves once the coroutine completes on the App's event loop.
+
+        CPU-bound handlers can run off the bridge thread:
+            @ipc_main.handle('compute', executor='process')
+            def compute(event, data):
+                return heavy_numeric_work(data)
+
+        Process-pool handlers must be picklable (module-level functions) and
+        receive an event without a window.
+
+        Channels may be wildcard patterns: "*" matches one ":"-separated
+        segment, or all remaining segments when it comes last ("db:*").
+        Exact channels take precedence over patterns.
+
+        Results of pure lookups can be cached per channel and arguments:
+            @ipc_main.handle('user:get', cache={"maxsize": 256, "ttl": 30})
+            def get_user(event, user_id):
+                return db.load_user(user_id)
+
+        Cached results are returned without calling the handler until they
+        expire or are dropped with ipc_main.invalidate().
+
+        With single_flight=True, concurrent calls with equal arguments (from
+        any window) share one execution and all receive its result or error.
+
+        Bulk channels can be kept from starving the others:
+            @ipc_main.handle('import:row', max_concurrency=2, max_queue=100)
+            def import_row(event, row):
+                ...
+
+        Calls beyond max_concurrency wait for a slot; once max_queue calls are
+        waiting, new calls fail with IPCQueueFullError ("reject"), replace the
+        oldest waiting call ("drop_oldest") or wait for room ("block").
+
+        Pooled handlers are scheduled by priority, so quick UI lookups do not
+        wait behind queued bulk work:
+            @ipc_main.handle('ui:hover', executor='thread', priority='interactive')
+            def hover(event, item_id):
+                ...
+
+        Reference data can also be cached in the renderer, so repeated
+        invokes do not cross the bridge at all:
+            @ipc_main.handle('countries', cache=True, renderer_cache=True)
+            def countries(event):
+                return db.load_countries()
+
+        Renderers reuse a result until ipc_main.invalidate() is called for it
+        (or max_age passes), then revalidate it: an unchanged result is
+        answered with "not modified" instead of being sent again.
+
+        A bytes-like result (bytes, bytearray, memoryview, NumPy array)
+        reaches the renderer as an ArrayBuffer only when it is the whole
+        result. Nested inside a dict or list, bytes become a base64 string and
+        NumPy arrays nested lists; return the buffer on its own (or from a
+        separate channel) when the renderer needs the raw bytes.
+
         Args:
-            channel: Channel name to handle
+            channel: Channel name or pattern to handle
             handler: Callback function(event, *args) -> result (optional if used as decorator)
+            executor: Where the handler runs: "inline" (bridge thread, default),
+                "thread", "process" or a concurrent.futures.Executor
+            cache: Cache results: True (LRU of 128 entries), a maxsize, a dict
+                with maxsize/ttl/key options, or a ResultCache (default: None)
+            single_flight: Deduplicate concurrent calls with equal arguments
+                (default: False)
+            max_concurrency: Maximum number of calls running at once (optional)
+            max_queue: Maximum number of calls waiting for a slot (optional)
+            overflow: What happens when the queue is full: "reject" (default),
+                "drop_oldest" or "block"
+            priority: Scheduling priority on the thread pool: "interactive",
+                "normal" (default) or "background"
+            renderer_cache: Cache results in the renderer: True (until
+                invalidated), a max_age in seconds, a dict of options or a
+                RendererCache (default: None)
         """
+        result_cache = make_cache(cache)
+        limiter = make_limiter(channel, max_concurrency, max_queue, overflow)
+        validators = make_renderer_cache(renderer_cache)
 
         def decorator(func):
-            self._handlers[channel] = func
+            self._register(
+                channel,
+                func,
+                executor,
+                result_cache,
+                single_flight,
+                limiter,
+                priority,
+                validators,
+            )
             return func
 
         if handler is None:
             return decorator
         else:
-            self._handlers[channel] = handler
+            self._register(
+                channel,
+                handler,
+                executor,
+                result_cache,
+                single_flight,
+                limiter,
+                priority,
+                validators,
+            )
+
+    def _cached_route(self, channel: str):
+        """Internal: Find the route for a channel name or registered pattern"""
+        route = self._routes.get(channel)
+        if route is not None and is_pattern(channel):
+            return route, None  # The whole pattern
+        return self._routes.resolve(channel), channel
+
+    def invalidate(self, channel: str, *args):
+        """
+        Drop cached results of a handler registered with cache= or
+        renderer_cache=. Renderers are told to revalidate their copies.
+
+            ipc_main.invalidate('user:get', 42)  # one entry
+            ipc_main.invalidate('user:get')      # every entry for the channel
 
-    def _dispatch(self, channel: str, window, *args):
+        Args:
+            channel: Channel name, or a registered pattern to clear all its entries
+            *args: Only drop the result for these arguments (optional)
+        """
+        route, scope = self._cached_route(channel)
+        if route is None:
+            return
+        if route.cache is not None:
+            if scope is None:
+                route.cache.invalidate()
+            else:
+                route.cache.invalidate(scope, args if args else None)
+
+        validators = route.renderer_cache
+        if validators is not None:
+            if scope is None:
+                validators.invalidate()
+            elif args:
+                validators.invalidate(scope, self._validator_key(route, args))
+            else:
+                validators.invalidate(scope)
+            self.broadcast(CACHE_CHANNEL, channel, list(args) if args else None)
+
+    def cache_info(self, channel: str) -> Optional[CacheInfo]:
+        """
+        Get cache statistics for a handler registered with cache=.
+
+        Args:
+            channel: Channel name or registered pattern
+
+        Returns:
+            CacheInfo(hits, misses, maxsize, currsize), or None if not cached
+        """
+        route, _ = self._cached_route(channel)
+        if route is None or route.cache is None:
+            return None
+        return route.cache.info()
+
+    def mount(self, prefix: str, router: IPCRouter):
+        """
+        Mount a router's handlers under a namespace prefix.
+
+            db = IPCRouter()
+
+            @db.handle('query:*')
+            def query(event, sql):
+                ...
+
+            ipc_main.mount('db', db)  # handles "db:query:*"
+
+        Args:
+            prefix: Namespace (e.g. "db")
+            router: IPCRouter whose channels become "<prefix>:<channel>"
+        """
+        router._attach(self, prefix)
+
+    def _dispatch(
+        self,
+        channel: str,
+        window,
+        *args,
+        wait: bool = True,
+        cancellation: Optional[CancellationToken] = None,
+    ):
         """
         Internal: Dispatch a message to the appropriate handler.
 
@@ -165,34 +755,537 @@ class IPCMain:
             channel: Channel name
             window: The window that sent the message
             *args: Message arguments
+            wait: Wait for async/pooled handlers to complete (False for send())
+            cancellation: Token cancelled if the renderer aborts the call
 
         Returns:
             Handler result (for invoke pattern)
         """
-        event = IPCEvent(window)
+        future, result = self._start(channel, window, args, cancellation)
+        if future is None:
+            return result
+        if wait:
+            return future.result()
+        return None
+
+    def _start(
+        self,
+        channel: str,
+        window,
+        args,
+        cancellation: Optional[CancellationToken] = None,
+    ):
+        """
+        Internal: Start a handler without waiting for async/pooled work.
+
+        Inline handlers complete immediately; async handlers are scheduled on
+        the App event loop and pooled handlers are submitted to their executor.
+
+        Args:
+            channel: Channel name
+            window: The window that sent the message
+            args: Message arguments
+            cancellation: Token cancelled if the renderer aborts the call
+
+        Returns:
+            (future, result) - future is None when the result is already available
+        """
+        metrics = self._metrics
+        if cancellation is None and metrics is None:
+            return self._start_route(channel, window, args, None)
+
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+
+        if metrics is None:
+            future, result = self._start_route(channel, window, args, cancellation)
+        else:
+            future, result = self._start_measured(
+                metrics, channel, window, args, cancellation
+            )
+
+        if cancellation is not None and future is not None:
+            # Cancels async handlers and pooled handlers that have not started
+            cancellation.add_callback(future.cancel)
+        return future, result
+
+    def _start_measured(
+        self, metrics: IPCMetrics, channel: str, window, args, cancellation
+    ):
+        """Internal: Start a handler and record its latency, errors and input size"""
+        try:
+            metrics.record_in(channel, len(self.serializer.dumps(args)))
+        except Exception:
+            pass  # Python-side callers may pass values the codec cannot encode
+
+        started = time.perf_counter()
+        try:
+            future, result = self._start_route(channel, window, args, cancellation)
+        except Exception:
+            metrics.record_call(channel, started, error=True)
+            raise
+
+        if future is None:
+            metrics.record_call(channel, started)
+        else:
+
+            def record(done):
+                failed = done.cancelled() or done.exception() is not None
+                metrics.record_call(channel, started, error=failed)
+
+            future.add_done_callback(record)
+        return future, result
+
+    def _start_route(self, channel: str, window, args, cancellation):
+        """Internal: Resolve the route for a channel and start its handler"""
+        route = self._routes.resolve(channel)
+        if route is None:
+            print(
+                f"Warning: No handler registered for channel '{channel}'",
+                file=sys.stderr,
+            )
+            return None, None
+
+        event = IPCEvent(window, self, cancellation)
+
+        # Once handlers take precedence over the regular handler
+        if route.once is not None:
+            handler = self._take_once(route)
+            if handler is not None:
+                try:
+                    result = handler(event, *args)
+                except Exception as e:
+                    print(
+                        f"Error in once handler for '{channel}': {e}", file=sys.stderr
+                    )
+                    raise
+                if inspect.iscoroutine(result):
+                    return self._schedule_coroutine(channel, result)
+                return None, result
+
+        handler = route.handler
+        if handler is None:
+            print(
+                f"Warning: No handler registered for channel '{channel}'",
+                file=sys.stderr,
+            )
+            return None, None
+
+        cache = route.cache
+        if cache is None and route.inflight is None:
+            return self._invoke(route, channel, handler, event, args)
+
+        if cache is not None:
+            hit, result, token = cache.lookup(channel, args)
+            if hit:
+                return None, result
+
+        if route.inflight is not None:
+            future, result = self._single_flight(route, channel, handler, event, args)
+        else:
+            future, result = self._invoke(route, channel, handler, event, args)
+
+        if cache is not None:
+            self._cache_result(cache, token, future, result)
+        return future, result
 
-        # Check once handlers first
-        if channel in self._once_handlers:
-            handler = self._once_handlers.pop(channel)
+    def _invoke(self, route: _Route, channel: str, handler: Callable, event, args):
+        """Internal: Call a route's handler, within its concurrency limit"""
+        metrics = self._metrics
+        if metrics is not None:
+            handler = metrics.time_queue(channel, handler, route.executor)
+
+        limiter = route.limiter
+        if limiter is None:
+            return self._call_handler(route, channel, handler, event, args)
+
+        # A generator keeps the slot until it is exhausted or closed, so
+        # max_concurrency also limits the streams being pumped (process-pool
+        # handlers stay unwrapped: they must be picklable and cannot stream)
+        streaming = []
+        if route.executor != PROCESS and not is_process_pool(route.executor):
+            produce = handler
+
+            def handler(event, *args):
+                result = produce(event, *args)
+                if not is_stream_source(result):
+                    return result
+                streaming.append(True)
+                return hold_until_closed(result, limiter.release)
+
+        limiter.acquire(event._cancellation)
+        try:
+            future, result = self._call_handler(route, channel, handler, event, args)
+        except BaseException:
+            limiter.release()
+            raise
+
+        if future is None:
+            if not streaming:
+                limiter.release()
+        else:
+            future.add_done_callback(lambda _: streaming or limiter.release())
+        return future, result
+
+    def _call_handler(
+        self, route: _Route, channel: str, handler: Callable, event, args
+    ):
+        """Internal: Call a route's handler inline or on its executor"""
+        if route.executor is not None:
+            future = self._pools.submit(
+                route.executor, handler, event, args, route.priority
+            )
+            return self._watch_future(channel, future), None
+
+        try:
+            result = handler(event, *args)
+        except Exception as e:
+            print(f"Error in handler for '{channel}': {e}", file=sys.stderr)
+            raise
+
+        if inspect.iscoroutine(result):
+            return self._schedule_coroutine(channel, result)
+        return None, result
+
+    def _single_flight(
+        self, route: _Route, channel: str, handler: Callable, event, args
+    ):
+        """
+        Internal: Share one execution between concurrent calls with equal
+        arguments. The first caller runs the handler; callers arriving while
+        it is in flight wait on a shared future for the same result or error.
+        """
+        key = (channel, (route.cache.key if route.cache else make_key)(*args))
+        inflight = route.inflight
+        with self._inflight_lock:
+            shared = inflight.get(key)
+            if shared is not None:
+                return self._follow(shared), None
+            shared = Future()
+            inflight[key] = shared
+
+        def release():
+            with self._inflight_lock:
+                if inflight.get(key) is shared:
+                    del inflight[key]
+
+        try:
+            future, result = self._invoke(route, channel, handler, event, args)
+        except Exception as e:
+            release()
+            shared.set_exception(e)
+            raise
+
+        if future is None:
+            release()
+            shared.set_result(result)
+            return None, result
+
+        def forward(done):
+            release()
+            if done.cancelled():
+                shared.cancel()
+            elif done.exception() is not None:
+                shared.set_exception(done.exception())
+            else:
+                shared.set_result(done.result())
+
+        future.add_done_callback(forward)
+        return self._follow(shared), None
+
+    @staticmethod
+    def _follow(shared: Future) -> Future:
+        """
+        Internal: Per-caller view of a shared single-flight future.
+        Cancelling it detaches that caller without cancelling the shared work.
+        """
+        future = Future()
+
+        def copy(done):
             try:
-                return handler(event, *args)
-            except Exception as e:
-                print(f"Error in once handler for '{channel}': {e}", file=sys.stderr)
-                raise
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    future.set_exception(done.exception())
+                else:
+                    future.set_result(done.result())
+            except InvalidStateError:
+                pass  # Caller already cancelled
+
+        shared.add_done_callback(copy)
+        return future
 
-        # Check regular handlers
-        if channel in self._handlers:
-            handler = self._handlers[channel]
+    @staticmethod
+    def _cache_result(cache: ResultCache, token, future, result):
+        """Internal: Store a handler result once it is available"""
+        if future is None:
+            if not is_stream_source(result):
+                cache.store(token, result)
+            return
+
+        def store(done):
+            if done.cancelled() or done.exception() is not None:
+                return
+            value = done.result()
+            if not is_stream_source(value):
+                cache.store(token, value)
+
+        future.add_done_callback(store)
+
+    def _take_once(self, route: _Route) -> Optional[Callable]:
+        """Internal: Claim a route's pending once() handler (None if already taken)"""
+        with self._routes_lock:
+            handler, route.once = route.once, None
+            if route.handler is None and self._routes.get(route.pattern) is route:
+                self._routes.remove(route.pattern)
+        return handler
+
+    def _schedule_coroutine(self, channel: str, coro):
+        """
+        Internal: Schedule an async handler's coroutine on the App event loop.
+
+        Args:
+            channel: Channel name (for error reporting)
+            coro: Coroutine returned by the handler
+
+        Returns:
+            (future, result) as returned by _start()
+        """
+        import asyncio
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            # No App loop (e.g. used outside App.run()): run on this thread
             try:
-                return handler(event, *args)
+                return None, asyncio.run(coro)
             except Exception as e:
-                print(f"Error in handler for '{channel}': {e}", file=sys.stderr)
+                print(f"Error in async handler for '{channel}': {e}", file=sys.stderr)
                 raise
 
-        print(
-            f"Warning: No handler registered for channel '{channel}'", file=sys.stderr
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return self._watch_future(channel, future), None
+
+    def _watch_future(self, channel: str, future):
+        """Internal: Log handler errors raised through a future"""
+
+        def log_error(done):
+            if not done.cancelled() and done.exception() is not None:
+                print(
+                    f"Error in handler for '{channel}': {done.exception()}",
+                    file=sys.stderr,
+                )
+
+        future.add_done_callback(log_error)
+        return future
+
+    @staticmethod
+    def _validator_key(route: _Route, args):
+        """Internal: Arguments key of a renderer-cached call (None if unhashable)"""
+        key = route.cache.key if route.cache is not None else make_key
+        try:
+            result = key(*args)
+            hash(result)
+            return result
+        except TypeError:
+            return None
+
+    def _encode_result(self, channel: str, args, result, etag=None, window=None) -> str:
+        """
+        Internal: Encode an invoke result as JSON text.
+
+        Results of channels registered with renderer_cache= are sent with
+        their etag, or as NOT_MODIFIED when they match the renderer's copy.
+
+        Args:
+            channel: Channel name
+            args: Handler arguments
+            result: Handler result
+            etag: Etag of the renderer's cached copy (optional)
+            window: The calling window (optional)
+        """
+        route = self._routes.resolve(channel) if self._renderer_cached else None
+        validators = route.renderer_cache if route is not None else None
+        value = self._encode_binary(result, () if window is None else (window,))
+        if validators is None or value is not result:
+            return self.serializer.dumps(value)
+
+        # The same object served from the ResultCache needs no encoding
+        key = self._validator_key(route, args)
+        known = None
+        if key is not None and route.cache is not None:
+            known = validators.known_etag((channel, key), result)
+            if known is not None and known == etag:
+                return NOT_MODIFIED
+
+        text = self.serializer.dumps(result)
+        current = known or content_etag(text)
+        if key is not None:
+            validators.remember((channel, key), result, current)
+        if current == etag:
+            return NOT_MODIFIED
+        max_age = "null" if validators.max_age is None else repr(validators.max_age)
+        return (
+            f'{{"$positron":"cached","etag":"{current}","maxAge":{max_age},'
+            f'"value":{text}}}'
         )
-        return None
+
+    def _dispatch_batch(self, window, calls):
+        """
+        Internal: Dispatch several invoke calls received in one bridge crossing.
+        All calls are started before any is awaited, so async and pooled
+        handlers in the batch run concurrently.
+
+        Args:
+            window: The window that sent the batch
+            calls: List of [channel, args], [channel, args, call id] or
+                [channel, args, call id, etag] entries (the call id is sent
+                for invokes with an AbortSignal, the etag to revalidate a
+                renderer-cached result)
+
+        Returns:
+            JSON text of a list of {"value": result} or {"error": {...}}
+            entries, in call order
+        """
+        started = []
+        call_ids = []
+        for call in calls:
+            channel, args = call[0], call[1]
+            call_id = call[2] if len(call) > 2 else None
+            call_ids.append(call_id)
+            try:
+                unpacked_args = args if isinstance(args, (list, tuple)) else [args]
+                cancellation = self._begin_call(window, call_id)
+                started.append(
+                    self._start(channel, window, unpacked_args, cancellation)
+                )
+            except Exception as e:
+                started.append(e)
+
+        # Entries are encoded one by one, so a result that cannot be encoded
+        # only fails its own call
+        results = []
+        for call, entry, call_id in zip(calls, started, call_ids):
+            try:
+                if isinstance(entry, Exception):
+                    raise entry
+                future, result = entry
+                if future is not None:
+                    result = future.result()
+                result = collect(result, self._loop)
+                args = call[1] if isinstance(call[1], (list, tuple)) else [call[1]]
+                etag = call[3] if len(call) > 3 else None
+                encoded = self._encode_result(call[0], args, result, etag, window)
+                text = '{"value":' + encoded + "}"
+                metrics = self._metrics
+                if metrics is not None:
+                    metrics.record_out(call[0], len(text))
+            except CancelledError:
+                text = self.serializer.dumps(
+                    {"error": {"name": "AbortError", "message": "Aborted"}}
+                )
+            except Exception as e:
+                text = self.serializer.dumps(
+                    {"error": {"name": type(e).__name__, "message": str(e)}}
+                )
+            finally:
+                self._end_call(window, call_id)
+            results.append(text)
+        return "[" + ",".join(results) + "]"
+
+    def _begin_call(self, window, call_id) -> Optional[CancellationToken]:
+        """Internal: Get the cancellation token for a cancellable invoke"""
+        if call_id is None:
+            return None
+        key = (id(self._native_window(window)), call_id)
+        token = CancellationToken()
+        with self._calls_lock:
+            self._calls[key] = token
+            early = self._early_cancels.pop(key, False) is None
+        if early:
+            # The cancel raced ahead of its invoke
+            token.cancel()
+        return token
+
+    def _end_call(self, window, call_id):
+        """Internal: Forget a finished cancellable invoke"""
+        if call_id is None:
+            return
+        with self._calls_lock:
+            self._calls.pop((id(self._native_window(window)), call_id), None)
+
+    def _cancel_call(self, window, call_id):
+        """Internal: Cancel an invoke the renderer aborted"""
+        if call_id is None:
+            return
+        key = (id(self._native_window(window)), call_id)
+        with self._calls_lock:
+            token = self._calls.get(key)
+            if token is None:
+                # Finished already, or not started yet: remember it briefly
+                self._early_cancels[key] = None
+                self._early_cancels.move_to_end(key)
+                while len(self._early_cancels) > EARLY_CANCELS:
+                    self._early_cancels.popitem(last=False)
+                return
+        token.cancel()
+
+    def _open_stream(self, window, stream_id: str, channel: str, args, credit: int):
+        """
+        Internal: Start a streaming invoke.
+        Generator/async-generator results are sent chunk by chunk on the
+        internal stream channel; any other result is sent as a single chunk.
+
+        Args:
+            window: The window that opened the stream
+            stream_id: Id chosen by the renderer
+            channel: Channel name
+            args: Handler arguments
+            credit: Initial number of chunks the renderer accepts
+        """
+        key = (id(self._native_window(window)), stream_id)
+
+        def send(sid, kind, payload):
+            self.send_to_window(window, STREAM_CHANNEL, sid, kind, payload)
+
+        def close(stream):
+            with self._streams_lock:
+                if self._streams.get(key) is stream:
+                    del self._streams[key]
+
+        stream = IPCStream(stream_id, send, credit)
+        with self._streams_lock:
+            self._streams[key] = stream
+
+        try:
+            future, result = self._start(channel, window, args)
+            if future is not None:
+                result = future.result()
+        except Exception as e:
+            stream._fail(e)
+            close(stream)
+            return
+
+        stream.start(result, self._loop, close)
+
+    def _get_stream(self, window, stream_id: str) -> Optional[IPCStream]:
+        """Internal: Look up an open stream"""
+        with self._streams_lock:
+            return self._streams.get((id(self._native_window(window)), stream_id))
+
+    def window_navigated(self, window):
+        """
+        Internal: Release what the previous page of a window left open (called
+        by BrowserWindow when a new page loads). Streams its renderer never
+        closed are cancelled, so their generators and threads are freed, and
+        binary payloads it never fetched are dropped.
+        """
+        native = self._native_window(window)
+        with self._streams_lock:
+            keys = [key for key in self._streams if key[0] == id(native)]
+            streams = [self._streams.pop(key) for key in keys]
+        for stream in streams:
+            stream.cancel()
+        self._binary.release(id(native))
 
     def get_js_api(self, window):
         """
@@ -220,57 +1313,257 @@ class IPCMain:
             try:
                 # Unpack args list
                 unpacked_args = args if isinstance(args, (list, tuple)) else [args]
-                ipc_main._dispatch(channel, window, *unpacked_args)
+                self._dispatch(channel, window, *unpacked_args, wait=False)
                 return {"success": True}
             except Exception as e:
                 print(f"IPC send error: {e}", file=sys.stderr)
                 return {"success": False, "error": str(e)}
 
-        def ipc_invoke(channel, args):
+        def ipc_invoke(channel, args, call_id=None, etag=None):
             """
             Handle invoke() calls from JavaScript.
 
             Args:
                 channel: Channel name
                 args: List of arguments
+                call_id: Id used to cancel the call (sent with an AbortSignal)
+                etag: Etag of the renderer's cached copy (sent to revalidate)
 
             Returns:
-                Result from handler
+                JSON text of the handler result
             """
             try:
                 # Unpack args list
                 unpacked_args = args if isinstance(args, (list, tuple)) else [args]
-                result = ipc_main._dispatch(channel, window, *unpacked_args)
-                return result
+                result = self._dispatch(
+                    channel,
+                    window,
+                    *unpacked_args,
+                    cancellation=self._begin_call(window, call_id),
+                )
+                result = collect(result, self._loop)
+                text = self._encode_result(channel, unpacked_args, result, etag, window)
+                metrics = self._metrics
+                if metrics is not None:
+                    metrics.record_out(channel, len(text))
+                return text
+            except CancelledError:
+                raise
             except Exception as e:
                 print(f"IPC invoke error: {e}", file=sys.stderr)
                 raise
+            finally:
+                self._end_call(window, call_id)
+
+        def ipc_invoke_batch(calls):
+            """
+            Handle invoke() calls coalesced by the renderer into one crossing.
+
+            Args:
+                calls: List of [channel, args] pairs
+
+            Returns:
+                JSON text of the per-call results/errors, in call order
+            """
+            return self._dispatch_batch(window, calls)
+
+        def ipc_cancel(call_id):
+            """
+            Cancel an invoke whose AbortSignal fired.
+
+            Args:
+                call_id: Id sent with the invoke
+            """
+            self._cancel_call(window, call_id)
+
+        def ipc_stream_open(stream_id, channel, args, credit=DEFAULT_CREDIT):
+            """
+            Handle stream() calls from JavaScript.
+
+            Args:
+                stream_id: Id chosen by the renderer
+                channel: Channel name
+                args: List of arguments
+                credit: Number of chunks the renderer accepts up front
+            """
+            unpacked_args = args if isinstance(args, (list, tuple)) else [args]
+            self._open_stream(window, stream_id, channel, unpacked_args, credit)
+            return {"success": True}
+
+        def ipc_stream_credit(stream_id, credit):
+            """
+            Grant a stream more credit once the renderer consumed chunks.
+
+            Args:
+                stream_id: Stream id
+                credit: Number of additional chunks the renderer accepts
+            """
+            stream = self._get_stream(window, stream_id)
+            if stream is not None:
+                stream.add_credit(credit)
+
+        def ipc_stream_cancel(stream_id):
+            """
+            Stop a stream the renderer is no longer iterating.
+
+            Args:
+                stream_id: Stream id
+            """
+            stream = self._get_stream(window, stream_id)
+            if stream is not None:
+                stream.cancel()
+
+        def ipc_subscribe(channels, version=None):
+            """
+            Record the channels the renderer listens on (for broadcast()).
+
+            Args:
+                channels: Every channel with at least one listener
+                version: [page id, sequence number] ordering the reports
+            """
+            self._set_subscriptions(window, channels or (), version)
 
         # Attach methods to the API object
         api.ipc_send = ipc_send
         api.ipc_invoke = ipc_invoke
+        api.ipc_invoke_batch = ipc_invoke_batch
+        api.ipc_cancel = ipc_cancel
+        api.ipc_stream_open = ipc_stream_open
+        api.ipc_stream_credit = ipc_stream_credit
+        api.ipc_stream_cancel = ipc_stream_cancel
+        api.ipc_subscribe = ipc_subscribe
 
         return api
 
     def send_to_window(self, window, channel: str, *args):
         """
         Send a message to a renderer window.
+        Messages are queued per window and delivered in batches
+        (see configure_outbound()).
 
         Args:
             window: The BrowserWindow to send to
             channel: Channel name
             *args: Arguments to send
         """
-        if window and hasattr(window, "evaluate_js"):
-            js_args = ", ".join([repr(arg) for arg in args])
-            js_code = f"window.positron.ipcRenderer._receive('{channel}', {js_args})"
-            try:
-                window.evaluate_js(js_code)
-            except Exception as e:
-                print(
-                    f"Error sending to window on channel '{channel}': {e}",
-                    file=sys.stderr,
-                )
+        if not (window and hasattr(window, "evaluate_js")):
+            return
+
+        try:
+            message = self.serializer.dumps(
+                [channel, [self._encode_binary(arg, (window,)) for arg in args]]
+            )
+        except Exception as e:
+            print(
+                f"Error sending to window on channel '{channel}': {e}",
+                file=sys.stderr,
+            )
+            return
+
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.record_out(channel, len(message), sent=1)
+        self._get_outbound(window).put(message)
+
+    def broadcast(
+        self,
+        channel: str,
+        *args,
+        filter: Optional[Callable] = None,
+        subscribed_only: bool = False,
+    ) -> int:
+        """
+        Send a message to every open window.
+        The payload is encoded once and the same message is queued for each
+        window, so the cost does not grow with the number of windows.
+
+            ipc_main.broadcast('status', {"online": True})
+
+            # Only windows whose renderer listens on the channel
+            ipc_main.broadcast('status', status, subscribed_only=True)
+
+            # Only some windows
+            ipc_main.broadcast('theme', 'dark', filter=lambda win: win is not splash)
+
+        Args:
+            channel: Channel name
+            *args: Arguments to send
+            filter: Function(window) -> bool selecting target windows (optional)
+            subscribed_only: Skip windows without a renderer listener for the channel
+
+        Returns:
+            Number of windows the message was queued for
+        """
+        with self._windows_lock:
+            windows = list(self._windows)
+
+        targets = []
+        for window in windows:
+            native = self._native_window(window)
+            if not hasattr(native, "evaluate_js"):
+                continue
+            if subscribed_only and channel not in self._subscriptions.get(native, ()):
+                continue
+            if filter is not None and not filter(window):
+                continue
+            targets.append(native)
+
+        if not targets:
+            return 0
+
+        try:
+            message = self.serializer.dumps(
+                [channel, [self._encode_binary(arg, targets) for arg in args]]
+            )
+        except Exception as e:
+            print(f"Error broadcasting on channel '{channel}': {e}", file=sys.stderr)
+            return 0
+
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.record_out(channel, len(message), sent=len(targets))
+        for native in targets:
+            self._get_outbound(native).put(message)
+        return len(targets)
+
+    def flush(self, window=None):
+        """
+        Deliver queued messages immediately.
+
+        Args:
+            window: Window to flush (optional, all windows if omitted)
+        """
+        with self._outbound_lock:
+            if window is None:
+                queues = list(self._outbound.values())
+            else:
+                queue = self._outbound.get(self._native_window(window))
+                queues = [queue] if queue else []
+
+        for queue in queues:
+            queue.flush()
+
+    @staticmethod
+    def _native_window(window):
+        """Internal: Resolve a BrowserWindow to its underlying webview window"""
+        native = getattr(window, "window", None)
+        if native is not None and hasattr(native, "evaluate_js"):
+            return native
+        return window
+
+    def _get_outbound(self, window) -> OutboundQueue:
+        """Internal: Get or create the outbound queue for a window"""
+        window = self._native_window(window)
+        queue = self._outbound.get(window)
+        if queue is None:
+            with self._outbound_lock:
+                queue = self._outbound.get(window)
+                if queue is None:
+                    queue = OutboundQueue(
+                        window, self._flush_interval, self._flush_max_batch
+                    )
+                    self._outbound[window] = queue
+        return queue
 
 
 # Singleton instance
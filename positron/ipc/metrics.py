@@ -0,0 +1,252 @@
+"""
+IPC metrics
+Per-channel call counts, error counts, latency and queue-wait histograms and
+payload sizes. Disabled by default; enable with ipc_main.enable_metrics()
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .executors import PROCESS, is_process_pool
+
+STATS_CHANNEL = "positron:stats"
+
+# Histogram precision: 2**_SUB_BITS buckets per power of two (~3% error)
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS
+
+
+def _bucket(value: int) -> int:
+    """Internal: Histogram bucket index of a non-negative integer"""
+    if value < _SUB_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return ((shift + 1) << _SUB_BITS) + (value >> shift) - _SUB_COUNT
+
+
+def _bucket_value(index: int) -> int:
+    """Internal: Midpoint of a histogram bucket"""
+    if index < _SUB_COUNT:
+        return index
+    shift = (index >> _SUB_BITS) - 1
+    low = ((index & (_SUB_COUNT - 1)) + _SUB_COUNT) << shift
+    return low + (1 << shift) // 2
+
+
+class Histogram:
+    """
+    HDR-style histogram of non-negative integers.
+    Buckets are log-linear, so percentiles keep a bounded relative error
+    across the whole range while memory stays constant.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value: int):
+        """
+        Record a value.
+
+        Args:
+            value: Non-negative integer (e.g. microseconds or bytes)
+        """
+        value = max(int(value), 0)
+        index = _bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Get the value at a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Approximate value (0 if nothing was recorded)
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self, scale: float = 1.0) -> dict:
+        """
+        Summarize the histogram.
+
+        Args:
+            scale: Factor applied to every value (e.g. 0.001 for us -> ms)
+
+        Returns:
+            Dict with count, mean, min, p50, p95, p99 and max
+        """
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count * scale,
+            "min": self.min * scale,
+            "p50": self.percentile(50) * scale,
+            "p95": self.percentile(95) * scale,
+            "p99": self.percentile(99) * scale,
+            "max": self.max * scale,
+        }
+
+
+class ChannelStats:
+    """Metrics recorded for one channel"""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "sent",
+        "latency",
+        "queue_wait",
+        "bytes_in",
+        "bytes_out",
+        "lock",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.sent = 0  # Messages sent to renderers on this channel
+        self.latency = Histogram()  # Microseconds
+        self.queue_wait = Histogram()  # Microseconds
+        self.bytes_in = Histogram()
+        self.bytes_out = Histogram()
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> dict:
+        """Get the metrics as a JSON-compatible dict (times in milliseconds)"""
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "sent": self.sent,
+                "latency_ms": self.latency.summary(0.001),
+                "queue_wait_ms": self.queue_wait.summary(0.001),
+                "bytes_in": self.bytes_in.summary(),
+                "bytes_out": self.bytes_out.summary(),
+            }
+
+
+class IPCMetrics:
+    """
+    Collects ChannelStats for every channel.
+    Owned by IPCMain while metrics are enabled.
+    """
+
+    def __init__(self):
+        self._channels: Dict[str, ChannelStats] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def channel(self, channel: str) -> ChannelStats:
+        """Get (or create) the stats of a channel"""
+        stats = self._channels.get(channel)
+        if stats is None:
+            with self._lock:
+                stats = self._channels.setdefault(channel, ChannelStats())
+        return stats
+
+    def record_call(self, channel: str, started: float, error: bool = False):
+        """
+        Record a finished handler call.
+
+        Args:
+            channel: Channel name
+            started: time.perf_counter() when the call was dispatched
+            error: Whether the handler raised
+        """
+        elapsed = int((time.perf_counter() - started) * 1e6)
+        stats = self.channel(channel)
+        with stats.lock:
+            stats.calls += 1
+            if error:
+                stats.errors += 1
+            stats.latency.record(elapsed)
+
+    def record_wait(self, channel: str, queued: float):
+        """
+        Record the time a call waited before its handler started.
+
+        Args:
+            channel: Channel name
+            queued: time.perf_counter() when the call was queued
+        """
+        waited = int((time.perf_counter() - queued) * 1e6)
+        stats = self.channel(channel)
+        with stats.lock:
+            stats.queue_wait.record(waited)
+
+    def record_in(self, channel: str, size: int):
+        """Record the encoded size of a call's arguments"""
+        stats = self.channel(channel)
+        with stats.lock:
+            stats.bytes_in.record(size)
+
+    def record_out(self, channel: str, size: int, sent: int = 0):
+        """
+        Record the encoded size of a result or message.
+
+        Args:
+            channel: Channel name
+            size: Size of the encoded payload
+            sent: Number of renderer messages it was sent as (0 for results)
+        """
+        stats = self.channel(channel)
+        with stats.lock:
+            stats.bytes_out.record(size)
+            stats.sent += sent
+
+    def time_queue(self, channel: str, handler: Callable, executor) -> Callable:
+        """
+        Wrap a handler so the time until it starts is recorded as queue wait.
+        Process-pool handlers are returned unchanged (they must stay picklable).
+        """
+        if executor == PROCESS or is_process_pool(executor):
+            return handler
+        queued = time.perf_counter()
+
+        def timed(event, *args):
+            self.record_wait(channel, queued)
+            return handler(event, *args)
+
+        return timed
+
+    def snapshot(self, channel: Optional[str] = None) -> dict:
+        """
+        Get the collected metrics.
+
+        Args:
+            channel: Only this channel (optional)
+
+        Returns:
+            {"since": start time, "channels": {channel: stats}}
+        """
+        with self._lock:
+            channels = dict(self._channels)
+        if channel is not None:
+            channels = {channel: channels[channel]} if channel in channels else {}
+        return {
+            "since": self.started,
+            "channels": {name: stats.snapshot() for name, stats in channels.items()},
+        }
@@ -0,0 +1,90 @@
+"""
+Outbound message queue for main -> renderer delivery
+Coalesces messages so each flush costs a single script evaluation
+"""
+
+import sys
+import threading
+import weakref
+from typing import List, Optional
+
+DEFAULT_FLUSH_INTERVAL = 0.016  # One frame at 60 Hz
+DEFAULT_MAX_BATCH = 64
+
+
+class OutboundQueue:
+    """
+    Per-window queue of encoded IPC messages.
+    Messages are delivered to the preload script's _receiveBatch() entry point,
+    either when the flush interval elapses or when max_batch messages are pending.
+    """
+
+    def __init__(
+        self,
+        window,
+        interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """
+        Args:
+            window: Window to deliver to (anything with evaluate_js)
+            interval: Seconds to wait before flushing (0 delivers immediately)
+            max_batch: Flush as soon as this many messages are pending
+        """
+        self._window_ref = weakref.ref(window)
+        self.interval = interval
+        self.max_batch = max_batch
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Keeps flushes in order
+        self._timer: Optional[threading.Timer] = None
+
+    def put(self, message: str):
+        """
+        Queue an encoded message.
+
+        Args:
+            message: JSON array string of the form [channel, [args...]]
+        """
+        with self._lock:
+            self._pending.append(message)
+            flush_now = self.interval <= 0 or len(self._pending) >= self.max_batch
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self):
+        """Deliver all pending messages in one script evaluation"""
+        with self._flush_lock:
+            with self._lock:
+                messages = self._pending
+                self._pending = []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            if not messages:
+                return
+
+            window = self._window_ref()
+            if window is None:
+                return
+
+            js_code = (
+                "window.positron.ipcRenderer._receiveBatch(["
+                + ",".join(messages)
+                + "])"
+            )
+            try:
+                # run_js skips the eval/result round trip evaluate_js performs
+                run = getattr(window, "run_js", None) or window.evaluate_js
+                run(js_code)
+            except Exception as e:
+                print(
+                    f"Error delivering {len(messages)} IPC message(s): {e}",
+                    file=sys.stderr,
+                )
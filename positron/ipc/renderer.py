@@ -3,6 +3,8 @@ IPC Renderer Module for pywebview
 Uses pywebview's JS API for Python-JavaScript communication
 """
 
+from typing import Optional
+
 
 def get_ipc_renderer_script() -> str:
     """
@@ -14,41 +16,428 @@ def get_ipc_renderer_script() -> str:
 (function() {
     'use strict';
 
+    // Injected once per page; a second copy (e.g. load_html) is a no-op
+    if (window.positron && window.positron.ipcRenderer) {
+        return;
+    }
+
     // Storage for IPC callbacks
     const _ipcCallbacks = {};
     const _ipcOnceCallbacks = {};
     let _ipcMessageId = 0;
 
-    // Wait for pywebview API to be ready
-    window.addEventListener('pywebviewready', function() {
-        console.log('Pywebview API ready event fired, initializing Positron IPC');
-        initPositronIPC();
-    });
+    // Binary payloads arrive as markers resolved to ArrayBuffers
+    function _isBinary(value) {
+        return value !== null && typeof value === 'object' && value.$positron === 'binary';
+    }
+
+    function _resolveBinary(marker) {
+        if (marker.base64 !== undefined) {
+            const raw = atob(marker.base64);
+            const bytes = new Uint8Array(raw.length);
+            for (let i = 0; i < raw.length; i++) {
+                bytes[i] = raw.charCodeAt(i);
+            }
+            return Promise.resolve(bytes.buffer);
+        }
+        return fetch(marker.url, { cache: 'no-store' }).then(response => {
+            if (!response.ok) {
+                throw new Error('Failed to fetch binary payload: ' + response.status);
+            }
+            return response.arrayBuffer();
+        });
+    }
+
+    // Results of channels registered with renderer_cache= in Python, reused
+    // until invalidated (or maxAge passes) and then revalidated by etag
+    const CACHE_CHANNEL = 'positron:cache';
+    const CACHE_SIZE = 256;
+    const _invokeCache = new Map();  // channel + args -> entry, in LRU order
+    const _cachedChannels = {};
+
+    function _cacheKey(channel, args) {
+        return channel + '\\u0000' + JSON.stringify(args);
+    }
+
+    function _cacheStore(call, marker) {
+        const entry = call.cached || { channel: call.channel, key: _cacheKey(call.channel, call.args) };
+        entry.value = marker.value;
+        entry.etag = marker.etag;
+        _cacheRefresh(entry, marker.maxAge);
+    }
+
+    function _cacheRefresh(entry, maxAge) {
+        entry.stale = false;
+        if (maxAge !== undefined) {
+            entry.maxAge = maxAge;
+        }
+        entry.expires = entry.maxAge === null ? Infinity : Date.now() + entry.maxAge * 1000;
+        _cachedChannels[entry.channel] = true;
+        _invokeCache.delete(entry.key);
+        _invokeCache.set(entry.key, entry);
+        if (_invokeCache.size > CACHE_SIZE) {
+            _invokeCache.delete(_invokeCache.keys().next().value);
+        }
+    }
+
+    function _channelMatches(pattern, channel) {
+        if (pattern.indexOf('*') < 0) {
+            return pattern === channel;
+        }
+        const expected = pattern.split(':');
+        const actual = channel.split(':');
+        for (let i = 0; i < expected.length; i++) {
+            if (expected[i] === '*' && i === expected.length - 1) {
+                return actual.length >= expected.length;
+            }
+            if (i >= actual.length || (expected[i] !== '*' && expected[i] !== actual[i])) {
+                return false;
+            }
+        }
+        return actual.length === expected.length;
+    }
+
+    function _onCacheInvalidate(channel, args) {
+        // Entries are kept with their etag so the next invoke can revalidate them
+        const key = args ? _cacheKey(channel, args) : null;
+        _invokeCache.forEach(entry => {
+            if (key !== null ? entry.key === key : _channelMatches(channel, entry.channel)) {
+                entry.stale = true;
+            }
+        });
+    }
+
+    function _settle(call, value) {
+        if (value !== null && typeof value === 'object' && value.$positron === 'not-modified') {
+            _cacheRefresh(call.cached);
+            call.resolve(call.cached.value);
+            return;
+        }
+        if (value !== null && typeof value === 'object' && value.$positron === 'cached') {
+            _cacheStore(call, value);
+            value = value.value;
+        }
+        if (_isBinary(value)) {
+            _resolveBinary(value).then(call.resolve, call.reject);
+        } else {
+            call.resolve(value);
+        }
+    }
+
+    // Messages are delivered in order; once one needs a fetch, later ones wait
+    let _deliveryChain = null;
+
+    // Open streams by id; chunks arrive on an internal channel
+    const STREAM_CHANNEL = 'positron:stream';
+    const STREAM_CREDIT = 16;
+    const _streams = {};
+
+    function _onStreamMessage(id, kind, payload) {
+        const state = _streams[id];
+        if (!state) {
+            return;
+        }
+        if (kind === 'data') {
+            if (state.waiting) {
+                const waiting = state.waiting;
+                state.waiting = null;
+                _streamConsumed(id, state);
+                waiting.resolve({ value: payload, done: false });
+            } else {
+                state.buffer.push(payload);
+            }
+            return;
+        }
+
+        delete _streams[id];
+        if (kind === 'error') {
+            state.error = new Error(payload.message);
+            state.error.name = payload.name;
+        }
+        state.done = true;
+        if (state.waiting) {
+            const waiting = state.waiting;
+            state.waiting = null;
+            if (state.error) {
+                waiting.reject(state.error);
+            } else {
+                waiting.resolve({ value: undefined, done: true });
+            }
+        }
+    }
+
+    function _streamConsumed(id, state) {
+        // Return credit in halves so Python keeps a window of chunks in flight
+        state.consumed++;
+        if (state.consumed >= STREAM_CREDIT / 2 && !state.done) {
+            window.pywebview.api.ipc_stream_credit(id, state.consumed);
+            state.consumed = 0;
+        }
+    }
+
+    // Replica of the main process state (app.state), kept current with patches
+    const STATE_CHANNEL = 'positron:state';
+    const _state = { value: undefined, version: 0, loading: null, pending: null, listeners: [] };
 
-    function initPositronIPC() {
-        // Check if pywebview API is available
-        if (!window.pywebview || !window.pywebview.api) {
-            console.log('Pywebview API not available yet, retrying...');
-            setTimeout(initPositronIPC, 100);
+    function _splitPath(path) {
+        if (Array.isArray(path)) {
+            return path.map(String);
+        }
+        return path ? String(path).split('.').filter(key => key !== '') : [];
+    }
+
+    function _pointerKeys(pointer) {
+        return pointer.split('/').slice(1).map(key => key.replace(/~1/g, '/').replace(/~0/g, '~'));
+    }
+
+    function _stateAt(keys) {
+        let node = _state.value;
+        for (let i = 0; i < keys.length && node !== undefined; i++) {
+            node = node === null ? undefined : node[keys[i]];
+        }
+        return node;
+    }
+
+    // Copy-on-write: containers along the path are new objects, the rest is shared
+    function _applyOperation(node, keys, i, operation) {
+        if (i === keys.length) {
+            return operation.value;
+        }
+        const key = keys[i];
+        const last = i === keys.length - 1;
+        if (Array.isArray(node)) {
+            const copy = node.slice();
+            const index = key === '-' ? copy.length : Number(key);
+            if (last && operation.op === 'remove') {
+                copy.splice(index, 1);
+            } else if (last && operation.op === 'add') {
+                copy.splice(index, 0, operation.value);
+            } else {
+                copy[index] = _applyOperation(copy[index], keys, i + 1, operation);
+            }
+            return copy;
+        }
+        const copy = Object.assign({}, node);
+        if (last && operation.op === 'remove') {
+            delete copy[key];
+        } else {
+            copy[key] = _applyOperation(copy[key], keys, i + 1, operation);
+        }
+        return copy;
+    }
+
+    function _overlaps(a, b) {
+        const length = Math.min(a.length, b.length);
+        for (let i = 0; i < length; i++) {
+            if (a[i] !== b[i]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    function _notifyState(changed) {
+        _state.listeners.slice().forEach(listener => {
+            if (changed && !changed.some(keys => _overlaps(keys, listener.keys))) {
+                return;
+            }
+            const value = _stateAt(listener.keys);
+            if (listener.called && value === listener.last) {
+                return;
+            }
+            listener.called = true;
+            listener.last = value;
+            try {
+                listener.callback(value);
+            } catch (err) {
+                console.error('Error in state listener:', err);
+            }
+        });
+    }
+
+    function _onStatePatch(version, operations) {
+        if (_state.pending) {
+            _state.pending.push([version, operations]);
             return;
         }
+        if (version <= _state.version) {
+            return;
+        }
+        if (version !== _state.version + 1) {
+            // A change set was missed; rebuild the replica from a snapshot
+            _loadState(true);
+            return;
+        }
+        const changed = [];
+        operations.forEach(operation => {
+            const keys = _pointerKeys(operation.path);
+            _state.value = _applyOperation(_state.value, keys, 0, operation);
+            changed.push(keys[keys.length - 1] === '-' ? keys.slice(0, -1) : keys);
+        });
+        _state.version = version;
+        _notifyState(changed);
+    }
+
+    function _loadState(reload) {
+        if (_state.loading && !reload) {
+            return _state.loading;
+        }
+        const first = !_state.loading;
+        _state.pending = [];
+        const loading = window.positron.ipcRenderer.invoke(STATE_CHANNEL + ':snapshot', _pageId).then(snapshot => {
+            const pending = _state.pending;
+            _state.pending = null;
+            _state.value = snapshot.state;
+            _state.version = snapshot.version;
+            _notifyState(null);
+            pending.forEach(message => _onStatePatch(message[0], message[1]));
+            return _state.value;
+        }, err => {
+            _state.pending = null;
+            if (first) {
+                // Let the next ready() / get() / subscribe() try again
+                _state.loading = null;
+            }
+            throw err;
+        });
+        loading.catch(err => console.error('Failed to load shared state:', err));
+        if (first) {
+            _state.loading = loading;
+            _subscriptionsChanged();
+        }
+        return loading;
+    }
+
+    // Channels with listeners are reported to Python so broadcasts can skip
+    // windows that do not listen; changes in the same tick are sent once
+    let _subscriptionsDirty = false;
 
-        // If already initialized, don't reinitialize
-        if (window.positron && window.positron.ipcRenderer) {
-            console.log('Positron IPC already initialized');
+    // Reports cross the bridge on separate threads; Python orders them by
+    // page and sequence number and ignores any that arrive late
+    const _pageId = performance.timeOrigin || Date.now();
+    let _subscriptionSeq = 0;
+
+    function _subscriptionsChanged() {
+        if (_subscriptionsDirty) {
             return;
         }
+        _subscriptionsDirty = true;
+        queueMicrotask(function() {
+            _subscriptionsDirty = false;
+            const api = window.pywebview && window.pywebview.api;
+            if (api && api.ipc_subscribe) {
+                const channels = Object.keys(_ipcCallbacks);
+                if (_state.loading) {
+                    channels.push(STATE_CHANNEL);
+                }
+                api.ipc_subscribe(channels, [_pageId, ++_subscriptionSeq]);
+            }
+        });
+    }
 
-        // IPC Renderer API
+    // invoke(channel, ...args, { signal }) - options object carrying an AbortSignal
+    function _takeSignal(args) {
+        const last = args[args.length - 1];
+        if (typeof AbortSignal !== 'undefined' && last !== null && typeof last === 'object' &&
+            last.signal instanceof AbortSignal && Object.keys(last).length === 1) {
+            args.pop();
+            return last.signal;
+        }
+        return null;
+    }
+
+    function _abortError(signal) {
+        return signal.reason !== undefined ? signal.reason : new DOMException('The operation was aborted.', 'AbortError');
+    }
+
+    function _invokeFailed(call, err) {
+        if (!call.aborted) {
+            console.error('IPC invoke error:', err);
+        }
+        call.reject(err);
+    }
+
+    // Invokes issued in the same tick, sent to Python in one bridge crossing
+    let _invokeQueue = [];
+
+    function _flushInvokes() {
+        // Calls aborted before the flush are never sent
+        const calls = _invokeQueue.filter(call => !call.aborted);
+        _invokeQueue = [];
+        const api = window.pywebview.api;
+        calls.forEach(call => {
+            call.sent = true;
+        });
+
+        if (calls.length === 1 || (calls.length > 1 && !api.ipc_invoke_batch)) {
+            calls.forEach(call => {
+                api.ipc_invoke(call.channel, call.args, call.id, call.cached ? call.cached.etag : null).then(text => _settle(call, JSON.parse(text)), err => {
+                    _invokeFailed(call, err);
+                });
+            });
+            return;
+        }
+        if (calls.length === 0) {
+            return;
+        }
+
+        api.ipc_invoke_batch(calls.map(call => {
+            if (call.cached) {
+                return [call.channel, call.args, call.id, call.cached.etag];
+            }
+            return call.id === null ? [call.channel, call.args] : [call.channel, call.args, call.id];
+        })).then(text => {
+            JSON.parse(text).forEach((result, i) => {
+                if (result.error) {
+                    const err = new Error(result.error.message);
+                    err.name = result.error.name;
+                    _invokeFailed(calls[i], err);
+                } else {
+                    _settle(calls[i], result.value);
+                }
+            });
+        }, err => {
+            calls.forEach(call => _invokeFailed(call, err));
+        });
+    }
+
+    // Sent once ipcRenderer is set up (app.get_startup_timeline())
+    const READY_CHANNEL = 'positron:ready';
+
+    // Resolved once pywebview has exposed the Python API (ipcRenderer.ready)
+    let _resolveReady;
+    const _ready = new Promise(resolve => {
+        _resolveReady = resolve;
+    });
+    let _connected = false;
+
+    function _apiReady() {
+        const api = window.pywebview && window.pywebview.api;
+        return !!(api && api.ipc_invoke);
+    }
+
+    // The API object exists as soon as this script runs (before page scripts
+    // when injected at document start); calls wait for the bridge
+    function createIPCRenderer() {
         window.positron = window.positron || {};
 
         window.positron.ipcRenderer = {
+            /**
+             * Resolves with ipcRenderer once the Python bridge is connected.
+             * send() and invoke() calls made earlier are sent at that point.
+             */
+            ready: _ready,
+
             /**
              * Send a one-way message to the main process
              * @param {string} channel - Channel name
              * @param {...any} args - Arguments to send
              */
             send: function(channel, ...args) {
+                if (!_connected) {
+                    _ready.then(() => window.positron.ipcRenderer.send(channel, ...args));
+                    return;
+                }
                 if (window.pywebview && window.pywebview.api && window.pywebview.api.ipc_send) {
                     window.pywebview.api.ipc_send(channel, args).catch(err => {
                         console.error('IPC send error:', err);
@@ -60,22 +449,116 @@ def get_ipc_renderer_script() -> str:
 
             /**
              * Send a message and wait for reply (promise-based)
+             * Invokes issued in the same tick are batched into one bridge call.
+             * Pass { signal } as the last argument to make the call abortable:
+             * the promise rejects with an AbortError and Python cancels the handler.
+             * Results of channels registered with renderer_cache= are reused from
+             * a local cache until Python invalidates them.
              * @param {string} channel - Channel name
-             * @param {...any} args - Arguments to send
+             * @param {...any} args - Arguments to send, optionally followed by { signal }
              * @returns {Promise} - Promise that resolves with the response
              */
-            invoke: async function(channel, ...args) {
-                if (window.pywebview && window.pywebview.api && window.pywebview.api.ipc_invoke) {
-                    try {
-                        const result = await window.pywebview.api.ipc_invoke(channel, args);
-                        return result;
-                    } catch (err) {
-                        console.error('IPC invoke error:', err);
-                        throw err;
+            invoke: function(channel, ...args) {
+                if (!_connected) {
+                    return _ready.then(() => window.positron.ipcRenderer.invoke(channel, ...args));
+                }
+                const api = window.pywebview.api;
+                const signal = _takeSignal(args);
+                if (signal && signal.aborted) {
+                    return Promise.reject(_abortError(signal));
+                }
+                const cached = _cachedChannels[channel] ? _invokeCache.get(_cacheKey(channel, args)) : undefined;
+                if (cached && !cached.stale && cached.expires > Date.now()) {
+                    _invokeCache.delete(cached.key);
+                    _invokeCache.set(cached.key, cached);
+                    return Promise.resolve(cached.value);
+                }
+                return new Promise(function(resolve, reject) {
+                    const call = { channel: channel, args: args, resolve: resolve, reject: reject, id: null, cached: cached };
+                    if (signal) {
+                        call.id = 'c' + (++_ipcMessageId);
+                        const onAbort = function() {
+                            call.aborted = true;
+                            if (call.sent && api.ipc_cancel) {
+                                api.ipc_cancel(call.id);
+                            }
+                            reject(_abortError(signal));
+                        };
+                        signal.addEventListener('abort', onAbort, { once: true });
+                        call.resolve = function(value) {
+                            signal.removeEventListener('abort', onAbort);
+                            resolve(value);
+                        };
+                        call.reject = function(err) {
+                            signal.removeEventListener('abort', onAbort);
+                            reject(err);
+                        };
+                    }
+                    _invokeQueue.push(call);
+                    if (_invokeQueue.length === 1) {
+                        queueMicrotask(_flushInvokes);
+                    }
+                });
+            },
+
+            /**
+             * Invoke a streaming handler (generator / async generator in Python)
+             * Usage: for await (const chunk of ipcRenderer.stream(channel, ...args)) {}
+             * @param {string} channel - Channel name
+             * @param {...any} args - Arguments to send
+             * @returns {AsyncIterator} - Yields chunks as Python produces them
+             */
+            stream: function(channel, ...args) {
+                const id = 's' + (++_ipcMessageId);
+                const state = { buffer: [], waiting: null, done: false, error: null, consumed: 0, opened: false };
+                _streams[id] = state;
+
+                // Like send() and invoke(), a stream opened early starts once connected
+                const open = function() {
+                    if (state.done) {
+                        return;  // Closed with return() before the bridge was ready
                     }
+                    state.opened = true;
+                    window.pywebview.api.ipc_stream_open(id, channel, args, STREAM_CREDIT).catch(err => {
+                        _onStreamMessage(id, 'error', { name: err.name || 'Error', message: err.message || String(err) });
+                    });
+                };
+                if (_connected) {
+                    open();
                 } else {
-                    throw new Error('Pywebview API not ready for invoke');
+                    _ready.then(open);
                 }
+
+                return {
+                    [Symbol.asyncIterator]: function() {
+                        return this;
+                    },
+                    next: function() {
+                        if (state.buffer.length > 0) {
+                            _streamConsumed(id, state);
+                            return Promise.resolve({ value: state.buffer.shift(), done: false });
+                        }
+                        if (state.error) {
+                            return Promise.reject(state.error);
+                        }
+                        if (state.done) {
+                            return Promise.resolve({ value: undefined, done: true });
+                        }
+                        return new Promise(function(resolve, reject) {
+                            state.waiting = { resolve: resolve, reject: reject };
+                        });
+                    },
+                    return: function() {
+                        if (!state.done) {
+                            state.done = true;
+                            delete _streams[id];
+                            if (state.opened) {
+                                window.pywebview.api.ipc_stream_cancel(id);
+                            }
+                        }
+                        return Promise.resolve({ value: undefined, done: true });
+                    }
+                };
             },
 
             /**
@@ -86,6 +569,7 @@ def get_ipc_renderer_script() -> str:
             on: function(channel, callback) {
                 if (!_ipcCallbacks[channel]) {
                     _ipcCallbacks[channel] = [];
+                    _subscriptionsChanged();
                 }
                 _ipcCallbacks[channel].push(callback);
             },
@@ -111,9 +595,25 @@ def get_ipc_renderer_script() -> str:
             removeListener: function(channel, callback) {
                 if (_ipcCallbacks[channel]) {
                     _ipcCallbacks[channel] = _ipcCallbacks[channel].filter(cb => cb !== callback);
+                    if (_ipcCallbacks[channel].length === 0) {
+                        delete _ipcCallbacks[channel];
+                        _subscriptionsChanged();
+                    }
                 }
             },
 
+            /**
+             * Drop cached invoke results (channels with renderer_cache= in Python)
+             * @param {string} channel - Channel name (optional, default: every channel)
+             */
+            clearCache: function(channel) {
+                _invokeCache.forEach((entry, key) => {
+                    if (!channel || entry.channel === channel) {
+                        _invokeCache.delete(key);
+                    }
+                });
+            },
+
             /**
              * Remove all listeners for a channel
              * @param {string} channel - Channel name
@@ -124,6 +624,51 @@ def get_ipc_renderer_script() -> str:
                 } else {
                     Object.keys(_ipcCallbacks).forEach(key => delete _ipcCallbacks[key]);
                 }
+                _subscriptionsChanged();
+            },
+
+            /**
+             * Shared state from the main process (app.state)
+             * Usage: const unsubscribe = ipcRenderer.state.subscribe('user.theme', theme => {...})
+             */
+            state: {
+                /**
+                 * Load the replica; resolves with the whole state tree
+                 * @returns {Promise<object>}
+                 */
+                ready: function() {
+                    return _loadState(false);
+                },
+
+                /**
+                 * Read a value from the replica (undefined until ready() resolves)
+                 * @param {string|Array} path - Dotted path or array of keys ('' for the root)
+                 */
+                get: function(path) {
+                    _loadState(false);
+                    return _stateAt(_splitPath(path));
+                },
+
+                /**
+                 * Call back with the value at a path now and whenever it changes.
+                 * Unchanged values keep their identity, so callbacks can compare with ===
+                 * @param {string|Array} path - Dotted path or array of keys ('' for the root)
+                 * @param {function} callback - Callback function(value)
+                 * @returns {function} Function that removes the listener
+                 */
+                subscribe: function(path, callback) {
+                    const listener = { keys: _splitPath(path), callback: callback, called: false, last: undefined };
+                    _state.listeners.push(listener);
+                    if (_state.loading && !_state.pending) {
+                        listener.called = true;
+                        listener.last = _stateAt(listener.keys);
+                        callback(listener.last);
+                    }
+                    _loadState(false);
+                    return function() {
+                        _state.listeners = _state.listeners.filter(item => item !== listener);
+                    };
+                }
             },
 
             /**
@@ -131,6 +676,19 @@ def get_ipc_renderer_script() -> str:
              * This is called by Python via evaluate_js
              */
             _receive: function(channel, ...args) {
+                if (channel === STREAM_CHANNEL) {
+                    _onStreamMessage(...args);
+                    return;
+                }
+                if (channel === STATE_CHANNEL) {
+                    _onStatePatch(...args);
+                    return;
+                }
+                if (channel === CACHE_CHANNEL) {
+                    _onCacheInvalidate(...args);
+                    return;
+                }
+
                 const event = { sender: window.positron };
 
                 // Handle regular callbacks
@@ -143,36 +701,122 @@ def get_ipc_renderer_script() -> str:
                         }
                     });
                 }
+            },
+
+            /**
+             * Internal: Receive a batch of messages from main process
+             * Called by Python once per flush with [channel, args] pairs
+             */
+            _receiveBatch: function(messages) {
+                const ipcRenderer = window.positron.ipcRenderer;
+                messages.forEach(message => {
+                    const channel = message[0];
+                    const args = message[1];
+                    if (!_deliveryChain && !args.some(_isBinary)) {
+                        ipcRenderer._receive(channel, ...args);
+                        return;
+                    }
+                    const chain = (_deliveryChain || Promise.resolve())
+                        .then(() => Promise.all(args.map(arg => _isBinary(arg) ? _resolveBinary(arg) : arg)))
+                        .then(resolved => ipcRenderer._receive(channel, ...resolved))
+                        .catch(err => console.error('IPC receive error:', err));
+                    _deliveryChain = chain;
+                    chain.then(() => {
+                        if (_deliveryChain === chain) {
+                            _deliveryChain = null;
+                        }
+                    });
+                });
             }
         };
 
         // Alias for convenience (Electron-compatible)
         window.ipcRenderer = window.positron.ipcRenderer;
-
-        console.log('Positron IPC Renderer initialized with pywebview');
     }
 
-    // Try to initialize immediately in case pywebview is already ready
-    if (document.readyState === 'complete' || document.readyState === 'interactive') {
-        setTimeout(initPositronIPC, 0);
+    // Runs on pywebviewready, or right away when pywebview was set up first
+    function connect() {
+        if (_connected || !_apiReady()) {
+            return;
+        }
+        _connected = true;
+
+        // A new page starts without listeners; reset what the previous one reported
+        _subscriptionsChanged();
+
+        // Handshake: completes this window's startup timeline in Python
+        const navigation = performance.getEntriesByType && performance.getEntriesByType('navigation')[0];
+        window.positron.ipcRenderer.invoke(READY_CHANNEL, {
+            ready: performance.now(),
+            domContentLoaded: (navigation && navigation.domContentLoadedEventEnd) || null
+        }).catch(err => console.error('IPC handshake error:', err));
+
+        console.log('Positron IPC Renderer initialized with pywebview');
+        _resolveReady(window.positron.ipcRenderer);
+        // Pages cannot rely on pywebviewready: this script may run after it
+        window.dispatchEvent(new CustomEvent('positronready'));
     }
 
-    // Also try immediately (for when injected after page load)
-    initPositronIPC();
+    createIPCRenderer();
+    window.addEventListener('pywebviewready', connect);
+    connect();
 })();
 """
 
 
+def minify_script(source: str) -> str:
+    """
+    Strip comments, indentation and blank lines from a script.
+    Line breaks are kept, so automatic semicolon insertion is unaffected.
+    Only meant for the preload: regex literals must not contain quotes or
+    comment markers.
+
+    Args:
+        source: JavaScript source
+
+    Returns:
+        Minified source
+    """
+    out = []
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char in "'\"`":
+            # Copy string literals verbatim
+            end = i + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            out.append(source[i : end + 1])
+            i = end + 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = length if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+        else:
+            out.append(char)
+            i += 1
+
+    lines = (line.strip() for line in "".join(out).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
 class IPCRenderer:
     """
     Renderer-side IPC handler for pywebview.
     Provides utilities for working with the renderer's IPC.
     """
 
-    @staticmethod
-    def get_preload_script() -> str:
-        """Get the IPC renderer JavaScript to inject into pages"""
-        return get_ipc_renderer_script()
+    _preload: Optional[str] = None  # Minified on first use
+
+    @classmethod
+    def get_preload_script(cls) -> str:
+        """Get the IPC renderer JavaScript to inject into pages (minified)"""
+        if cls._preload is None:
+            cls._preload = minify_script(get_ipc_renderer_script())
+        return cls._preload
 
 
 ipc_renderer = IPCRenderer()
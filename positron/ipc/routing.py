@@ -0,0 +1,261 @@
+"""
+Channel routing for IPC
+Exact channels resolve with one dict lookup; wildcard patterns such as
+"db:*" or "db:*:list" are compiled into a segment trie
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SEPARATOR = ":"
+WILDCARD = "*"
+
+_MISSING = object()
+_CACHE_SIZE = 1024
+
+
+def is_pattern(channel: str) -> bool:
+    """Check if a channel name contains a wildcard segment"""
+    return WILDCARD in channel.split(SEPARATOR)
+
+
+def join(prefix: str, channel: str) -> str:
+    """Join a namespace prefix and a channel name ("db", "query" -> "db:query")"""
+    if not prefix:
+        return channel
+    return f"{prefix.rstrip(SEPARATOR)}{SEPARATOR}{channel}"
+
+
+class _Node:
+    """Internal: One segment of the wildcard trie"""
+
+    __slots__ = ("children", "wildcard", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.wildcard: Optional["_Node"] = None
+        self.value: Any = None
+
+
+def _insert(root: _Node, key: str, value: Any):
+    """Internal: Add a pattern to a trie"""
+    node = root
+    for segment in key.split(SEPARATOR):
+        if segment == WILDCARD:
+            if node.wildcard is None:
+                node.wildcard = _Node()
+            node = node.wildcard
+        else:
+            node = node.children.setdefault(segment, _Node())
+    node.value = value
+
+
+class RouteTable:
+    """
+    Maps channel names and patterns to values.
+
+    Pattern syntax (segments separated by ":"):
+        - "*" matches exactly one segment ("db:*:list" matches "db:users:list")
+        - a trailing "*" matches one or more segments ("db:*" matches
+          "db:query" and "db:query:users")
+
+    Exact names always win over patterns, and literal segments win over
+    wildcards. Wildcard lookups are O(depth) and cached until the table changes.
+
+    Changes must be serialized by the caller. resolve() takes no lock and
+    always sees a complete trie: removals build a new one and swap it in.
+    """
+
+    def __init__(self):
+        self._exact: Dict[str, Any] = {}
+        self._patterns: Dict[str, Any] = {}
+        self._root = _Node()
+        self._cache: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Any:
+        """
+        Get the value registered for an exact name or pattern (no matching).
+
+        Args:
+            key: Channel name or pattern as registered
+
+        Returns:
+            The value or None
+        """
+        value = self._exact.get(key)
+        if value is None:
+            value = self._patterns.get(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        """
+        Register a value for a channel name or pattern.
+
+        Args:
+            key: Channel name or pattern
+            value: Value to resolve to
+        """
+        if is_pattern(key):
+            _insert(self._root, key, value)
+            self._patterns[key] = value
+        else:
+            self._exact[key] = value
+        self._cache = {}
+
+    def remove(self, key: str) -> Any:
+        """
+        Remove a channel name or pattern.
+
+        Args:
+            key: Channel name or pattern as registered
+
+        Returns:
+            The removed value or None
+        """
+        if key in self._exact:
+            value = self._exact.pop(key)
+        elif key in self._patterns:
+            patterns = dict(self._patterns)
+            value = patterns.pop(key)
+            self._rebuild(patterns)
+        else:
+            return None
+        self._cache = {}
+        return value
+
+    def clear(self):
+        """Remove everything"""
+        self._exact = {}
+        self._rebuild({})
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """List (name or pattern, value) pairs"""
+        return list(self._exact.items()) + list(self._patterns.items())
+
+    def resolve(self, channel: str) -> Any:
+        """
+        Find the value for a concrete channel name.
+
+        Args:
+            channel: Channel name received from the renderer
+
+        Returns:
+            The exact match, else the most specific pattern match, else None
+        """
+        value = self._exact.get(channel)
+        if value is not None or not self._patterns:
+            return value
+
+        # Resolutions are stored in the cache dict current at lookup start,
+        # so a concurrent change (which swaps the dict) cannot be overwritten
+        cache = self._cache
+        value = cache.get(channel, _MISSING)
+        if value is _MISSING:
+            value = self._match(self._root, channel.split(SEPARATOR), 0)
+            if len(cache) >= _CACHE_SIZE:
+                cache.clear()
+            cache[channel] = value
+        return value
+
+    def _match(self, node: _Node, segments: List[str], index: int) -> Any:
+        """Internal: Depth-first trie match preferring literal segments"""
+        if index == len(segments):
+            return node.value
+
+        child = node.children.get(segments[index])
+        if child is not None:
+            value = self._match(child, segments, index + 1)
+            if value is not None:
+                return value
+
+        wildcard = node.wildcard
+        if wildcard is not None:
+            value = self._match(wildcard, segments, index + 1)
+            if value is not None:
+                return value
+            # A trailing wildcard swallows the remaining segments
+            return wildcard.value
+        return None
+
+    def _rebuild(self, patterns: Dict[str, Any]):
+        """Internal: Build a trie from patterns and swap both in"""
+        root = _Node()
+        for key, value in patterns.items():
+            _insert(root, key, value)
+        self._root = root
+        self._patterns = patterns
+        self._cache = {}
+
+
+class IPCRouter:
+    """
+    A group of IPC handlers registered under a common namespace.
+
+    Handlers are registered with the same API as ipc_main and take effect
+    once the router is mounted:
+
+        db = IPCRouter()
+
+        @db.handle('query:*')
+        def query(event, sql):
+            ...
+
+        ipc_main.mount('db', db)  # handles "db:query:*"
+
+    Routers can be nested, and handlers added after mounting are forwarded
+    to every parent.
+    """
+
+    def __init__(self):
+        self._registrations: List[Tuple[str, str, Callable, dict]] = []
+        self._parents: List[Tuple[Any, str]] = []
+
+    def on(self, channel: str, handler: Optional[Callable] = None, **options):
+        """
+        Register a handler for a channel (see IPCMain.on()).
+
+        Args:
+            channel: Channel name or pattern, relative to the mount prefix
+            handler: Callback function(event, *args) (optional if used as decorator)
+            **options: Options forwarded to IPCMain.on()
+        """
+        return self._add("on", channel, handler, options)
+
+    def handle(self, channel: str, handler: Optional[Callable] = None, **options):
+        """
+        Register a handler that returns a value (see IPCMain.handle()).
+
+        Args:
+            channel: Channel name or pattern, relative to the mount prefix
+            handler: Callback function(event, *args) -> result (optional if used as decorator)
+            **options: Options forwarded to IPCMain.handle()
+        """
+        return self._add("handle", channel, handler, options)
+
+    def mount(self, prefix: str, router: "IPCRouter"):
+        """
+        Mount another router under a namespace prefix.
+
+        Args:
+            prefix: Namespace (e.g. "db")
+            router: Router whose channels become "<prefix>:<channel>"
+        """
+        router._attach(self, prefix)
+
+    def _add(self, kind: str, channel: str, handler: Optional[Callable], options):
+        """Internal: Record a registration and forward it to mounted parents"""
+
+        def decorator(func):
+            self._registrations.append((kind, channel, func, options))
+            for parent, prefix in self._parents:
+                getattr(parent, kind)(join(prefix, channel), func, **options)
+            return func
+
+        if handler is None:
+            return decorator
+        decorator(handler)
+
+    def _attach(self, parent, prefix: str):
+        """Internal: Register everything with a parent under prefix"""
+        self._parents.append((parent, prefix))
+        for kind, channel, handler, options in self._registrations:
+            getattr(parent, kind)(join(prefix, channel), handler, **options)
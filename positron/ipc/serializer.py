@@ -0,0 +1,115 @@
+"""
+Serialization of IPC payloads
+One codec shared by every main -> renderer path; uses orjson when installed
+and falls back to the standard library json module
+"""
+
+import base64
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import pathlib
+import uuid
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+def to_jsonable(obj):
+    """
+    Convert a value the JSON encoder does not support natively.
+    Used as the ``default`` hook of both the orjson and stdlib encoders.
+
+    Handles dataclasses, datetimes, bytes (base64), sets, Decimal, UUID,
+    paths, enums and NumPy arrays/scalars.
+
+    Args:
+        obj: Value to convert
+
+    Returns:
+        A JSON-compatible replacement
+
+    Raises:
+        TypeError: If the value cannot be converted
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode("ascii")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (decimal.Decimal, uuid.UUID, pathlib.PurePath)):
+        return str(obj)
+    if type(obj).__module__ == "numpy":
+        # ndarray -> nested lists, numpy scalar -> Python scalar
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        if hasattr(obj, "item"):
+            return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Serializer:
+    """
+    JSON codec for IPC payloads.
+    Custom serializers can replace it via ipc_main.set_serializer(); they only
+    need a dumps(obj) -> str method.
+    """
+
+    def __init__(self, use_orjson: bool = True):
+        """
+        Args:
+            use_orjson: Use orjson when it is installed (default: True)
+        """
+        self.use_orjson = use_orjson and orjson is not None
+        if self.use_orjson:
+            self._orjson_options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    @property
+    def name(self) -> str:
+        """Name of the backend in use ("orjson" or "json")"""
+        return "orjson" if self.use_orjson else "json"
+
+    def dumps(self, obj) -> str:
+        """
+        Encode a value as JSON text.
+
+        Args:
+            obj: Value to encode
+
+        Returns:
+            JSON string
+        """
+        if self.use_orjson:
+            try:
+                return orjson.dumps(
+                    obj, default=to_jsonable, option=self._orjson_options
+                ).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder handles those
+                pass
+        return json.dumps(
+            obj, default=to_jsonable, ensure_ascii=False, separators=(",", ":")
+        )
+
+    def loads(self, data):
+        """
+        Decode JSON text.
+
+        Args:
+            data: JSON string or bytes
+
+        Returns:
+            Decoded value
+        """
+        if self.use_orjson:
+            return orjson.loads(data)
+        return json.loads(data)
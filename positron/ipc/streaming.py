@@ -0,0 +1,283 @@
+"""
+Streaming IPC responses
+Pumps generator/async-generator handler results to the renderer chunk by chunk,
+with credit-based backpressure so Python never runs ahead of the consumer
+"""
+
+import inspect
+import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+
+STREAM_CHANNEL = "positron:stream"
+DEFAULT_CREDIT = 16
+# Seconds a producer waits for the renderer to ask for more before giving up
+CREDIT_TIMEOUT = 60.0
+
+
+def is_stream_source(value) -> bool:
+    """Check if a handler result is a generator or async generator"""
+    return inspect.isgenerator(value) or inspect.isasyncgen(value)
+
+
+def hold_until_closed(source, release: Callable):
+    """
+    Wrap a generator so a resource is released once it is exhausted, closed
+    or garbage collected (e.g. a channel's concurrency slot held by a stream).
+
+    Args:
+        source: Generator or async generator
+        release: Called once when the wrapper finishes
+
+    Returns:
+        A generator of the same kind yielding source's items
+    """
+    lock = threading.Lock()
+    released = []
+
+    def release_once():
+        with lock:
+            if released:
+                return
+            released.append(True)
+        release()
+
+    if inspect.isasyncgen(source):
+
+        async def wrapper():
+            try:
+                async for item in source:
+                    yield item
+            finally:
+                await source.aclose()
+                release_once()
+
+    else:
+
+        def wrapper():
+            try:
+                yield from source
+            finally:
+                release_once()
+
+    generator = wrapper()
+    # Closing a generator that never started skips its finally block
+    weakref.finalize(generator, release_once)
+    return generator
+
+
+def collect(value, loop: Optional["asyncio.AbstractEventLoop"] = None):
+    """
+    Materialize a generator/async-generator result for a plain invoke().
+
+    Args:
+        value: Handler result
+        loop: Event loop async generators are consumed on (optional)
+
+    Returns:
+        A list of all yielded items, or value unchanged if it is not a generator
+    """
+    if inspect.isgenerator(value):
+        return list(value)
+    if inspect.isasyncgen(value):
+        import asyncio
+
+        async def drain():
+            return [item async for item in value]
+
+        if loop is None or loop.is_closed():
+            return asyncio.run(drain())
+        return asyncio.run_coroutine_threadsafe(drain(), loop).result()
+    return value
+
+
+class IPCStream:
+    """
+    A single streaming invoke.
+    The renderer grants credit (number of chunks it is ready to receive);
+    each chunk sent consumes one credit and the producer pauses at zero.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        send: Callable,
+        credit: int = DEFAULT_CREDIT,
+        credit_timeout: Optional[float] = CREDIT_TIMEOUT,
+    ):
+        """
+        Args:
+            stream_id: Id chosen by the renderer
+            send: Function(stream_id, kind, payload) delivering a stream message
+            credit: Initial number of chunks the renderer accepts
+            credit_timeout: Seconds to wait for more credit before treating the
+                stream as abandoned and closing the generator (None: forever)
+        """
+        self.stream_id = stream_id
+        self._send = send
+        self._credit = max(int(credit), 1)
+        self.credit_timeout = credit_timeout
+        self._cancelled = False
+        self._cond = threading.Condition()
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._wakeup: Optional["asyncio.Event"] = None
+
+    def add_credit(self, credit: int):
+        """
+        Allow the producer to send more chunks.
+
+        Args:
+            credit: Number of additional chunks the renderer accepts
+        """
+        with self._cond:
+            self._credit += int(credit)
+            self._cond.notify_all()
+        self._wake_async()
+
+    def cancel(self):
+        """Stop the producer (renderer stopped iterating)"""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+        self._wake_async()
+
+    def _wake_async(self):
+        """Internal: Wake an async producer waiting for credit"""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def start(
+        self,
+        source,
+        loop: Optional["asyncio.AbstractEventLoop"] = None,
+        on_close: Optional[Callable] = None,
+    ):
+        """
+        Start pumping a handler result to the renderer.
+
+        Sync generators are pumped on a dedicated thread, async generators on
+        the App event loop (or a dedicated thread without one). Any other value
+        is sent as a single chunk.
+
+        Args:
+            source: Generator, async generator or plain value
+            loop: App event loop (optional)
+            on_close: Called once the stream has finished
+        """
+
+        def finish(*_):
+            if on_close is not None:
+                on_close(self)
+
+        if inspect.isasyncgen(source) and loop is not None and not loop.is_closed():
+            import asyncio
+
+            future = asyncio.run_coroutine_threadsafe(self._pump_async(source), loop)
+            future.add_done_callback(finish)
+            return
+
+        if not is_stream_source(source):
+            self._send(self.stream_id, "data", source)
+            self._send(self.stream_id, "end", None)
+            finish()
+            return
+
+        def run():
+            try:
+                if inspect.isasyncgen(source):
+                    import asyncio
+
+                    asyncio.run(self._pump_async(source))
+                else:
+                    self._pump_sync(source)
+            finally:
+                finish()
+
+        threading.Thread(
+            target=run, name=f"positron-stream-{self.stream_id}", daemon=True
+        ).start()
+
+    def _acquire(self) -> bool:
+        """Internal: Block until one credit is available; False if cancelled"""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._credit > 0 or self._cancelled, self.credit_timeout
+            ):
+                self._abandon()
+            if self._cancelled:
+                return False
+            self._credit -= 1
+            return True
+
+    async def _acquire_async(self) -> bool:
+        """Internal: Wait until one credit is available; False if cancelled"""
+        import asyncio
+
+        while True:
+            with self._cond:
+                if self._cancelled:
+                    return False
+                if self._credit > 0:
+                    self._credit -= 1
+                    return True
+                self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.credit_timeout)
+            except asyncio.TimeoutError:
+                with self._cond:
+                    if self._credit <= 0:
+                        self._abandon()
+
+    def _abandon(self):
+        """Internal: Give up on a renderer that stopped asking for chunks"""
+        print(
+            f"Stream {self.stream_id} closed: no credit for {self.credit_timeout}s",
+            file=sys.stderr,
+        )
+        self._cancelled = True
+
+    def _pump_sync(self, generator):
+        """Internal: Send chunks from a sync generator"""
+        try:
+            while self._acquire():
+                try:
+                    chunk = next(generator)
+                except StopIteration:
+                    self._send(self.stream_id, "end", None)
+                    return
+                self._send(self.stream_id, "data", chunk)
+            generator.close()
+        except Exception as e:
+            self._fail(e)
+
+    async def _pump_async(self, generator):
+        """Internal: Send chunks from an async generator"""
+        import asyncio
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            while await self._acquire_async():
+                try:
+                    chunk = await generator.__anext__()
+                except StopAsyncIteration:
+                    self._send(self.stream_id, "end", None)
+                    return
+                self._send(self.stream_id, "data", chunk)
+            await generator.aclose()
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, error: Exception):
+        """Internal: Report a producer error to the renderer"""
+        print(f"Error in stream {self.stream_id}: {error}", file=sys.stderr)
+        self._send(
+            self.stream_id,
+            "error",
+            {"name": type(error).__name__, "message": str(error)},
+        )
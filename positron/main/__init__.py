@@ -1,6 +1,21 @@
 """Main process modules for Positron"""
 
-from .app import App
-from .browser_window import BrowserWindow
+from typing import TYPE_CHECKING
 
-__all__ = ["App", "BrowserWindow"]
+from ..common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "App": ".app",
+        "BrowserWindow": ".browser_window",
+        "StateStore": ".state",
+    },
+)
+
+if TYPE_CHECKING:
+    from .app import App
+    from .browser_window import BrowserWindow
+    from .state import StateStore
+
+__all__ = ["App", "BrowserWindow", "StateStore"]
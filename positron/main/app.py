@@ -4,9 +4,21 @@ Similar to Electron's app module - manages application lifecycle
 """
 
 import sys
-from typing import Callable
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
-import webview
+from ..ipc import ipc_main
+from ..ipc.executors import HandlerPools
+from .event_loop import EventLoopThread
+from .state import StateStore
+from .timeline import READY_CHANNEL, startup_timeline
+from .window_pool import WindowPool
+
+if TYPE_CHECKING:
+    from ..common.loopback import LoopbackServer
+    from ..renderer.asset_server import AssetServer
 
 
 class App:
@@ -27,6 +39,7 @@ class App:
         if self._initialized:
             return
 
+        started = time.perf_counter()
         self._initialized = True
         self.windows = []
         self._ready_callbacks = []
@@ -36,6 +49,19 @@ class App:
         self._is_ready = False
         self._is_quitting = False
         self._webview_started = False
+        self._event_loop = EventLoopThread()
+        self._handler_pools = HandlerPools()
+        ipc_main.set_pools(self._handler_pools)
+        self._server: Optional["LoopbackServer"] = None  # Created by _loopback()
+        self._server_lock = threading.Lock()
+        ipc_main.set_loopback_server(self._loopback)
+        self._assets: Optional["AssetServer"] = None  # Set by serve_assets()
+        self._window_pool = WindowPool()  # Filled by prewarm_windows()
+        self.state = StateStore()  # Shared with renderers (ipcRenderer.state)
+        self.state.attach(ipc_main)
+        self._trace_path: Optional[str] = None  # Set by trace_startup()
+        ipc_main.handle(READY_CHANNEL, self._on_renderer_ready)
+        startup_timeline.record("App.__init__", started, time.perf_counter())
 
     def on(self, event: str, callback: Callable):
         """
@@ -73,8 +99,10 @@ class App:
         """Internal: Emit ready event"""
         self._is_ready = True
         for callback in self._ready_callbacks:
+            name = getattr(callback, "__qualname__", repr(callback))
             try:
-                callback()
+                with startup_timeline.span("ready callback", callback=name):
+                    callback()
             except Exception as e:
                 print(f"Error in ready callback: {e}", file=sys.stderr)
 
@@ -106,16 +134,126 @@ class App:
             except Exception as e:
                 print(f"Error in quit callback: {e}", file=sys.stderr)
 
+    def _loopback(self) -> "LoopbackServer":
+        """Internal: The app's loopback server, created on first use"""
+        with self._server_lock:
+            if self._server is None:
+                # http.server is only imported once something is served
+                from ..common.loopback import LoopbackServer
+
+                self._server = LoopbackServer()
+            return self._server
+
+    def serve_assets(self, root: str, spa: bool = True) -> "AssetServer":
+        """
+        Serve a built frontend from the App's loopback server.
+        Used by BrowserWindow.load_app(); one directory is served per App.
+
+        Args:
+            root: Directory of built assets (e.g. "frontend/dist") or a
+                packed archive (e.g. "app.pak")
+            spa: Serve index.html for unknown client-side routes (default: True)
+
+        Returns:
+            The AssetServer (its url is the app's index page)
+        """
+        from ..renderer.asset_server import AssetServer
+
+        root = Path(root).resolve()
+        if self._assets is None:
+            self._assets = AssetServer(root, spa=spa)
+            self._assets.mount(self._loopback())
+        elif self._assets.root != root:
+            raise ValueError(f"Already serving assets from {self._assets.root}")
+        return self._assets
+
+    def _on_renderer_ready(self, event, timings=None):
+        """
+        Internal: Handshake sent by each page once its ipcRenderer is set up.
+        Completes the startup timeline of the window it came from.
+        """
+        for window in self.windows:
+            if window.window is event.window:
+                window._startup_complete(timings or {})
+                break
+
+        path = self._trace_path
+        if path is not None:
+            self._trace_path = None
+            try:
+                self.dump_startup_timeline(path)
+                print(f"Startup trace written to {path}")
+            except OSError as e:
+                print(f"Error writing startup trace: {e}", file=sys.stderr)
+
+    def get_startup_timeline(self) -> list:
+        """
+        Get the timestamps of each launch phase.
+
+        Phases: "import" (from `import positron` until the App module is
+        loaded), "App.__init__", each "ready callback", each "BrowserWindow"
+        creation, "webview.start", and per window "shown", "preload",
+        "loaded" and "handshake" (the renderer's first IPC round trip).
+
+        Returns:
+            [{"name", "start", "duration", "thread", ...}] ordered by start;
+            times are milliseconds since `import positron`, duration is None
+            for instants
+        """
+        return startup_timeline.events()
+
+    def dump_startup_timeline(self, path: str):
+        """
+        Write the startup timeline as a Chrome trace file.
+
+        Args:
+            path: File to write (open it in chrome://tracing or Perfetto)
+        """
+        startup_timeline.dump(path)
+
+    def trace_startup(self, path: str):
+        """
+        Write the startup timeline to a trace file once the first page has
+        completed its IPC handshake.
+
+        Args:
+            path: File to write (e.g. "startup.json")
+        """
+        self._trace_path = path
+
+    def prewarm_windows(self, count: int = 1, options: Optional[dict] = None):
+        """
+        Keep hidden windows ready so BrowserWindow(...) opens instantly.
+        A new BrowserWindow takes a prewarmed window when its resizable,
+        frameless, fullscreen, min_width/min_height and backgroundColor options
+        match, then only sets its title and size, loads its page and shows it.
+        The pool is filled in the background once app.run() has started
+        pywebview, and refilled after each window is taken.
+
+        Args:
+            count: Number of hidden windows to keep ready (0 empties the pool)
+            options: BrowserWindow options of the windows to prewarm
+                (default: the defaults)
+        """
+        from .browser_window import create_native_window, fixed_options
+
+        def create(fixed):
+            return create_native_window("Positron", 800, 600, fixed, hidden=True)
+
+        self._window_pool.prewarm(fixed_options(options or {}), count, create)
+
     def register_window(self, window):
         """Internal: Register a window with the app"""
         if window not in self.windows:
             self.windows.append(window)
+            ipc_main.register_window(window)
             print(f"Registered window. Total windows: {len(self.windows)}")
 
     def unregister_window(self, window):
         """Internal: Unregister a window from the app"""
         if window in self.windows:
             self.windows.remove(window)
+            ipc_main.unregister_window(window)
             print(f"Unregistered window. Remaining windows: {len(self.windows)}")
 
         if len(self.windows) == 0:
@@ -131,12 +269,22 @@ class App:
         self._is_quitting = True
         self._emit_before_quit()
 
-        # Close all windows
+        # Close all windows, including prewarmed ones
+        self._window_pool.close()
         for window in self.windows[:]:
             window.close()
 
         self._emit_quit()
 
+        # Stop the loop and pools running IPC handlers
+        ipc_main.set_event_loop(None)
+        self._event_loop.stop()
+        self._handler_pools.shutdown()
+        if self._server is not None:
+            self._server.stop()
+        if self._assets is not None:
+            self._assets.close()
+
         # Exit the application
         try:
             # pywebview doesn't have a destroy method, just exit
@@ -151,16 +299,24 @@ class App:
         """
         print("Starting Positron app with pywebview...")
 
+        # Start the event loop for async IPC handlers
+        ipc_main.set_event_loop(self._event_loop.start())
+
         # Emit ready event
         self._emit_ready()
 
         # Start pywebview event loop
         # pywebview.start() will block until all windows are closed
+        import webview
+
         try:
             if len(self.windows) > 0:
                 self._webview_started = True
                 print(f"Starting webview with {len(self.windows)} window(s)")
-                webview.start(debug=True)
+                startup_timeline.mark("webview.start")
+                # Pooled windows are only created once the app's own windows
+                # exist, so one of those stays pywebview's master window
+                webview.start(self._window_pool.start, debug=True)
             else:
                 print("Warning: No windows created before app.run()")
         except KeyboardInterrupt:
@@ -178,5 +334,7 @@ class App:
         return getattr(sys.modules["__main__"], "__version__", "0.1.0")
 
 
+startup_timeline.record("import", startup_timeline.origin, time.perf_counter())
+
 # Singleton instance
 app = App()
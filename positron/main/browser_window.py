@@ -3,16 +3,79 @@ BrowserWindow class for Positron using pywebview
 Provides actual React/modern web app support via WebView2/WebKit
 """
 
+import re
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
-import webview
-
 # Import from package instead of specific files to allow flexibility
 from ..ipc import ipc_main, ipc_renderer
+from ..ipc.main import JS_API_METHODS
 from .app import app
+from .timeline import startup_timeline
+
+
+def fixed_options(options: Dict[str, Any]) -> tuple:
+    """
+    Get the BrowserWindow options that cannot be changed once the native
+    window exists. Prewarmed windows are only reused for equal values.
+
+    Args:
+        options: BrowserWindow options
+
+    Returns:
+        (resizable, frameless, fullscreen, min_size, background_color)
+    """
+    return (
+        options.get("resizable", True),
+        options.get("frameless", False),
+        options.get("fullscreen", False),
+        (options.get("min_width", 200), options.get("min_height", 100)),
+        options.get("backgroundColor", "#FFFFFF"),
+    )
+
+
+def create_native_window(
+    title: str, width: int, height: int, fixed: tuple, hidden: bool
+):
+    """
+    Create a pywebview window on a blank page with the IPC API exposed.
+
+    Args:
+        title: Window title
+        width: Width in pixels
+        height: Height in pixels
+        fixed: Options from fixed_options()
+        hidden: Create the window hidden
+
+    Returns:
+        The pywebview window
+    """
+    # pywebview is imported with the first window, not with the package
+    import webview
+
+    resizable, frameless, fullscreen, min_size, background_color = fixed
+    window = webview.create_window(
+        title=title,
+        url="about:blank",  # Start with blank page
+        width=width,
+        height=height,
+        resizable=resizable,
+        fullscreen=fullscreen,
+        min_size=min_size,
+        background_color=background_color,
+        frameless=frameless,
+        hidden=hidden,
+    )
+
+    # Expose the API methods individually
+    js_api = ipc_main.get_js_api(window)
+    for method_name in JS_API_METHODS:
+        if hasattr(js_api, method_name):
+            window.expose(getattr(js_api, method_name))
+    return window
 
 
 class BrowserWindow:
@@ -44,6 +107,7 @@ class BrowserWindow:
                 - center (bool): Center window on screen (default: True)
                 - webPreferences (dict): Web preferences (for compatibility)
         """
+        started = time.perf_counter()
         options = options or {}
 
         # Window properties
@@ -51,53 +115,42 @@ class BrowserWindow:
         self._closed_callbacks = []
         self._dom_ready_callbacks = []
         self._url = None
+        self._url_pending = False  # load_url() called before the window was shown
         self._html_content = None
+        self._startup_pending = True  # Until the first page's IPC handshake
 
         # Extract options
         width = options.get("width", 800)
         height = options.get("height", 600)
         title = options.get("title", "Positron")
-        resizable = options.get("resizable", True)
-        frameless = options.get("frameless", False)
-        fullscreen = options.get("fullscreen", False)
-        min_size = (options.get("min_width", 200), options.get("min_height", 100))
-        background_color = options.get("backgroundColor", "#FFFFFF")
         hidden = not options.get("show", True)
+        fixed = fixed_options(options)
 
-        # We need to create the window first to get a reference, then set up API
-        # Create a placeholder - we'll set up IPC after window creation
-        self.window = None
-
-        # Create a temporary window to get reference
-        temp_window = webview.create_window(
-            title=title,
-            url="about:blank",  # Start with blank page
-            width=width,
-            height=height,
-            resizable=resizable,
-            fullscreen=fullscreen,
-            min_size=min_size,
-            background_color=background_color,
-            frameless=frameless,
-            hidden=hidden,
-        )
-
-        # Now get the API with the window reference and expose it
-        self.window = temp_window
-        js_api = ipc_main.get_js_api(self.window)
-
-        # Expose the API methods individually
-        for method_name in ["ipc_send", "ipc_invoke"]:
-            if hasattr(js_api, method_name):
-                self.window.expose(getattr(js_api, method_name))
+        # A prewarmed window from the App's pool only needs a title and size
+        self.window = app._window_pool.claim(fixed)
+        pooled = self.window is not None
+        if not pooled:
+            self.window = create_native_window(title, width, height, fixed, hidden)
+        # A pooled window stays hidden until its first page has loaded
+        self._show_on_load = pooled and not hidden
 
         # Set up event handlers
         self.window.events.closed += self._on_closed
+        self.window.events.before_load += self._on_before_load
+        self.window.events.shown += self._on_shown
+        self.window.events.loaded += self._on_loaded
+
+        if pooled:
+            self.window.title = title
+            self.window.resize(width, height)
 
         # Register window
         BrowserWindow._windows.append(self)
         app.register_window(self)
 
+        startup_timeline.record(
+            "BrowserWindow", started, time.perf_counter(), window=title, pooled=pooled
+        )
         print(f"Created BrowserWindow: {title} ({width}x{height})")
 
     def load_url(self, url: str):
@@ -109,32 +162,12 @@ class BrowserWindow:
         """
         print(f"Loading URL: {url}")
         self._url = url
+        self._html_content = None
 
-        if self.window:
-            # Inject IPC script after page loads
-            def inject_ipc():
-                try:
-                    ipc_script = ipc_renderer.get_preload_script()
-                    # Inject the IPC script
-                    self.window.evaluate_js(ipc_script)
-                    print("IPC script injected")
-
-                    # Force initialization attempt
-                    self.window.evaluate_js(
-                        "if (typeof initPositronIPC === 'function') initPositronIPC();"
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to inject IPC script: {e}")
-
-            # Use loaded event to inject script
-            self.window.events.loaded += inject_ipc
-
-            # Load URL when window is shown (after webview.start())
-            def load_when_shown():
-                print(f"Window shown, now loading: {url}")
-                self.window.load_url(url)
-
-            self.window.events.shown += load_when_shown
+        # Before the window is shown, _on_shown() loads the latest URL
+        self._url_pending = not (self.window and self.window.events.shown.is_set())
+        if not self._url_pending:
+            self.window.load_url(url)
 
     def load_file(self, file_path: str):
         """
@@ -154,6 +187,22 @@ class BrowserWindow:
         file_url = file_path.as_uri()
         self.load_url(file_url)
 
+    def load_app(self, path: str, route: str = "/", spa: bool = True):
+        """
+        Load a built frontend (e.g. Vite's dist/) over the App's asset server.
+        Faster than load_file() for large bundles: assets are served with
+        precompressed variants, ETags and long-lived caching of hashed files.
+
+        Args:
+            path: Directory containing index.html, or an archive written by
+                `positron pack`
+            route: Client-side route to open (default: "/")
+            spa: Serve index.html for unknown client-side routes (default: True)
+        """
+        assets = app.serve_assets(path, spa=spa)
+        print(f"Loading app: {assets.root}")
+        self.load_url(assets.url + route.lstrip("/"))
+
     def load_html(self, html: str, base_url: str = ""):
         """
         Load HTML content directly.
@@ -168,30 +217,87 @@ class BrowserWindow:
         html = self._inject_ipc_script(html)
 
         self._html_content = html
+        self._url_pending = False
         self.window.load_html(html)
 
     def _inject_ipc_script(self, html: str) -> str:
-        """Internal: Inject IPC renderer script into HTML"""
-        ipc_script = ipc_renderer.get_preload_script()
-
-        # Inject script before </head> or at the beginning
-        if "</head>" in html:
-            script_tag = f"<script>{ipc_script}</script>"
-            html = html.replace("</head>", f"{script_tag}</head>", 1)
-        elif "<head>" in html:
-            script_tag = f"<script>{ipc_script}</script>"
-            html = html.replace("<head>", f"<head>{script_tag}", 1)
-        else:
-            # No head tag, create one
-            script_tag = f"<html><head><script>{ipc_script}</script></head><body>"
-            if "<html>" in html:
-                html = html.replace("<html>", script_tag, 1)
-                if "</html>" not in html:
-                    html += "</body></html>"
-            else:
-                html = script_tag + html + "</body></html>"
+        """Internal: Inject IPC renderer script at the start of the document"""
+        script_tag = f"<script>{ipc_renderer.get_preload_script()}</script>"
+
+        # First in <head>, so window.ipcRenderer exists before the page's scripts
+        head = re.search(r"<head(\s[^>]*)?>", html, re.IGNORECASE)
+        if head:
+            return html[: head.end()] + script_tag + html[head.end() :]
+
+        # No head tag, create one
+        document = re.search(r"<html(\s[^>]*)?>", html, re.IGNORECASE)
+        if document:
+            end = document.end()
+            return html[:end] + f"<head>{script_tag}</head>" + html[end:]
+        return f"<html><head>{script_tag}</head><body>{html}</body></html>"
+
+    def _on_before_load(self):
+        """
+        Internal: Inject the IPC script as each page finishes loading.
+        Registered once per window, so navigations never inject twice (a
+        page from load_html() that already carries the script ignores it).
+        """
+        # Streams the previous page left open are never going to be read
+        ipc_main.window_navigated(self)
+        if self.window.real_url in (None, "about:blank"):
+            return  # Placeholder page shown until load_url()
+
+        # This handler runs on the GUI thread and run_js() waits for it to
+        # return, so the script is evaluated from a worker. It may run before
+        # or after pywebview's bridge: it connects on whichever comes last and
+        # then dispatches "positronready".
+        threading.Thread(
+            target=self._run_preload, args=(time.perf_counter(),), daemon=True
+        ).start()
+
+    def _run_preload(self, started: float):
+        """Internal: Evaluate the IPC script (see _on_before_load)"""
+        try:
+            self.window.run_js(ipc_renderer.get_preload_script())
+        except Exception as e:
+            print(f"Warning: Failed to inject IPC script: {e}", file=sys.stderr)
+            return
+        if self._startup_pending:
+            startup_timeline.record(
+                "preload", started, time.perf_counter(), window=self.window.title
+            )
+
+    def _on_shown(self):
+        """Internal: Load the pending URL once the window appears"""
+        if self._startup_pending:
+            startup_timeline.mark("shown", window=self.window.title)
+        # shown fires again each time some backends re-show the window
+        if self._url_pending:
+            self._url_pending = False
+            print(f"Window shown, now loading: {self._url}")
+            self.window.load_url(self._url)
+
+    def _on_loaded(self):
+        """Internal: Record page loads and show a pooled window's first page"""
+        if self._startup_pending:
+            startup_timeline.mark("loaded", window=self.window.title)
+        if self._show_on_load and self.window.real_url != "about:blank":
+            self._show_on_load = False
+            self.window.show()
 
-        return html
+    def _startup_complete(self, timings: dict):
+        """
+        Internal: Record the renderer's first IPC handshake (called by App).
+
+        Args:
+            timings: Milliseconds since navigation start measured in the page
+                ("ready", "domContentLoaded")
+        """
+        if self._startup_pending:
+            self._startup_pending = False
+            startup_timeline.mark(
+                "handshake", window=self.window.title, renderer=timings
+            )
 
     def _on_closed(self):
         """Internal: Handle window close event"""
@@ -230,11 +336,13 @@ class BrowserWindow:
 
     def show(self):
         """Show the window"""
+        self._show_on_load = False
         if self.window:
             self.window.show()
 
     def hide(self):
         """Hide the window"""
+        self._show_on_load = False
         if self.window:
             self.window.hide()
 
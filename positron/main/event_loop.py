@@ -0,0 +1,83 @@
+"""
+Background asyncio event loop for Positron
+Runs coroutine-based IPC handlers off the pywebview bridge threads
+"""
+
+import asyncio
+import sys
+import threading
+from typing import Optional
+
+
+class EventLoopThread:
+    """
+    Runs an asyncio event loop on a dedicated daemon thread.
+    Owned by App: started in App.run() and stopped in App.quit().
+    """
+
+    def __init__(self, name: str = "positron-asyncio"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread (no-op if already running).
+
+        Returns:
+            The running event loop
+        """
+        if self.is_running():
+            return self.loop
+
+        self._started.clear()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        return self.loop
+
+    def _run(self):
+        """Internal: Thread target running the loop forever"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                self._cancel_pending()
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            except Exception as e:
+                print(f"Error shutting down event loop: {e}", file=sys.stderr)
+            finally:
+                self.loop.close()
+
+    def _cancel_pending(self):
+        """Internal: Cancel tasks still pending when the loop stops"""
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the loop and wait for the thread to exit.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to finish
+        """
+        if not self.is_running():
+            return
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        """Check if the loop thread is running"""
+        return self._thread is not None and self._thread.is_alive()
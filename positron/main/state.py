@@ -0,0 +1,296 @@
+"""
+Shared application state
+A JSON tree owned by the main process and mirrored in every renderer that
+reads it. Mutations are sent as JSON-patch style deltas, not whole objects.
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+STATE_CHANNEL = "positron:state"
+SNAPSHOT_CHANNEL = "positron:state:snapshot"
+
+Path = Union[str, Sequence[Union[str, int]]]
+
+_MISSING = object()
+
+
+def _split(path: Path) -> List[Union[str, int]]:
+    """Internal: Normalize "a.b.0" / ["a", "b", 0] to a list of keys"""
+    if isinstance(path, str):
+        return [key for key in path.split(".") if key] if path else []
+    return list(path)
+
+
+def _pointer(keys: Sequence[Union[str, int]]) -> str:
+    """Internal: Build a JSON pointer ("/a/b/0") from keys"""
+    return "".join("/" + str(key).replace("~", "~0").replace("/", "~1") for key in keys)
+
+
+def _index(container, key) -> Any:
+    """Internal: Convert a path key to a list index where needed"""
+    if isinstance(container, list):
+        return int(key)
+    return key
+
+
+class StateStore:
+    """
+    Observable state tree synchronized to renderers (app.state).
+
+        app.state.set("user", {"name": "Ada", "theme": "dark"})
+        app.state.set("user.theme", "light")   # sends one small patch
+        app.state.append("notifications", {"text": "Saved"})
+
+        with app.state.batch():                 # one message, one version
+            app.state.set("progress", 1.0)
+            app.state.delete("task")
+
+    Renderers read it through ipcRenderer.state. Paths are dotted strings
+    ("user.theme") or sequences of keys (["items", 0, "done"]).
+
+    Containers are never modified in place: every change copies the dicts
+    and lists along its path, so snapshots taken earlier stay consistent.
+    Treat values returned by get() as read-only and call set() to change them.
+    """
+
+    def __init__(self, initial: Optional[dict] = None):
+        """
+        Args:
+            initial: Initial state (optional)
+        """
+        self._root: dict = dict(initial or {})
+        self._version = 0
+        self._ipc = None
+        self._lock = threading.RLock()
+        self._batch: Optional[list] = None
+        self._observers: List[Callable] = []
+
+    def attach(self, ipc):
+        """
+        Connect the store to IPC and serve snapshots to renderers (called by App).
+
+        Args:
+            ipc: IPCMain instance
+        """
+        self._ipc = ipc
+        ipc.handle(SNAPSHOT_CHANNEL, self._handle_snapshot)
+
+    @property
+    def version(self) -> int:
+        """Number of change sets applied so far"""
+        return self._version
+
+    def get(self, path: Path = "", default: Any = None) -> Any:
+        """
+        Read a value.
+
+        Args:
+            path: Path to read ("" for the whole tree)
+            default: Returned if the path does not exist
+
+        Returns:
+            The value (read-only) or default
+        """
+        node = self._root
+        for key in _split(path):
+            try:
+                node = node[_index(node, key)]
+            except (KeyError, IndexError, TypeError, ValueError):
+                return default
+        return node
+
+    def set(self, path: Path, value: Any):
+        """
+        Set a value, creating missing parent objects.
+
+        Args:
+            path: Path to set
+            value: JSON-compatible value
+        """
+        keys = _split(path)
+        if not keys:
+            raise ValueError("Use replace() to set the whole state")
+        with self._lock:
+            existed = self.get(keys, _MISSING) is not _MISSING
+            self._root = self._assign(self._root, keys, value, create=True)
+            self._emit(
+                [
+                    {
+                        "op": "replace" if existed else "add",
+                        "path": _pointer(keys),
+                        "value": value,
+                    }
+                ]
+            )
+
+    def delete(self, path: Path):
+        """
+        Remove a value (no-op if it does not exist).
+
+        Args:
+            path: Path to remove
+        """
+        keys = _split(path)
+        if not keys:
+            raise ValueError("Use replace() to clear the whole state")
+        with self._lock:
+            if self.get(keys, _MISSING) is _MISSING:
+                return
+            self._root = self._assign(self._root, keys, _MISSING)
+            self._emit([{"op": "remove", "path": _pointer(keys)}])
+
+    def append(self, path: Path, value: Any):
+        """
+        Append a value to a list, creating the list if needed.
+
+        Args:
+            path: Path of the list
+            value: JSON-compatible value
+        """
+        keys = _split(path)
+        with self._lock:
+            current = self.get(keys, _MISSING)
+            if current is _MISSING:
+                self.set(keys, [value])
+                return
+            if not isinstance(current, list):
+                raise TypeError(f"Cannot append to non-list at '{_pointer(keys)}'")
+            self._root = self._assign(self._root, keys, current + [value])
+            self._emit([{"op": "add", "path": _pointer(keys) + "/-", "value": value}])
+
+    def update(self, values: dict, path: Path = ""):
+        """
+        Set several keys of an object in one change set.
+
+        Args:
+            values: Keys and values to set
+            path: Path of the object ("" for the root)
+        """
+        keys = _split(path)
+        with self.batch():
+            for key, value in values.items():
+                self.set(keys + [key], value)
+
+    def replace(self, state: dict):
+        """
+        Replace the whole state.
+
+        Args:
+            state: New state tree
+        """
+        with self._lock:
+            self._root = dict(state)
+            self._emit([{"op": "replace", "path": "", "value": self._root}])
+
+    @contextmanager
+    def batch(self):
+        """Group the changes made inside the block into one change set"""
+        with self._lock:
+            outer = self._batch is not None
+            if not outer:
+                self._batch = []
+            try:
+                yield self
+            finally:
+                if not outer:
+                    operations, self._batch = self._batch, None
+                    if operations:
+                        self._emit(operations)
+
+    def subscribe(self, callback: Callable) -> Callable:
+        """
+        Observe changes in Python.
+
+        Args:
+            callback: Function(version, operations) called after every change set
+
+        Returns:
+            Function that removes the observer
+        """
+        self._observers.append(callback)
+        return lambda: self._observers.remove(callback)
+
+    def snapshot(self) -> dict:
+        """
+        Get the current version and state tree.
+
+        Returns:
+            {"version": int, "state": dict}
+        """
+        with self._lock:
+            return {"version": self._version, "state": self._root}
+
+    def __getitem__(self, key):
+        value = self.get([key], _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set([key], value)
+
+    def __delitem__(self, key):
+        if key not in self._root:
+            raise KeyError(key)
+        self.delete([key])
+
+    def __contains__(self, key) -> bool:
+        return key in self._root
+
+    def _assign(self, node, keys: list, value, create: bool = False):
+        """Internal: Copy-on-write assignment (value _MISSING removes)"""
+        if isinstance(node, list):
+            copy = list(node)
+            index = int(keys[0])
+            if len(keys) == 1:
+                if value is _MISSING:
+                    del copy[index]
+                else:
+                    copy[index] = value
+            else:
+                copy[index] = self._assign(copy[index], keys[1:], value, create)
+            return copy
+
+        if not isinstance(node, dict):
+            if not create:
+                raise TypeError(f"Cannot index into {type(node).__name__}")
+            node = {}
+        copy = dict(node)
+        key = keys[0]
+        if len(keys) == 1:
+            if value is _MISSING:
+                copy.pop(key, None)
+            else:
+                copy[key] = value
+        else:
+            copy[key] = self._assign(copy.get(key), keys[1:], value, create)
+        return copy
+
+    def _emit(self, operations: list):
+        """Internal: Publish a change set (lock held)"""
+        if self._batch is not None:
+            self._batch.extend(operations)
+            return
+
+        self._version += 1
+        if self._ipc is not None:
+            # Broadcast under the lock so renderers receive versions in order
+            self._ipc.broadcast(
+                STATE_CHANNEL, self._version, operations, subscribed_only=True
+            )
+        for observer in list(self._observers):
+            try:
+                observer(self._version, operations)
+            except Exception as e:
+                print(f"Error in state observer: {e}", file=sys.stderr)
+
+    def _handle_snapshot(self, event, page=None):
+        """Internal: Send a renderer the state it builds its replica from"""
+        with self._lock:
+            # Subscribe before reading, so no change set can fall in between
+            if self._ipc is not None and event.window is not None:
+                self._ipc._add_subscription(event.window, STATE_CHANNEL, page)
+            return self.snapshot()
@@ -0,0 +1,128 @@
+"""
+Startup timeline
+Monotonic timestamps of each launch phase, from `import positron` to the
+renderer's first IPC handshake, for tracking cold-start regressions.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+READY_CHANNEL = "positron:ready"
+
+
+class StartupTimeline:
+    """
+    Records launch phases against a clock started when positron is imported.
+
+        with timeline.span("BrowserWindow", title="Main"):
+            ...
+        timeline.mark("loaded", window="Main")
+
+    Spans have a start and duration, marks only a start; both are reported in
+    milliseconds since the origin. Read through app.get_startup_timeline().
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Args:
+            origin: time.perf_counter() value events are measured from
+                (default: now)
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self._events: List[dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: Optional[float] = None, **detail):
+        """
+        Add an event measured elsewhere.
+
+        Args:
+            name: Phase name
+            start: time.perf_counter() value the phase started at
+            end: time.perf_counter() value it ended at (None for a mark)
+            **detail: Extra fields stored with the event (e.g. window title)
+        """
+        event = {
+            "name": name,
+            "start": round((start - self.origin) * 1000, 3),
+            "duration": None if end is None else round((end - start) * 1000, 3),
+            "thread": threading.current_thread().name,
+        }
+        event.update(detail)
+        with self._lock:
+            self._events.append(event)
+
+    def mark(self, name: str, **detail):
+        """Record an instant (e.g. "shown")"""
+        self.record(name, time.perf_counter(), **detail)
+
+    @contextmanager
+    def span(self, name: str, **detail):
+        """Record the time spent in a with block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), **detail)
+
+    def events(self) -> List[dict]:
+        """
+        Get the recorded events.
+
+        Returns:
+            [{"name", "start", "duration", "thread", ...}] ordered by start, in
+            milliseconds since the origin (duration is None for marks)
+        """
+        with self._lock:
+            events = [dict(event) for event in self._events]
+        return sorted(events, key=lambda event: event["start"])
+
+    def dump(self, path: str):
+        """
+        Write the events as a Chrome trace (open in chrome://tracing or
+        https://ui.perfetto.dev).
+
+        Args:
+            path: File to write (e.g. "startup.json")
+        """
+        threads = {}
+        trace = []
+        for event in self.events():
+            tid = threads.setdefault(event["thread"], len(threads) + 1)
+            entry = {
+                "name": event["name"],
+                "cat": "startup",
+                "pid": 1,
+                "tid": tid,
+                "ts": event["start"] * 1000,
+                "args": {
+                    key: value
+                    for key, value in event.items()
+                    if key not in ("name", "start", "duration", "thread")
+                },
+            }
+            if event["duration"] is None:
+                entry.update(ph="i", s="t")
+            else:
+                entry.update(ph="X", dur=event["duration"] * 1000)
+            trace.append(entry)
+        for name, tid in threads.items():
+            trace.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, file)
+
+
+# Started by positron/__init__.py, so the origin is the package import
+startup_timeline = StartupTimeline()
@@ -0,0 +1,161 @@
+"""
+Prewarmed window pool
+Hidden native windows created ahead of time, so opening a BrowserWindow can
+take one that is already running instead of starting a new webview.
+"""
+
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+# create(options) -> hidden native window with the IPC API exposed
+WindowFactory = Callable[[tuple], Any]
+
+
+class WindowPool:
+    """
+    Pool of hidden pywebview windows, grouped by the options that cannot be
+    changed after a window is created (see browser_window.fixed_options()).
+
+    Filling starts with start(), once pywebview runs and the app's first window
+    exists (pywebview makes the first window it creates the master window,
+    which must not be a hidden pooled one). A window can be claimed once it
+    has loaded its blank placeholder page; every claim starts a background
+    refill up to the pool's size. Managed by the App: see app.prewarm_windows().
+    """
+
+    def __init__(self):
+        self._sizes: Dict[tuple, int] = {}  # options -> windows to keep ready
+        self._factories: Dict[tuple, WindowFactory] = {}
+        self._windows: Dict[tuple, List[Any]] = {}  # options -> native windows
+        self._filling = set()  # options being refilled
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def prewarm(self, options: tuple, count: int, create: WindowFactory):
+        """
+        Keep `count` windows with these options ready (filled in the background
+        once the pool is started).
+
+        Args:
+            options: Fixed window options the windows are created with
+            count: Number of hidden windows to keep
+            create: Function creating one window from options
+        """
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        with self._lock:
+            self._sizes[options] = count
+            self._factories[options] = create
+            windows = self._windows.setdefault(options, [])
+            surplus = windows[count:]
+            del windows[count:]
+        for window in surplus:
+            self._destroy(window)
+        self._refill(options)
+
+    def start(self):
+        """Start filling the pool (called by App.run once pywebview is running)"""
+        with self._lock:
+            self._started = True
+            groups = list(self._sizes)
+        for options in groups:
+            self._refill(options)
+
+    def claim(self, options: tuple) -> Optional[Any]:
+        """
+        Take a ready window with these options.
+
+        Args:
+            options: Fixed window options the caller needs
+
+        Returns:
+            A hidden native window that finished loading its placeholder, or
+            None if none is ready
+        """
+        with self._lock:
+            windows = self._windows.get(options)
+            if not windows:
+                return None
+            window = next((w for w in windows if w.events.loaded.is_set()), None)
+            if window is None:
+                return None
+            windows.remove(window)
+        self._refill(options)
+        return window
+
+    def ready(self, options: Optional[tuple] = None) -> int:
+        """
+        Count the windows that can be claimed.
+
+        Args:
+            options: Only count windows with these options (default: all)
+
+        Returns:
+            Number of ready windows
+        """
+        with self._lock:
+            groups = (
+                self._windows.values()
+                if options is None
+                else [self._windows.get(options, [])]
+            )
+            return sum(w.events.loaded.is_set() for group in groups for w in group)
+
+    def close(self):
+        """Destroy the pooled windows and stop refilling (called by App.quit)"""
+        with self._lock:
+            self._closed = True
+            windows = [w for group in self._windows.values() for w in group]
+            self._windows.clear()
+        for window in windows:
+            self._destroy(window)
+
+    def _refill(self, options: tuple):
+        """Internal: Top up a group on a background thread"""
+        with self._lock:
+            if not self._started or self._closed or options in self._filling:
+                return
+            if len(self._windows.get(options, ())) >= self._sizes.get(options, 0):
+                return
+            self._filling.add(options)
+        threading.Thread(
+            target=self._fill, args=(options,), name="positron-window-pool", daemon=True
+        ).start()
+
+    def _fill(self, options: tuple):
+        """Internal: Create windows until the group reaches its size"""
+        try:
+            while True:
+                with self._lock:
+                    windows = self._windows.setdefault(options, [])
+                    if self._closed or len(windows) >= self._sizes.get(options, 0):
+                        break
+                    create = self._factories[options]
+
+                window = create(options)
+                with self._lock:
+                    closed = self._closed
+                    if not closed:
+                        self._windows[options].append(window)
+                if closed:
+                    self._destroy(window)
+        except Exception as e:
+            print(f"Error prewarming window: {e}", file=sys.stderr)
+            with self._lock:
+                self._filling.discard(options)
+            return
+
+        with self._lock:
+            self._filling.discard(options)
+        # A window claimed after the last check is replaced by a new refill
+        self._refill(options)
+
+    @staticmethod
+    def _destroy(window):
+        """Internal: Close a pooled window"""
+        try:
+            window.destroy()
+        except Exception as e:
+            print(f"Error closing pooled window: {e}", file=sys.stderr)
@@ -1,5 +1,19 @@
 """Renderer process utilities and helpers"""
 
-from .dev_server import DevServer
+from typing import TYPE_CHECKING
 
-__all__ = ["DevServer"]
+from ..common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AssetServer": ".asset_server",
+        "DevServer": ".dev_server",
+    },
+)
+
+if TYPE_CHECKING:
+    from .asset_server import AssetServer
+    from .dev_server import DevServer
+
+__all__ = ["AssetServer", "DevServer"]
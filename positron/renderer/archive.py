@@ -0,0 +1,262 @@
+"""
+Packed asset archives
+A built frontend stored as one indexed file (written by `positron pack`) and
+read through a memory map, so startup opens one file instead of hundreds.
+
+Layout:
+    magic (8 bytes) | version (u32) | index length (u32) | index (JSON) | data
+
+The index maps each file name to its variants ("identity", "gzip", "br"),
+each an [offset, size, etag] triple relative to the start of the data.
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+MAGIC = b"PSTRNPAK"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 8  # Entries start on 8-byte boundaries
+
+# Encoded variants written next to the original when they are smaller
+COMPRESSIBLE = {
+    ".css",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".wasm",
+    ".xml",
+}
+MIN_COMPRESS_SIZE = 1024
+
+# Precompressed files from the build, stored as variants of their original
+_SUFFIXES = {".br": "br", ".gz": "gzip"}
+
+
+def etag_of(data) -> str:
+    """
+    Strong ETag of a response body.
+
+    Args:
+        data: Bytes-like body
+
+    Returns:
+        Quoted hex digest
+    """
+    return '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+
+
+def _compress(data: bytes) -> Dict[str, bytes]:
+    """Internal: Encoded variants that are at least 10% smaller than data"""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return {
+        encoding: encoded
+        for encoding, encoded in variants.items()
+        if len(encoded) < len(data) * 0.9
+    }
+
+
+def pack(source: str, output: str, compress: bool = True) -> dict:
+    """
+    Write a directory of built assets into one archive.
+
+    Existing .br/.gz files become variants of the file they compress. With
+    compress=True, text assets also get gzip (and brotli, when the brotli
+    package is installed) variants if those are smaller.
+
+    Args:
+        source: Directory to pack (e.g. "dist")
+        output: Archive path to write (e.g. "app.pak")
+        compress: Add compressed variants of text assets (default: True)
+
+    Returns:
+        Statistics: {"files", "variants", "bytes"}
+    """
+    root = Path(source).resolve()
+    if not root.is_dir():
+        raise FileNotFoundError(f"Asset directory not found: {root}")
+
+    # name -> encoding -> bytes
+    files: Dict[str, Dict[str, bytes]] = {}
+    paths = sorted(path for path in root.rglob("*") if path.is_file())
+    names = {path.relative_to(root).as_posix() for path in paths}
+    for path in paths:
+        name = path.relative_to(root).as_posix()
+        encoding = _SUFFIXES.get(path.suffix)
+        # A .gz without its original is a file in its own right
+        if encoding is not None and name[: -len(path.suffix)] in names:
+            files.setdefault(name[: -len(path.suffix)], {})[
+                encoding
+            ] = path.read_bytes()
+            continue
+        files.setdefault(name, {})["identity"] = path.read_bytes()
+
+    index = {}
+    chunks = []
+    offset = 0
+    for name, variants in files.items():
+        data = variants["identity"]
+        if (
+            compress
+            and os.path.splitext(name)[1].lower() in COMPRESSIBLE
+            and len(data) >= MIN_COMPRESS_SIZE
+        ):
+            for encoding, encoded in _compress(data).items():
+                variants.setdefault(encoding, encoded)
+
+        entry = {}
+        for encoding, data in variants.items():
+            entry[encoding] = [offset, len(data), etag_of(data)]
+            padding = -len(data) % ALIGNMENT
+            chunks.append(data + b"\0" * padding)
+            offset += len(data) + padding
+        index[name] = entry
+
+    encoded_index = json.dumps({"files": index}, separators=(",", ":")).encode()
+    encoded_index += b" " * (-(HEADER.size + len(encoded_index)) % ALIGNMENT)
+
+    output = Path(output)
+    temporary = output.with_name(output.name + ".tmp")
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(encoded_index)))
+        file.write(encoded_index)
+        for chunk in chunks:
+            file.write(chunk)
+    os.replace(temporary, output)
+
+    return {
+        "files": len(index),
+        "variants": sum(len(entry) for entry in index.values()),
+        "bytes": HEADER.size + len(encoded_index) + offset,
+    }
+
+
+class AssetArchive:
+    """
+    Read-only view of an archive written by pack().
+
+    The file is memory-mapped once; entries are returned as memoryview slices
+    of the map, so serving them copies nothing in Python. Each slice from
+    read() is handed back with release(); close() unmaps the file once the
+    last one is.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Archive path
+        """
+        self.path = Path(path).resolve()
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a Positron asset archive: {self.path}")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported archive version {version}: {self.path}")
+
+        start = HEADER.size
+        self._files = json.loads(self._map[start : start + index_size])["files"]
+        self._data = start + index_size
+        self._view = memoryview(self._map)
+        self._lock = threading.Lock()
+        self._readers = 0  # Slices from read() not yet released
+        self._closing = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def names(self):
+        """File names in the archive"""
+        return self._files.keys()
+
+    def variants(self, name: str) -> Optional[dict]:
+        """
+        Get the stored variants of a file.
+
+        Args:
+            name: File name ("assets/index.js")
+
+        Returns:
+            {encoding: [offset, size, etag]} or None if missing
+        """
+        return self._files.get(name)
+
+    def read(self, name: str, encoding: str = "identity") -> memoryview:
+        """
+        Get the bytes of a file variant without copying.
+
+        Args:
+            name: File name
+            encoding: "identity", "gzip" or "br"
+
+        Returns:
+            memoryview into the archive (pass it to release() when done)
+
+        Raises:
+            ValueError: If the archive is closed
+        """
+        offset, size, _ = self._files[name][encoding]
+        start = self._data + offset
+        with self._lock:
+            if self._closing:
+                raise ValueError(f"Archive is closed: {self.path}")
+            self._readers += 1
+            return self._view[start : start + size]
+
+    def release(self, view: memoryview):
+        """
+        Hand back a slice returned by read().
+
+        Args:
+            view: The slice (released here)
+        """
+        view.release()
+        with self._lock:
+            self._readers -= 1
+            if self._closing and self._readers == 0:
+                self._unmap()
+
+    def close(self):
+        """Release the memory map, or once the last slice in use is released"""
+        with self._lock:
+            self._closing = True
+            if self._readers == 0:
+                self._unmap()
+
+    def _unmap(self):
+        """Internal: Close the map (lock held)"""
+        if self._view is None:
+            return
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError as e:
+            # A slice was kept without release(); the map closes when collected
+            print(f"Warning: Asset archive still in use: {e}", file=sys.stderr)
+        self._view = None
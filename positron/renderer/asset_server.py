@@ -0,0 +1,316 @@
+"""
+Production asset server
+Serves a built frontend (e.g. Vite's dist/, or an archive written by
+`positron pack`) from the App's loopback server, with precompressed variants,
+strong ETags and long-lived caching of hashed file names.
+"""
+
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import unquote
+
+from ..common.loopback import LoopbackServer, send_error
+from .archive import AssetArchive, etag_of
+
+DEFAULT_CACHE_SIZE = 32 * 1024 * 1024  # Bytes of file contents kept in memory
+
+# Content-Encoding -> suffix of the precompressed file, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Bundler output with a content hash in the name: 8 hex digits (main.3f2a1b9c.js),
+# 8 mixed-case base64url characters (index-BdH3x9kQ.js) or 16+ hex digits
+HASHED_NAME = re.compile(
+    r"[.-](?:(?=[a-f]*[0-9])[0-9a-f]{8}|(?=[a-z0-9_-]*[A-Z])(?=[A-Z_-]*[a-z0-9])"
+    r"[A-Za-z0-9_-]{8}|[0-9a-f]{16,})\.[A-Za-z0-9]+$"
+)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+_TYPES = {
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".css": "text/css",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".svg": "image/svg+xml",
+    ".wasm": "application/wasm",
+    ".woff2": "font/woff2",
+}
+
+
+def content_type(name: str) -> str:
+    """
+    Get the Content-Type for a file name.
+
+    Args:
+        name: File name
+
+    Returns:
+        MIME type (with a charset for text types)
+    """
+    suffix = os.path.splitext(name)[1].lower()
+    mime = _TYPES.get(suffix) or mimetypes.guess_type(name)[0]
+    if mime is None:
+        return "application/octet-stream"
+    if mime.startswith("text/") or mime in ("application/json", "image/svg+xml"):
+        return f"{mime}; charset=utf-8"
+    return mime
+
+
+class AssetServer:
+    """
+    Serves built assets over the App's loopback server, from a directory or
+    from a packed archive (memory-mapped, entries sent without copies).
+
+        server = AssetServer("frontend/dist")    # or "app.pak"
+        server.mount(loopback)
+        window.load_url(server.url)
+
+    Usually used through BrowserWindow.load_app("frontend/dist").
+
+    - A request for "app.js" is answered with "app.js.br" or "app.js.gz" (or
+      the archive's compressed variant) when the browser accepts it.
+    - Responses carry a strong ETag (hash of the bytes sent), so revalidation
+      of unchanged files returns 304 without a body.
+    - Hashed file names (index-BdH3x9kQ.js) are cached as immutable; other
+      files (index.html) are revalidated on every load.
+    - Recently served files are kept in memory up to `cache_size` bytes.
+    - With `spa=True`, unknown paths without a file extension fall back to
+      index.html so client-side routes survive a reload.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        spa: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        index: str = "index.html",
+        immutable: re.Pattern = HASHED_NAME,
+    ):
+        """
+        Args:
+            root: Directory or archive to serve (e.g. "dist" or "app.pak")
+            spa: Serve index for unknown extensionless paths (default: True)
+            cache_size: Maximum bytes of file contents kept in memory
+            index: File served for directories (default: "index.html")
+            immutable: Pattern matching file names that never change
+                (default: names with a bundler content hash)
+        """
+        self.root = Path(root).resolve()
+        self._archive: Optional[AssetArchive] = None
+        if self.root.is_file():
+            self._archive = AssetArchive(self.root)
+        elif not self.root.is_dir():
+            raise FileNotFoundError(f"Asset directory not found: {self.root}")
+        self.spa = spa
+        self.index = index
+        self.immutable = immutable
+        self.cache_size = cache_size
+        self._server: Optional[LoopbackServer] = None
+        # (file path, encoding) -> (stat signature, body, etag)
+        self._cache: "OrderedDict[tuple, Tuple[tuple, bytes, str]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def mount(self, server: LoopbackServer, prefix: str = "/"):
+        """
+        Serve the assets from a loopback server.
+        Asset routes do not require the session token, since pages request
+        their scripts and styles by plain URL.
+
+        Args:
+            server: Loopback server
+            prefix: Path the assets are served under (default: the root)
+        """
+        self._server = server
+        server.add_route(prefix, self._serve, require_token=False)
+
+    @property
+    def url(self) -> str:
+        """URL of the app's index page (starts the loopback server)"""
+        if self._server is None:
+            raise RuntimeError("AssetServer is not mounted")
+        return self._server.start() + "/"
+
+    def close(self):
+        """Release cached file contents and the archive (if serving one)"""
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+        if self._archive is not None:
+            self._archive.close()
+
+    def _find(self, path: str, accepted: str):
+        """
+        Internal: Look up the response for a URL path.
+
+        Returns:
+            (file name, encoding, size, etag, body, source path) or None if
+            missing - body is None for files streamed from source
+        """
+        accepted = {part.split(";")[0].strip() for part in accepted.split(",")}
+        if self._archive is not None:
+            return self._find_entry(path, accepted)
+
+        target = self._resolve(path)
+        if target is None:
+            return None
+        source, encoding = self._select(target, accepted)
+        size, etag, body = self._load(source, encoding)
+        return target.name, encoding, size, etag, body, source
+
+    def _find_entry(self, path: str, accepted: set):
+        """Internal: Look up a URL path in the archive"""
+        archive = self._archive
+        name = posixpath.normpath(unquote(path).lstrip("/"))
+        if name == ".":
+            name = ""
+        if name not in archive:
+            index = posixpath.join(name, self.index) if name else self.index
+            if index in archive:
+                name = index
+            elif self.spa and "." not in posixpath.basename(name):
+                name = self.index
+            if name not in archive:
+                return None
+
+        variants = archive.variants(name)
+        encoding = next(
+            (item for item, _ in ENCODINGS if item in accepted and item in variants),
+            None,
+        )
+        _, size, etag = variants[encoding or "identity"]
+        body = archive.read(name, encoding or "identity")
+        return posixpath.basename(name), encoding, size, etag, body, None
+
+    def _resolve(self, path: str) -> Optional[Path]:
+        """Internal: Map a URL path to a file inside the root (None if missing)"""
+        relative = unquote(path).lstrip("/")
+        target = (self.root / relative).resolve()
+        if target != self.root and self.root not in target.parents:
+            return None  # Path traversal
+        if target.is_dir():
+            target = target / self.index
+        if target.is_file():
+            return target
+        if self.spa and "." not in target.name:
+            index = self.root / self.index
+            if index.is_file():
+                return index
+        return None
+
+    def _select(self, target: Path, accepted: set) -> Tuple[Path, Optional[str]]:
+        """Internal: Pick a precompressed variant the client accepts"""
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted:
+                variant = target.with_name(target.name + suffix)
+                if variant.is_file():
+                    return variant, encoding
+        return target, None
+
+    def _load(self, source: Path, encoding: Optional[str]):
+        """
+        Internal: Get a file's ETag and, if small enough, its bytes.
+
+        Returns:
+            (size, etag, body) - body is None for files streamed from disk
+        """
+        stat = source.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        key = (str(source), encoding)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == signature:
+                self._cache.move_to_end(key)
+                return stat.st_size, entry[2], entry[1]
+
+        if stat.st_size > self.cache_size // 4:
+            # Large files are hashed once per change and streamed
+            etag = self._large_etag(source, signature)
+            return stat.st_size, etag, None
+
+        body = source.read_bytes()
+        etag = etag_of(body)
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cached_bytes -= len(old[1])
+            self._cache[key] = (signature, body, etag)
+            self._cached_bytes += len(body)
+            while self._cached_bytes > self.cache_size and self._cache:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted[1])
+        return len(body), etag, body
+
+    def _large_etag(self, source: Path, signature: tuple) -> str:
+        """Internal: Strong ETag of a file too large for the memory cache"""
+        key = (str(source), "etag")
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(source, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        etag = '"' + digest.hexdigest() + '"'
+        with self._lock:
+            self._cache[key] = (signature, b"", etag)
+        return etag
+
+    def _serve(self, request, path: str, query: dict):
+        """Internal: Loopback route answering asset requests"""
+        try:
+            found = self._find(path, request.headers.get("Accept-Encoding", ""))
+        except ValueError:
+            found = None  # Archive closed while the app quits
+        if found is None:
+            send_error(request, 404, "Not Found")
+            return
+
+        try:
+            self._respond(request, *found)
+        finally:
+            if self._archive is not None:
+                self._archive.release(found[4])
+
+    def _respond(self, request, name, encoding, size, etag, body, source):
+        """Internal: Write the response for a file found by _find()"""
+        if self.immutable.search(name):
+            cache_control = IMMUTABLE
+        else:
+            cache_control = REVALIDATE
+
+        not_modified = etag in request.headers.get("If-None-Match", "")
+        request.send_response(304 if not_modified else 200)
+        request.send_header("ETag", etag)
+        request.send_header("Cache-Control", cache_control)
+        request.send_header("Vary", "Accept-Encoding")
+        if not_modified:
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        request.send_header("Content-Type", content_type(name))
+        if encoding is not None:
+            request.send_header("Content-Encoding", encoding)
+        request.send_header("Content-Length", str(size))
+        request.end_headers()
+        if request.command == "HEAD":
+            return
+        if body is not None:
+            request.wfile.write(body)
+        else:
+            with open(source, "rb") as file:
+                shutil.copyfileobj(file, request.wfile, 1024 * 1024)
@@ -41,12 +41,20 @@ setup(
         "pythonnet>=3.0.5",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8",
+        ],
         "dev": [
             "pytest",
             "black",
             "flake8",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "positron=positron.cli:main",
+        ],
+    },
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,79 @@
+"""
+PriorityThreadPool: queued calls run by priority, aging prevents starvation,
+and shutdown cancels calls that have not started.
+"""
+
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from positron.ipc.executors import (
+    BACKGROUND,
+    INTERACTIVE,
+    NORMAL,
+    PriorityThreadPool,
+)
+
+
+def blocked_pool(aging: float = 60.0):
+    """A one-worker pool whose worker is busy until the returned event is set"""
+    pool = PriorityThreadPool(1, aging=aging)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    pool.submit(block)
+    assert started.wait(5)
+    return pool, release
+
+
+def test_runs_most_urgent_first():
+    pool, release = blocked_pool()
+    order = []
+    futures = [
+        pool.submit_priority(BACKGROUND, order.append, "background"),
+        pool.submit_priority(NORMAL, order.append, "normal"),
+        pool.submit_priority(INTERACTIVE, order.append, "interactive"),
+        pool.submit_priority(INTERACTIVE, order.append, "interactive 2"),
+    ]
+    release.set()
+    for future in futures:
+        future.result(5)
+    pool.shutdown()
+    assert order == ["interactive", "interactive 2", "normal", "background"]
+
+
+def test_aging_promotes_waiting_calls():
+    pool, release = blocked_pool(aging=0.0001)
+    order = []
+    futures = [pool.submit_priority(BACKGROUND, order.append, "background")]
+    threading.Event().wait(0.05)
+    futures.append(pool.submit_priority(INTERACTIVE, order.append, "interactive"))
+    release.set()
+    for future in futures:
+        future.result(5)
+    pool.shutdown()
+    assert order == ["background", "interactive"]
+
+
+def test_results_and_errors_reach_the_future():
+    pool = PriorityThreadPool(2)
+    assert pool.submit(lambda: 42).result(5) == 42
+    with pytest.raises(ZeroDivisionError):
+        pool.submit(lambda: 1 / 0).result(5)
+    pool.shutdown()
+
+
+def test_shutdown_cancels_queued_calls():
+    pool, release = blocked_pool()
+    queued = pool.submit(lambda: "late")
+    pool.shutdown(wait=False, cancel_futures=True)
+    release.set()
+    with pytest.raises(CancelledError):
+        queued.result(5)
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
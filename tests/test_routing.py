@@ -0,0 +1,81 @@
+"""
+RouteTable: exact and wildcard resolution, and lock-free resolve() while
+routes are added and removed.
+"""
+
+import threading
+
+from positron.ipc.routing import RouteTable, is_pattern, join
+
+
+def test_exact_wins_over_pattern():
+    table = RouteTable()
+    table.set("db:*", "pattern")
+    table.set("db:query", "exact")
+    assert table.resolve("db:query") == "exact"
+    assert table.resolve("db:other") == "pattern"
+
+
+def test_literal_segment_wins_over_wildcard():
+    table = RouteTable()
+    table.set("db:*:list", "any")
+    table.set("db:users:list", "users")
+    assert table.resolve("db:users:list") == "users"
+    assert table.resolve("db:posts:list") == "any"
+
+
+def test_trailing_wildcard_matches_remaining_segments():
+    table = RouteTable()
+    table.set("db:*", "db")
+    assert table.resolve("db:query:users") == "db"
+    assert table.resolve("db") is None
+
+
+def test_remove_and_clear():
+    table = RouteTable()
+    table.set("a:*", 1)
+    table.set("b:*", 2)
+    assert table.resolve("a:x") == 1
+    assert table.remove("a:*") == 1
+    assert table.resolve("a:x") is None
+    assert table.resolve("b:x") == 2
+    table.clear()
+    assert table.resolve("b:x") is None
+    assert table.items() == []
+
+
+def test_helpers():
+    assert is_pattern("db:*")
+    assert not is_pattern("db:star*")
+    assert join("db", "query") == "db:query"
+    assert join("", "query") == "query"
+
+
+def test_resolve_during_rebuilds_never_misses():
+    table = RouteTable()
+    table.set("db:*", "db")
+    for i in range(100):
+        table.set(f"p{i}:*", i)
+
+    stop = threading.Event()
+    misses = []
+
+    def resolve():
+        while not stop.is_set():
+            if table.resolve("db:users:list") != "db":
+                misses.append(True)
+
+    readers = [threading.Thread(target=resolve) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        # Each removal of a pattern rebuilds the trie
+        for i in range(100):
+            table.remove(f"p{i}:*")
+            table.set(f"q{i}:*", i)
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert misses == []
@@ -0,0 +1,164 @@
+"""
+WindowPool: windows are only created once the pool is started, claims take
+loaded windows, and every claim is replaced in the background.
+"""
+
+import threading
+import time
+
+import pytest
+
+from positron.main.window_pool import WindowPool
+
+OPTIONS = (True, False, False, (200, 100), "#FFFFFF")
+
+
+class StubWindow:
+    """Headless stand-in for a pooled pywebview window"""
+
+    def __init__(self, loaded: bool = True):
+        self.events = type("Events", (), {})()
+        self.events.loaded = threading.Event()
+        if loaded:
+            self.events.loaded.set()
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class StubFactory:
+    """Creates StubWindows and records them"""
+
+    def __init__(self, loaded: bool = True):
+        self.loaded = loaded
+        self.created = []
+        self.lock = threading.Lock()
+
+    def __call__(self, options):
+        window = StubWindow(self.loaded)
+        with self.lock:
+            self.created.append(window)
+        return window
+
+
+def wait_for(condition, timeout: float = 2.0):
+    """Poll until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+def test_prewarm_waits_for_start():
+    pool = WindowPool()
+    factory = StubFactory()
+    pool.prewarm(OPTIONS, 2, factory)
+    time.sleep(0.05)
+    assert factory.created == []
+    assert pool.claim(OPTIONS) is None
+
+    pool.start()
+    wait_for(lambda: pool.ready(OPTIONS) == 2)
+    assert len(factory.created) == 2
+    pool.close()
+
+
+def test_claim_refills_to_size():
+    pool = WindowPool()
+    factory = StubFactory()
+    pool.prewarm(OPTIONS, 2, factory)
+    pool.start()
+    wait_for(lambda: pool.ready() == 2)
+
+    first = pool.claim(OPTIONS)
+    second = pool.claim(OPTIONS)
+    assert first is not second
+    assert first in factory.created and second in factory.created
+
+    wait_for(lambda: pool.ready(OPTIONS) == 2)
+    assert len(factory.created) == 4
+    pool.close()
+
+
+def test_claim_skips_windows_still_loading():
+    pool = WindowPool()
+    factory = StubFactory(loaded=False)
+    pool.prewarm(OPTIONS, 2, factory)
+    pool.start()
+    wait_for(lambda: len(factory.created) == 2)
+    assert pool.claim(OPTIONS) is None
+
+    factory.created[1].events.loaded.set()
+    assert pool.claim(OPTIONS) is factory.created[1]
+    pool.close()
+
+
+def test_claim_other_options_misses():
+    pool = WindowPool()
+    pool.prewarm(OPTIONS, 1, StubFactory())
+    pool.start()
+    wait_for(lambda: pool.ready() == 1)
+    assert pool.claim((False,) + OPTIONS[1:]) is None
+    pool.close()
+
+
+def test_concurrent_claims_never_share_a_window():
+    pool = WindowPool()
+    factory = StubFactory()
+    pool.prewarm(OPTIONS, 4, factory)
+    pool.start()
+    wait_for(lambda: pool.ready() == 4)
+
+    claimed = []
+    lock = threading.Lock()
+
+    def claim():
+        window = pool.claim(OPTIONS)
+        with lock:
+            claimed.append(window)
+
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    windows = [window for window in claimed if window is not None]
+    assert len(windows) == len(set(map(id, windows))) >= 4
+    pool.close()
+
+
+def test_shrinking_destroys_surplus():
+    pool = WindowPool()
+    factory = StubFactory()
+    pool.prewarm(OPTIONS, 3, factory)
+    pool.start()
+    wait_for(lambda: pool.ready() == 3)
+
+    pool.prewarm(OPTIONS, 1, factory)
+    assert pool.ready(OPTIONS) == 1
+    assert sum(window.destroyed for window in factory.created) == 2
+    pool.close()
+
+
+def test_close_destroys_and_stops_refilling():
+    pool = WindowPool()
+    factory = StubFactory()
+    pool.prewarm(OPTIONS, 2, factory)
+    pool.start()
+    wait_for(lambda: pool.ready() == 2)
+
+    pool.close()
+    assert all(window.destroyed for window in factory.created)
+    pool.prewarm(OPTIONS, 2, factory)
+    pool.start()
+    time.sleep(0.05)
+    assert len(factory.created) == 2
+    assert pool.ready() == 0
+
+
+def test_negative_count_is_rejected():
+    with pytest.raises(ValueError):
+        WindowPool().prewarm(OPTIONS, -1, StubFactory())